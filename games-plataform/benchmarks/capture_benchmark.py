@@ -0,0 +1,114 @@
+"""
+capture_benchmark.py - Mede o custo da gravação contínua na thread do jogo
+
+Simula alguns segundos de jogo a 60 FPS numa tela 1920x1080 com o
+CaptureManager ligado e compara com comprimir o quadro dentro do próprio
+draw (sem buffers nem thread de trabalho). No fim salva o clipe e mede
+quanto tempo o F11 bloqueia a thread do jogo.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.capture_benchmark [--seconds 5]
+"""
+import argparse
+import os
+import tempfile
+import time
+import zlib
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.managers.capture_manager import CaptureManager
+
+SCREEN_SIZE = (1920, 1080)
+FRAME_TIME = 1 / 60
+
+
+def draw_frame(screen, background, frame):
+    """Desenha um quadro que muda a cada frame (fundo + retângulos em movimento)"""
+    screen.blit(background, (0, 0))
+    for i in range(20):
+        x = (frame * 7 + i * 97) % SCREEN_SIZE[0]
+        pygame.draw.rect(screen, (255, 40 * (i % 6), 90), (x, 50 * i, 120, 40))
+
+
+def run(screen, background, seconds, capture_step):
+    """
+    Roda o loop simulado
+    
+    Returns:
+        list: Custo (ms) de capture_step em cada frame
+    """
+    costs = []
+    frame = 0
+    next_frame = time.perf_counter()
+    end = next_frame + seconds
+    while time.perf_counter() < end:
+        draw_frame(screen, background, frame)
+        pygame.display.flip()
+        
+        start = time.perf_counter()
+        capture_step(screen)
+        costs.append((time.perf_counter() - start) * 1000)
+        
+        frame += 1
+        next_frame += FRAME_TIME
+        delay = next_frame - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    return costs
+
+
+def summary(costs):
+    costs = sorted(costs)
+    return (f"média {sum(costs) / len(costs):.3f} ms | p99 {costs[int(len(costs) * 0.99)]:.3f} ms | "
+            f"máx {costs[-1]:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    options = parser.parse_args()
+    
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    background = pygame.image.load("assets/images/menu-complete.PNG").convert()
+    background = pygame.transform.smoothscale(background, SCREEN_SIZE)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        capture = CaptureManager(screen, output_dir=directory)
+        costs = run(screen, background, options.seconds, capture.after_flip)
+        report = capture.timing_report()
+        
+        print(f"{'CaptureManager (buffers + thread)':<36} {summary(costs)}")
+        print(f"{'':<36} {report['captured']} quadros, {report['dropped']} descartados, "
+              f"anel {report['ring_bytes'] / 1048576:.1f} MB")
+        
+        # Mesma cadência, mas escalando e comprimindo dentro do loop
+        interval = capture.frame_interval
+        state = {'next': 0.0}
+        
+        def inline_capture(surface):
+            now = time.perf_counter()
+            if now >= state['next']:
+                state['next'] = max(state['next'] + interval, now)
+                frame = pygame.transform.scale(surface, capture.frame_size)
+                zlib.compress(pygame.image.tobytes(frame, 'RGB'), 1)
+        
+        inline_costs = run(screen, background, options.seconds, inline_capture)
+        print(f"{'compressão no loop principal':<36} {summary(inline_costs)}")
+        
+        # Salva o clipe e continua jogando enquanto a thread grava os arquivos
+        start = time.perf_counter()
+        capture.save_clip()
+        blocked = (time.perf_counter() - start) * 1000
+        writing_costs = run(screen, background, 1.0, capture.after_flip)
+        capture.close()
+        written = time.perf_counter() - start
+        
+        print(f"\nsalvar clipe: {blocked:.2f} ms na thread do jogo, {written:.1f} s até os arquivos ficarem prontos")
+        print(f"{'captura durante a gravação':<36} {summary(writing_costs)}")
+
+
+if __name__ == "__main__":
+    main()
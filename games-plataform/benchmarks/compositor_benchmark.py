@@ -0,0 +1,89 @@
+"""
+compositor_benchmark.py - Compara o draw com camadas em cache (LayerCompositor)
+com o desenho imediato de todas as camadas a cada frame
+
+Mede as cenas reais (menu, seleção, mesa de poker) e uma mesa de cartas
+sintética: 52 cartas paradas e uma sendo arrastada.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.compositor_benchmark
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.managers.asset_manager import AssetManager
+from src.components.compositor import LayerCompositor, LAYER_STATIC, LAYER_SEMI_STATIC, LAYER_DYNAMIC
+
+SCREEN_SIZE = (1920, 1080)
+FRAMES = 300
+
+
+def time_frames(draw):
+    """
+    Returns:
+        float: Milissegundos por frame
+    """
+    draw()  # Aquecimento (monta o cache)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def card_table(screen):
+    """Mesa sintética: feltro, 52 cartas em repouso e uma carta arrastada"""
+    card = pygame.Surface((90, 130), pygame.SRCALPHA)
+    pygame.draw.rect(card, (245, 245, 240), card.get_rect(), border_radius=8)
+    pygame.draw.rect(card, (10, 10, 10), card.get_rect(), 2, border_radius=8)
+    card = card.convert_alpha()
+    positions = [(100 + (i % 13) * 130, 150 + (i // 13) * 200) for i in range(52)]
+    state = {'frame': 0}
+    
+    def draw_felt(surface):
+        surface.fill((15, 70, 40))
+        pygame.draw.ellipse(surface, (25, 110, 60), surface.get_rect().inflate(-100, -100))
+    
+    def draw_cards(surface):
+        surface.blits([(card, position) for position in positions], False)
+    
+    def draw_dragged(surface):
+        state['frame'] += 1
+        surface.blit(card, (400 + state['frame'] % 800, 500))
+    
+    compositor = LayerCompositor(screen)
+    compositor.add_layer('felt', LAYER_STATIC, draw_felt)
+    compositor.add_layer('cards', LAYER_SEMI_STATIC, draw_cards)
+    compositor.add_layer('dragged', LAYER_DYNAMIC, draw_dragged)
+    return compositor
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    assets = AssetManager()
+    
+    from src.scenes.main_menu_scene import MainMenuScene
+    from src.scenes.game_selection_scene import GameSelectionScene
+    from src.scenes.games.poker_game_scene import PokerGameScene
+    
+    cases = []
+    for scene_class in (MainMenuScene, GameSelectionScene, PokerGameScene):
+        scene = scene_class(screen, assets)
+        cases.append((scene_class.__name__, scene.draw, scene.layers.draw_immediate, scene.layers))
+    table = card_table(screen)
+    cases.append(("mesa com 52 cartas + 1 arrastada", table.draw, table.draw_immediate, table))
+    
+    print(f"\n{'cena':<34} {'imediato (ms)':>14} {'em cache (ms)':>14} {'ganho':>7} {'refeitos':>9}")
+    for label, cached, immediate, compositor in cases:
+        immediate_ms = time_frames(immediate)
+        rebuilds = compositor.rebuilds
+        cached_ms = time_frames(cached)
+        print(f"{label:<34} {immediate_ms:14.3f} {cached_ms:14.3f} {immediate_ms / cached_ms:6.1f}x "
+              f"{compositor.rebuilds - rebuilds:9d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+paciencia_benchmark.py - Memória e tempo do histórico de desfazer da paciência
+
+Joga partidas com jogadas aleatórias (semente fixa) e compara o History de
+estados imutáveis compartilhados com um histórico de cópias completas da mesa
+(listas copiadas a cada jogada, como seria com um estado mutável). Também mede
+desfazer/refazer e a busca de dicas.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.paciencia_benchmark [--moves 20000]
+"""
+import argparse
+import copy
+import gc
+import random
+import time
+import tracemalloc
+from src.paciencia.state import deal, History, DRAW_MOVE
+from src.paciencia.solver import find_hint, HintSearch
+
+
+def random_games(total, seed=7, game_length=400):
+    """
+    Partidas jogadas ao acaso (nova partida a cada game_length jogadas ou quando trava)
+    
+    Returns:
+        list: (estado inicial, lista de Move) por partida
+    """
+    rng = random.Random(seed)
+    games = []
+    played = 0
+    while played < total:
+        initial = state = deal(rng.random())
+        moves = []
+        while played < total and len(moves) < game_length:
+            legal = state.legal_moves()
+            if not legal:
+                break
+            # Prefere jogadas na mesa; comprar só às vezes
+            table_moves = [move for move in legal if move != DRAW_MOVE]
+            move = rng.choice(table_moves) if table_moves and rng.random() < 0.6 else legal[-1]
+            state = state.apply(move)
+            moves.append(move)
+            played += 1
+        games.append((initial, moves))
+    return games
+
+
+def measure(build):
+    """
+    Returns:
+        tuple: (resultado, MB alocados que continuam vivos, segundos)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / 1048576, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--moves", type=int, default=20000)
+    options = parser.parse_args()
+    
+    games = random_games(options.moves)
+    total = sum(len(moves) for _, moves in games)
+    print(f"\n{total} jogadas em {len(games)} partidas")
+    
+    def persistent_history():
+        histories = []
+        for initial, moves in games:
+            history = History(initial)
+            for move in moves:
+                history.push(history.current.apply(move))
+            histories.append(history)
+        return histories
+    
+    def snapshot_history():
+        # Estado mutável: cada jogada guarda uma cópia completa das pilhas
+        histories = []
+        for initial, moves in games:
+            state = initial
+            snapshots = [copy.deepcopy(state.to_dict())]
+            for move in moves:
+                state = state.apply(move)
+                snapshots.append(copy.deepcopy(state.to_dict()))
+            histories.append(snapshots)
+        return histories
+    
+    histories, persistent_mb, persistent_s = measure(persistent_history)
+    _, snapshot_mb, snapshot_s = measure(snapshot_history)
+    print(f"{'estados compartilhados (History)':<34} {persistent_mb:7.2f} MB  "
+          f"{persistent_mb * 1048576 / total:6.0f} bytes/jogada  ({persistent_s * 1e6 / total:5.1f} µs/jogada)")
+    print(f"{'cópia completa por jogada':<34} {snapshot_mb:7.2f} MB  "
+          f"{snapshot_mb * 1048576 / total:6.0f} bytes/jogada  ({snapshot_s * 1e6 / total:5.1f} µs/jogada)")
+    
+    # Desfazer/refazer: só move o índice
+    history = max(histories, key=lambda h: len(h.states))
+    steps = len(history.states) - 1
+    start = time.perf_counter()
+    for _ in range(100):
+        while history.can_undo():
+            history.undo()
+        while history.can_redo():
+            history.redo()
+    elapsed = time.perf_counter() - start
+    print(f"desfazer/refazer: {elapsed * 1e6 / (200 * steps):.2f} µs por passo ({steps} passos)")
+    
+    # As partidas acima somam milhões de objetos que o jogo nunca guarda:
+    # congela-os para que a coleta de lixo não os varra durante as medidas
+    gc.collect()
+    gc.freeze()
+    find_hint(histories[-1].current)  # Aquecimento: a primeira busca depois de montar as partidas é mais lenta
+    
+    # Dicas sobre os mesmos objetos de estado
+    costs = []
+    for history in histories[:20]:
+        start = time.perf_counter()
+        find_hint(history.states[len(history.states) // 2])
+        costs.append((time.perf_counter() - start) * 1000)
+    costs.sort()
+    print(f"dica: média {sum(costs) / len(costs):.1f} ms, máx {costs[-1]:.1f} ms")
+    
+    # Dica como a cena faz: um passo de busca por frame
+    step_costs = []
+    frames = []
+    for history in histories[:20]:
+        search = HintSearch(history.states[len(history.states) // 2])
+        count = 0
+        done = False
+        while not done:
+            start = time.perf_counter()
+            done = search.step()
+            step_costs.append((time.perf_counter() - start) * 1000)
+            count += 1
+        frames.append(count)
+    print(f"dica por frame: máx {max(step_costs):.1f} ms por frame, até {max(frames)} frames")
+
+
+if __name__ == "__main__":
+    main()
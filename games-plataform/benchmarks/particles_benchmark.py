@@ -0,0 +1,79 @@
+"""
+particles_benchmark.py - Mede quantas partículas cabem em um frame de 60 FPS
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.particles_benchmark
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.particles import ParticleSystem
+from src.utils.constants import PARTICLE_EMITTER_CAPACITY
+
+FRAME_BUDGET_MS = 1000 / 60
+SCREEN_SIZE = (1920, 1080)
+PARTICLE_COUNTS = [500, 1000, 2000, 4000, 8000, 16000, 32000]
+FRAMES_PER_STEP = 120
+
+
+def measure(screen, preset_name, particle_count):
+    """
+    Mantém o sistema cheio e mede o tempo médio de update + draw
+    
+    O pool tem um emissor por reposição: um emissor só volta ao pool quando
+    todas as suas partículas morrem, e os efeitos mais longos vivem mais que
+    FRAMES_PER_STEP frames.
+    
+    Returns:
+        tuple: (tempo médio por frame em ms, média de partículas vivas medidas)
+    """
+    emitters = -(-particle_count // PARTICLE_EMITTER_CAPACITY)
+    system = ParticleSystem(max_particles=particle_count, pool_size=emitters * (FRAMES_PER_STEP + 1), seed=1)
+    center = (SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2)
+    dt = 1 / 60
+    
+    total = 0.0
+    live = 0
+    for frame in range(FRAMES_PER_STEP):
+        # Repõe as partículas que morreram para manter a carga constante
+        missing = particle_count - system.particle_count
+        if missing > 0:
+            system.emit(preset_name, *center, count=missing)
+        live += system.particle_count
+        
+        screen.fill((0, 0, 0))
+        start = time.perf_counter()
+        system.update(dt)
+        system.draw(screen)
+        total += time.perf_counter() - start
+    
+    return total / FRAMES_PER_STEP * 1000, live / FRAMES_PER_STEP
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    
+    print(f"Orçamento por frame: {FRAME_BUDGET_MS:.2f} ms\n")
+    for preset_name in ('sparkle', 'chip_burst', 'card_cascade'):
+        print(f"{preset_name}")
+        print(f"  {'alvo':>10}  {'vivas':>10}  {'ms/frame':>9}  {'cabe em 60 FPS':>14}")
+        
+        best = 0
+        for count in PARTICLE_COUNTS:
+            elapsed, live = measure(screen, preset_name, count)
+            fits = elapsed <= FRAME_BUDGET_MS
+            if fits:
+                best = max(best, int(live))
+            print(f"  {count:>10}  {live:>10.0f}  {elapsed:>9.2f}  {'sim' if fits else 'não':>14}")
+        
+        print(f"  → {best} partículas vivas por frame a 60 FPS\n")
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
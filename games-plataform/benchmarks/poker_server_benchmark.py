@@ -0,0 +1,122 @@
+"""
+poker_server_benchmark.py - Carga do servidor de mesas de poker
+
+Cria N mesas de 6 lugares: o assento 0 de cada mesa é controlado por um
+cliente (em processo ou pelo socket local) e os demais são bots. Mede mãos
+por segundo e a latência entre o servidor pedir a ação do cliente e
+confirmar essa ação (ida e volta pelo transporte).
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.poker_server_benchmark
+    python -m benchmarks.poker_server_benchmark --socket
+"""
+import asyncio
+import sys
+import time
+from src.poker.client import SocketClient
+from src.poker.protocol import MSG_JOIN, MSG_ACT, MSG_EVENT
+from src.poker.server import TableServer
+from src.poker.table import EV_TURN, EV_ACTION, CHECK, CALL
+
+TABLE_COUNTS = [10, 50, 100, 200, 400]
+DURATION = 3.0
+CLIENT_SEAT = 0
+
+
+class BenchmarkPlayer:
+    """Joga o assento do cliente sempre pagando/dando check e mede a latência"""
+    
+    def __init__(self, send, latencies):
+        self.send = send
+        self.latencies = latencies
+        self.turn_started = None
+    
+    def on_message(self, message):
+        if message[0] != MSG_EVENT:
+            return
+        table_id, code = message[1], message[2]
+        if code == EV_TURN and message[3] == CLIENT_SEAT:
+            to_call = message[4]
+            self.turn_started = time.perf_counter()
+            self.send([MSG_ACT, table_id, CLIENT_SEAT, CALL if to_call else CHECK, 0])
+        elif code == EV_ACTION and message[3] == CLIENT_SEAT and self.turn_started is not None:
+            self.latencies.append(time.perf_counter() - self.turn_started)
+            self.turn_started = None
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_load(table_count, use_socket):
+    """
+    Roda table_count mesas por DURATION segundos
+    
+    Returns:
+        tuple: (mãos por segundo, lista de latências em segundos)
+    """
+    loop = asyncio.get_running_loop()
+    server = TableServer()
+    latencies = []
+    readers = []
+    clients = []
+    tcp_server = None
+    
+    if use_socket:
+        tcp_server = await server.serve()
+        port = tcp_server.sockets[0].getsockname()[1]
+    
+    for index in range(table_count):
+        table_id = server.create_table(seats=6, human_seats=(CLIENT_SEAT,), seed=index)
+        
+        if use_socket:
+            client = await SocketClient.open(port=port)
+            clients.append(client)
+            player = BenchmarkPlayer(client.send, latencies)
+            
+            async def read_loop(client=client, player=player):
+                while (message := await client.receive()) is not None:
+                    player.on_message(message)
+            
+            readers.append(asyncio.create_task(read_loop()))
+            client.send([MSG_JOIN, table_id, [CLIENT_SEAT]])
+        else:
+            # Entrega assíncrona: simula o salto de transporte sem serializar
+            holder = {}
+            connection = server.connect(lambda message: loop.call_soon(holder['player'].on_message, message))
+            holder['player'] = BenchmarkPlayer(lambda message: server.handle_message(connection, message), latencies)
+            server.handle_message(connection, [MSG_JOIN, table_id, [CLIENT_SEAT]])
+    
+    start_hands = sum(runner.hands_played for runner in server.tables.values())
+    await asyncio.sleep(DURATION)
+    hands = sum(runner.hands_played for runner in server.tables.values()) - start_hands
+    
+    for table_id in list(server.tables):
+        await server.close_table(table_id)
+    for client in clients:
+        await client.close()
+    await asyncio.gather(*readers, return_exceptions=True)
+    if tcp_server:
+        tcp_server.close()
+        await tcp_server.wait_closed()
+    
+    return hands / DURATION, latencies
+
+
+def main():
+    use_socket = "--socket" in sys.argv
+    print(f"Transporte: {'socket local' if use_socket else 'em processo'} | {DURATION:.0f} s por carga\n")
+    print(f"{'mesas':>6} {'mãos/s':>9} {'ações':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9}")
+    
+    for table_count in TABLE_COUNTS:
+        hands_per_second, latencies = asyncio.run(run_load(table_count, use_socket))
+        if latencies:
+            p50, p95, p99 = (percentile(latencies, f) * 1000 for f in (0.50, 0.95, 0.99))
+        else:
+            p50 = p95 = p99 = float("nan")
+        print(f"{table_count:>6} {hands_per_second:>9.0f} {len(latencies):>8} {p50:>9.2f} {p95:>9.2f} {p99:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
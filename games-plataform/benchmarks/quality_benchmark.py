@@ -0,0 +1,173 @@
+"""
+quality_benchmark.py - Custo de cada ajuste de qualidade e estabilidade do governador
+
+1) Mede, com o driver de vídeo dummy, quanto cada item de QUALITY_TIERS custa
+   por frame: composição da transição, partículas e smoothscale vs scale.
+2) Alimenta o QualityManager com tempos de frame simulados de uma máquina
+   lenta (custo de cada nível + ruído + picos, com fases de carga) e compara
+   com o nível fixo em 'alta' e com um governador ingênuo sem hysteresis.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.quality_benchmark [--frames 36000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from src.components.particles import ParticleSystem
+from src.managers.quality_manager import QualityManager, QUALITY_TIERS
+from src.utils.constants import QUALITY_FRAME_BUDGET_MS, QUALITY_WINDOW
+
+
+def time_ms(action, repeat=200):
+    """Tempo médio (ms) de uma chamada"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        action()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def knob_costs():
+    """Custo por frame de cada ajuste no display dummy"""
+    screen = pygame.display.set_mode((1920, 1080))
+    outgoing = screen.copy()
+    incoming = screen.copy()
+    outgoing.fill((40, 80, 120))
+    incoming.fill((200, 120, 40))
+    
+    def fade():
+        screen.blit(outgoing, (0, 0))
+        incoming.set_alpha(128)
+        screen.blit(incoming, (0, 0))
+    
+    def cheap():
+        screen.blit(incoming, (0, 0))
+    
+    print("\nTransição (por frame, 1920x1080)")
+    print(f"  {'full (fade)':<22} {time_ms(fade):6.2f} ms")
+    print(f"  {'cheap (troca seca)':<22} {time_ms(cheap):6.2f} ms")
+    print(f"  {'off':<22} {0.0:6.2f} ms")
+    
+    print("\nPartículas (600 vivas no máximo, brilho do carrossel a cada 4 frames)")
+    for tier in reversed(QUALITY_TIERS):
+        system = ParticleSystem(max_particles=600, pool_size=8, seed=1)
+        system.density = tier['particles']
+        
+        def frame(state={'n': 0}):
+            state['n'] += 1
+            if state['n'] % 4 == 0:
+                system.emit('sparkle', 960, 540, count=150)
+            system.update(1 / 60)
+            system.draw(screen)
+        
+        time_ms(frame, 120)  # Enche o sistema antes de medir
+        print(f"  {tier['name']:<22} {time_ms(frame, 300):6.2f} ms  ({system.particle_count} vivas)")
+    
+    source = pygame.Surface((1600, 1600)).convert()
+    source.fill((90, 160, 30))
+    print("\nCópia escalonada 1600² → 400² (uma vez por cópia em cache)")
+    print(f"  {'smoothscale':<22} {time_ms(lambda: pygame.transform.smoothscale(source, (400, 400)), 50):6.2f} ms")
+    print(f"  {'scale':<22} {time_ms(lambda: pygame.transform.scale(source, (400, 400)), 50):6.2f} ms")
+
+
+def simulated_frames(total, seed=3):
+    """
+    Custo de frame de uma máquina lenta em função do nível
+    
+    Returns:
+        function: (frame, nível) -> ms
+    """
+    rng = random.Random(seed)
+    # Custo base de cada nível (mínima → alta) numa placa fraca
+    base = [7.0, 9.5, 12.5, 19.0]
+    
+    def cost(frame, tier):
+        # Fases: menu leve, partida pesada, menu leve, pico longo
+        phase = frame * 4 // total
+        load = (0.6, 1.0, 0.6, 1.25)[phase]
+        spike = 25.0 if rng.random() < 0.01 else 0.0  # GC, carregamento de arte
+        return max(1.0, base[tier] * load + rng.gauss(0, 1.2) + spike)
+    
+    return cost
+
+
+def run_governor(total, cost, governor):
+    """
+    Returns:
+        tuple: (% frames acima do orçamento, trocas, frames em cada nível)
+    """
+    over = 0
+    per_tier = [0] * len(QUALITY_TIERS)
+    for frame in range(total):
+        frame_ms = cost(frame, governor.tier)
+        over += frame_ms > QUALITY_FRAME_BUDGET_MS
+        per_tier[governor.tier] += 1
+        governor.record(frame_ms)
+    return over * 100 / total, len(governor.decisions), per_tier
+
+
+class NaiveGovernor:
+    """Média dos últimos frames, limite único e sem espera para subir"""
+    
+    def __init__(self):
+        self.tier = len(QUALITY_TIERS) - 1
+        self.frame_times = []
+        self.decisions = []
+    
+    def record(self, frame_ms):
+        self.frame_times = (self.frame_times + [frame_ms])[-30:]
+        if len(self.frame_times) < 30:
+            return
+        average = sum(self.frame_times) / len(self.frame_times)
+        if average > QUALITY_FRAME_BUDGET_MS * 0.75 and self.tier > 0:
+            self.tier -= 1
+        elif average < QUALITY_FRAME_BUDGET_MS * 0.75 and self.tier < len(QUALITY_TIERS) - 1:
+            self.tier += 1
+        else:
+            return
+        self.decisions.append(self.tier)
+        self.frame_times = []
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frames", type=int, default=36000)
+    options = parser.parse_args()
+    
+    pygame.display.init()
+    knob_costs()
+    
+    total = options.frames
+    print(f"\nMáquina simulada: {total} frames ({total / 3600:.0f} min a 60 FPS), janela de {QUALITY_WINDOW}")
+    
+    class Fixed:
+        tier = len(QUALITY_TIERS) - 1
+        decisions = []
+        
+        def record(self, frame_ms):
+            pass
+    
+    # O governador imprime cada decisão; aqui só interessa o resumo
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = [
+            ("fixo em alta", run_governor(total, simulated_frames(total), Fixed())),
+            ("ingênuo (sem hysteresis)", run_governor(total, simulated_frames(total), NaiveGovernor())),
+            ("QualityManager", run_governor(total, simulated_frames(total), QualityManager())),
+        ]
+    
+    names = " ".join(f"{tier['name']:>7}" for tier in QUALITY_TIERS)
+    print(f"  {'':<26} {'> orçamento':>11} {'trocas':>7}   {names}")
+    for label, (over, changes, per_tier) in results:
+        shares = " ".join(f"{count * 100 / total:6.1f}%" for count in per_tier)
+        print(f"  {label:<26} {over:10.1f}% {changes:7d}   {shares}")
+
+
+if __name__ == "__main__":
+    main()
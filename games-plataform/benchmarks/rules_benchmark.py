@@ -0,0 +1,96 @@
+"""
+rules_benchmark.py - Mede a tela de regras: layout único e custo por frame da rolagem
+
+Compara o TextView (bisect + blit só das linhas visíveis) com renderizar o
+texto a cada frame e com copiar todas as linhas em cache deixando o clip
+descartar as invisíveis. Usa as regras reais e um texto grande (todas as
+regras repetidas) para mostrar que o custo por frame não cresce com o texto.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.rules_benchmark
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from src.components.text_view import TextView, wrap_words
+from src.scenes.rules_scene import RULES_GAMES, TEXT_COLOR, HEADING_COLOR
+
+SCREEN_SIZE = (1920, 1080)
+VIEW_RECT = (290, 300, 1340, 670)
+FRAMES = 300
+SCROLL_PER_FRAME = 15
+
+
+def time_frames(draw, view):
+    """
+    Rola o texto de cima a baixo (voltando ao topo no fim) desenhando cada frame
+    
+    Returns:
+        float: Milissegundos por frame
+    """
+    max_scroll = max(1, view.max_scroll())
+    start = time.perf_counter()
+    for frame in range(FRAMES):
+        view.scroll = (frame * SCROLL_PER_FRAME) % max_scroll
+        draw()
+    return (time.perf_counter() - start) / FRAMES * 1000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    fonts = {'heading': pygame.font.Font(None, 48), 'body': pygame.font.Font(None, 34)}
+    colors = {'heading': HEADING_COLOR, 'body': TEXT_COLOR}
+    
+    texts = []
+    for key, _ in RULES_GAMES:
+        with open(f"assets/rules/{key}.txt", encoding="utf-8") as f:
+            texts.append(f.read())
+    cases = [("poker", texts[0]), ("todas as regras x 25", "\n\n".join(texts) * 25)]
+    
+    print(f"\n{'texto':<22} {'linhas':>7} {'layout (ms)':>12} {'TextView':>10} {'tudo em cache':>14} "
+          f"{'render/frame':>13}  (ms por frame)")
+    for label, text in cases:
+        view = TextView(VIEW_RECT, fonts, colors)
+        start = time.perf_counter()
+        view.set_text(label, text)
+        layout_ms = (time.perf_counter() - start) * 1000
+        layout = view.layout
+        
+        def draw_view():
+            screen.fill((40, 25, 80), view.rect)
+            view.draw(screen)
+        
+        def draw_all_cached():
+            # Sem virtualização: blit de todas as linhas, o clip descarta as de fora
+            screen.fill((40, 25, 80), view.rect)
+            screen.set_clip(view.rect)
+            top = view.rect.y - int(view.scroll)
+            screen.blits([(surface, (view.rect.x + x, top + y))
+                          for (x, surface), y in zip(layout.lines, layout.tops)], False)
+            screen.set_clip(None)
+        
+        def draw_rendered():
+            # Sem cache: quebra e renderiza o texto a cada frame (só até sair da área)
+            screen.fill((40, 25, 80), view.rect)
+            y = view.rect.y - int(view.scroll)
+            for paragraph in text.splitlines():
+                for line in wrap_words(fonts['body'], paragraph.lstrip("#- "), view.text_width):
+                    if y > view.rect.bottom:
+                        return
+                    if y > view.rect.y - 60:
+                        screen.blit(fonts['body'].render(line, True, TEXT_COLOR), (view.rect.x, y))
+                    y += fonts['body'].get_linesize()
+        
+        view_ms = time_frames(draw_view, view)
+        all_ms = time_frames(draw_all_cached, view)
+        rendered_ms = time_frames(draw_rendered, view)
+        print(f"{label:<22} {len(layout.lines):7d} {layout_ms:12.1f} {view_ms:10.3f} {all_ms:14.3f} "
+              f"{rendered_ms:13.3f}")
+
+
+if __name__ == "__main__":
+    main()
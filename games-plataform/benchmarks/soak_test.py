@@ -0,0 +1,377 @@
+"""
+soak_test.py - Teste de resistência: ciclos de cena sem parar procurando vazamentos
+
+Roda o jogo completo com o driver de vídeo dummy e repete o que um gabinete
+faz o dia todo: menu → seleção → passos do carrossel → jogo → seleção →
+menu, passando pelas regras a cada dois ciclos. As trocas usam
+SceneManager.change_scene e o mesmo next_scene que os botões definem.
+
+Os frames rodam sem a espera do clock.tick, com passo de tempo fixo, e
+cada etapa dura só os frames necessários para a transição ou animação
+terminar. Um ciclo equivale a CABINET_SECONDS_PER_CYCLE de uso real, então
+um dia de gabinete cabe em poucos minutos.
+
+A cada amostra registra RSS, superfícies vivas (as do AssetManager e todas
+as alcançáveis pelo coletor de lixo), threads e percentis do tempo de frame.
+No fim compara o início (depois do aquecimento) com o fim e sai com código 1
+se memória, superfícies, threads ou latência cresceram além dos limites.
+
+Tudo que o jogo grava (estatísticas, partida da paciência, nível de
+qualidade) vai para uma pasta temporária: os arquivos reais não mudam.
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.soak_test [--cabinet-hours 24] [--iterations N] [--minutes M]
+"""
+import argparse
+import contextlib
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# A pasta de trabalho muda para a temporária: as cenas importadas sob demanda
+# precisam achar o pacote src pelo caminho absoluto
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pygame
+from src.utils.constants import SceneType, CAROUSEL_SLIDE_DURATION, CLIP_SECONDS
+
+CABINET_SECONDS_PER_CYCLE = 60  # Uso real que um ciclo representa (atração + uma partida curta)
+CAROUSEL_STEPS = 3  # Passos do carrossel por ciclo (o jogo escolhido muda a cada ciclo)
+GAME_FRAMES = 45  # Frames dentro de cada jogo
+SETTLE_LIMIT = 600  # Frames máximos esperando uma transição terminar
+SAMPLE_WINDOW = 3  # Amostras usadas para o início e o fim na comparação
+
+# Teclas enviadas durante a partida (uma a cada poucos frames)
+GAME_KEYS = {
+    SceneType.PACIENCIA_GAME: [pygame.K_h, pygame.K_z, pygame.K_y, pygame.K_n],
+    SceneType.POKER_GAME: [pygame.K_c, pygame.K_c, pygame.K_r, pygame.K_f],
+}
+RULES_KEYS = [pygame.K_PAGEDOWN, pygame.K_END, pygame.K_RIGHT, pygame.K_HOME, pygame.K_RIGHT]
+
+
+def key_event(key):
+    """KEYDOWN sintético"""
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+
+
+def reachable_surfaces():
+    """
+    Superfícies referenciadas por qualquer objeto Python rastreado
+    
+    Surface não é rastreada pelo coletor, mas quem a guarda (dicts, listas,
+    atributos de objetos) é: isso inclui as que o AssetManager não conhece,
+    como quadros de hover dos botões e caches de texto.
+    """
+    found = set()
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface):
+                found.add(id(ref))
+    return len(found)
+
+
+def rss_mb():
+    """
+    Memória residente do processo em MB (só biblioteca padrão)
+    
+    Lê /proc/self/statm (Linux, como nos gabinetes). Em outros sistemas usa
+    o pico de resource.getrusage, que só sobe: ainda acusa crescimento.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1048576
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss vem em KB no Linux e em bytes no macOS
+        return peak / 1048576 if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values, percent):
+    """Percentil de uma lista (0 se vazia)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def median(values):
+    return percentile(values, 50)
+
+
+class SoakRunner:
+    """Dirige o Game frame a frame sem a espera do clock"""
+    
+    def __init__(self, game, dt):
+        """
+        Args:
+            game: Instância do Game (já com a tela de loading mostrada)
+            dt: Passo de tempo fixo em segundos
+        """
+        self.game = game
+        self.scenes = game.scene_manager
+        self.dt = dt
+        self.frame_times = []  # ms desde a última amostra
+        self.frames = 0
+        self.cycles = 0
+    
+    def frame(self, events=()):
+        """Um frame completo: eventos, update, draw, flip e captura"""
+        start = time.perf_counter()
+        pygame.event.get()
+        self.scenes.handle_events(list(events))
+        self.scenes.update(self.dt)
+        self.game.draw()
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        self.game.quality.record(elapsed)
+        self.frame_times.append(elapsed)
+        self.frames += 1
+    
+    def run_frames(self, count):
+        for _ in range(count):
+            self.frame()
+    
+    def settle(self):
+        """Roda frames até a troca de cena pendente terminar"""
+        for _ in range(SETTLE_LIMIT):
+            self.frame()
+            scenes = self.scenes
+            if not (scenes.is_loading or scenes.is_transitioning or scenes.current_scene.next_scene):
+                return
+        raise RuntimeError(f"Transição não terminou em {SETTLE_LIMIT} frames")
+    
+    def go(self, scene_type):
+        """Troca de cena pelo mesmo caminho de um clique (next_scene)"""
+        self.scenes.current_scene.next_scene = scene_type
+        self.settle()
+        if self.scenes.current_scene is not self.scenes.scenes[scene_type]:
+            raise RuntimeError(f"Esperava {scene_type.value}, está em {type(self.scenes.current_scene).__name__}")
+    
+    def cycle(self):
+        """Um ciclo de uso do gabinete"""
+        scenes = self.scenes
+        scenes.change_scene(SceneType.GAME_SELECTION)
+        self.settle()
+        
+        # Carrossel: o jogo escolhido anda um passo a cada ciclo
+        selection = scenes.current_scene
+        slide_frames = int(CAROUSEL_SLIDE_DURATION / self.dt) + 1
+        for step in range(CAROUSEL_STEPS):
+            if step % 2 == 0:
+                selection.next_game()
+            else:
+                selection.previous_game()
+            self.run_frames(slide_frames)
+        selection.next_game()
+        self.run_frames(slide_frames)
+        
+        # Entra no jogo, manda algumas teclas e volta (como o botão de voltar)
+        game_scene = selection.games_data[selection.current_game_index]['scene']
+        self.go(game_scene)
+        keys = GAME_KEYS.get(game_scene, [])
+        for index in range(GAME_FRAMES):
+            events = [key_event(keys[index // 10 % len(keys)])] if keys and index % 10 == 0 else []
+            self.frame(events)
+        self.go(SceneType.GAME_SELECTION)
+        self.go(SceneType.MAIN_MENU)
+        
+        if self.cycles % 2 == 0:
+            scenes.change_scene(SceneType.RULES)
+            self.settle()
+            for key in RULES_KEYS:
+                self.frame([key_event(key)])
+                self.run_frames(8)
+            self.go(SceneType.MAIN_MENU)
+        
+        self.cycles += 1
+    
+    def sample(self, started):
+        """
+        Mede o processo agora e zera os tempos de frame
+        
+        Returns:
+            dict: Amostra
+        """
+        gc.collect()
+        sample = {
+            'cycle': self.cycles,
+            'cabinet_hours': self.cycles * CABINET_SECONDS_PER_CYCLE / 3600,
+            'elapsed': time.perf_counter() - started,
+            'rss_mb': rss_mb(),
+            'tracked_surfaces': self.game.assets.memory_report()['surface_count'],
+            'surfaces': reachable_surfaces(),
+            'threads': threading.active_count(),
+            'p50': percentile(self.frame_times, 50),
+            'p95': percentile(self.frame_times, 95),
+            'p99': percentile(self.frame_times, 99),
+            'quality': self.game.quality.name,
+        }
+        self.frame_times = []
+        return sample
+
+
+def evaluate(samples, options):
+    """
+    Compara o início com o fim do teste
+    
+    Returns:
+        list: Falhas encontradas (vazia se passou)
+    """
+    if len(samples) < 2 * SAMPLE_WINDOW:
+        return [f"Poucas amostras ({len(samples)}) para comparar; aumente a duração"]
+    
+    first = samples[:SAMPLE_WINDOW]
+    last = samples[-SAMPLE_WINDOW:]
+    
+    def growth(key):
+        return median([s[key] for s in last]) - median([s[key] for s in first])
+    
+    failures = []
+    if growth('rss_mb') > options.max_rss_growth:
+        failures.append(f"RSS cresceu {growth('rss_mb'):.1f} MB (limite {options.max_rss_growth} MB)")
+    for key, label in (('surfaces', "Superfícies alcançáveis"), ('tracked_surfaces', "Superfícies do AssetManager")):
+        if growth(key) > options.max_surface_growth:
+            failures.append(f"{label} cresceram {growth(key):.0f} (limite {options.max_surface_growth})")
+    if growth('threads') > options.max_thread_growth:
+        failures.append(f"Threads cresceram {growth('threads'):.0f} (limite {options.max_thread_growth})")
+    
+    start_p95 = median([s['p95'] for s in first])
+    end_p95 = median([s['p95'] for s in last])
+    if end_p95 > start_p95 * options.max_latency_ratio and end_p95 - start_p95 > options.min_latency_growth:
+        failures.append(f"p95 do frame foi de {start_p95:.1f} para {end_p95:.1f} ms "
+                        f"(limite {options.max_latency_ratio}x e +{options.min_latency_growth} ms)")
+    return failures
+
+
+def rss_trend(samples):
+    """
+    Inclinação (mínimos quadrados) do RSS por dia de gabinete
+    
+    Returns:
+        float: MB por 24 h simuladas (0 com menos de duas amostras)
+    """
+    if len(samples) < 2:
+        return 0.0
+    hours = [s['cabinet_hours'] for s in samples]
+    rss = [s['rss_mb'] for s in samples]
+    mean_h = sum(hours) / len(hours)
+    mean_rss = sum(rss) / len(rss)
+    spread = sum((h - mean_h) ** 2 for h in hours)
+    if not spread:
+        return 0.0
+    return sum((h - mean_h) * (r - mean_rss) for h, r in zip(hours, rss)) / spread * 24
+
+
+def print_report(samples, failures, runner, elapsed):
+    print(f"\n{'ciclo':>6} {'gabinete':>9} {'real':>7} {'RSS MB':>8} {'superf.':>8} {'assets':>7} "
+          f"{'threads':>7} {'p50':>6} {'p95':>6} {'p99':>6}  qualidade")
+    for s in samples:
+        print(f"{s['cycle']:6d} {s['cabinet_hours']:8.1f}h {s['elapsed']:6.0f}s {s['rss_mb']:8.1f} "
+              f"{s['surfaces']:8d} {s['tracked_surfaces']:7d} {s['threads']:7d} "
+              f"{s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f}  {s['quality']}")
+    
+    cabinet_hours = runner.cycles * CABINET_SECONDS_PER_CYCLE / 3600
+    print(f"\n{runner.cycles} ciclos, {runner.frames} frames: {cabinet_hours:.1f} h de gabinete "
+          f"em {elapsed / 60:.1f} min ({cabinet_hours * 3600 / max(elapsed, 1e-9):.0f}x)")
+    print(f"Tendência do RSS: {rss_trend(samples):+.1f} MB por dia de gabinete")
+    if failures:
+        print("✗ Deriva detectada:")
+        for failure in failures:
+            print(f"   {failure}")
+    else:
+        print("✓ Sem deriva de memória, superfícies, threads ou latência")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de resistência headless")
+    parser.add_argument("--cabinet-hours", type=float, default=24,
+                        help="Horas de uso do gabinete a simular (padrão 24)")
+    parser.add_argument("--iterations", type=int, help="Número de ciclos (tem prioridade sobre --cabinet-hours)")
+    parser.add_argument("--minutes", type=float, help="Tempo real máximo; para antes se acabar")
+    parser.add_argument("--samples", type=int, default=24, help="Quantidade de amostras ao longo do teste")
+    parser.add_argument("--warmup", type=int, default=8, help="Ciclos antes da primeira amostra")
+    parser.add_argument("--dt", type=float, default=1 / 30, help="Passo de tempo de cada frame (s)")
+    parser.add_argument("--max-rss-growth", type=float, default=32.0, help="MB")
+    parser.add_argument("--max-surface-growth", type=int, default=16)
+    parser.add_argument("--max-thread-growth", type=int, default=1)
+    parser.add_argument("--max-latency-ratio", type=float, default=1.5)
+    parser.add_argument("--min-latency-growth", type=float, default=2.0, help="ms")
+    parser.add_argument("--keep", action="store_true", help="Mantém a pasta temporária (log do jogo incluso)")
+    options = parser.parse_args()
+    
+    cycles = options.iterations or max(1, round(options.cabinet_hours * 3600 / CABINET_SECONDS_PER_CYCLE))
+    sample_every = max(1, cycles // options.samples)
+    deadline = time.perf_counter() + options.minutes * 60 if options.minutes else None
+    
+    # Pasta de trabalho temporária com os assets e a configuração reais
+    workdir = Path(tempfile.mkdtemp(prefix="soak-"))
+    (workdir / "assets").symlink_to(ROOT / "assets", target_is_directory=True)
+    if (ROOT / "config" / "settings.json").exists():
+        (workdir / "config").mkdir()
+        shutil.copy(ROOT / "config" / "settings.json", workdir / "config" / "settings.json")
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)
+    
+    print(f"🧪 Soak: {options.warmup} ciclos de aquecimento + {cycles} ciclos, amostra a cada {sample_every}")
+    print(f"   pasta de trabalho: {workdir}")
+    
+    from src.game import Game
+    
+    samples = []
+    started = time.perf_counter()
+    log = open(workdir / "game.log", "w", encoding="utf-8")
+    try:
+        # O jogo imprime cada troca de cena: vai para o log, não para o terminal
+        with contextlib.redirect_stdout(log):
+            game = Game()
+            runner = SoakRunner(game, options.dt)
+            runner.frame()  # Primeiro frame do menu: termina a inicialização
+            
+            # Aquecimento: todas as cenas criadas e o anel de clipes (medido em
+            # tempo real) cheio, senão o crescimento esperado parece vazamento
+            while runner.cycles < options.warmup or time.perf_counter() - started < CLIP_SECONDS:
+                runner.cycle()
+            runner.cycles = 0
+            runner.frame_times = []
+            
+            with contextlib.redirect_stdout(sys.__stdout__):
+                print("   aquecimento concluído")
+            
+            while runner.cycles < cycles:
+                runner.cycle()
+                if runner.cycles % sample_every == 0 or runner.cycles == cycles:
+                    sample = runner.sample(started)
+                    samples.append(sample)
+                    with contextlib.redirect_stdout(sys.__stdout__):
+                        print(f"   ciclo {sample['cycle']}/{cycles}: RSS {sample['rss_mb']:.1f} MB, "
+                              f"{sample['surfaces']} superfícies, p95 {sample['p95']:.2f} ms")
+                if deadline and time.perf_counter() > deadline:
+                    break
+            
+            game.capture.close()
+            if game.stats is not None:
+                game.stats.close()
+        pygame.quit()
+    finally:
+        log.close()
+        os.chdir(previous_cwd)
+        if not options.keep:
+            shutil.rmtree(workdir, ignore_errors=True)
+    
+    failures = evaluate(samples, options)
+    print_report(samples, failures, runner, time.perf_counter() - started)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
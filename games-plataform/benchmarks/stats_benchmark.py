@@ -0,0 +1,92 @@
+"""
+stats_benchmark.py - Mede o custo de registrar resultados e o tempo das
+consultas de estatísticas com milhões de mãos no banco
+
+Compara as consultas da tela de estatísticas (agregados em 'totals') com o
+mesmo cálculo feito direto sobre 'results' (varredura completa).
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.stats_benchmark [--records 1000000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from src.managers.stats_manager import StatsManager
+from src.utils.constants import RESULT_WIN, RESULT_LOSS, RESULT_DRAW
+
+GAMES = ("blackjack", "poker")
+PLAYERS = [f"Jogador {i}" for i in range(1, 41)]
+QUERY_REPEATS = 50
+
+
+def time_query(function, *args):
+    """
+    Returns:
+        float: Milissegundos por chamada (média de QUERY_REPEATS)
+    """
+    function(*args)  # Aquecimento (cache de páginas do SQLite)
+    start = time.perf_counter()
+    for _ in range(QUERY_REPEATS):
+        function(*args)
+    return (time.perf_counter() - start) / QUERY_REPEATS * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=1_000_000)
+    options = parser.parse_args()
+    
+    rng = random.Random(7)
+    outcomes = (RESULT_WIN, RESULT_LOSS, RESULT_LOSS, RESULT_DRAW)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        stats = StatsManager(os.path.join(directory, "stats.db"))
+        stats.start()
+        
+        # Custo na thread do jogo: só enfileirar
+        start = time.perf_counter()
+        for _ in range(options.records):
+            outcome = rng.choice(outcomes)
+            stats.record(rng.choice(GAMES), rng.choice(PLAYERS), outcome, outcome * rng.randint(5, 200))
+        enqueue_time = time.perf_counter() - start
+        
+        stats.flush(timeout=None)
+        total_time = time.perf_counter() - start
+        
+        print(f"{options.records:,} resultados")
+        print(f"  record() na thread do jogo:  {enqueue_time / options.records * 1e6:6.2f} µs por resultado")
+        print(f"  gravação em lote (WAL):      {options.records / total_time:,.0f} resultados/s")
+        print()
+        
+        player = PLAYERS[0]
+        scan = stats._read
+        queries = [
+            ("leaderboard (top 10)",
+             lambda: stats.leaderboard("poker"),
+             lambda: scan("SELECT player, COUNT(*), SUM(outcome = 1) AS wins FROM results "
+                          "WHERE game = 'poker' GROUP BY player ORDER BY wins DESC LIMIT 10")),
+            ("estatísticas de um jogador",
+             lambda: stats.player_stats("blackjack", player),
+             lambda: scan("SELECT COUNT(*), SUM(outcome = 1), SUM(amount) FROM results "
+                          "WHERE game = 'blackjack' AND player = ?", (player,))),
+            ("totais por jogo",
+             stats.game_totals,
+             lambda: scan("SELECT game, COUNT(*), SUM(outcome = 1) FROM results GROUP BY game")),
+            ("últimos 20 resultados",
+             lambda: stats.recent_results("poker"),
+             None),
+        ]
+        
+        print(f"{'consulta':<28} {'agregados (ms)':>15} {'varredura (ms)':>15}")
+        for label, fast, slow in queries:
+            fast_ms = time_query(fast)
+            slow_ms = f"{time_query(slow):15.2f}" if slow is not None else f"{'-':>15}"
+            print(f"{label:<28} {fast_ms:15.3f} {slow_ms}")
+        
+        stats.close()
+
+
+if __name__ == "__main__":
+    main()
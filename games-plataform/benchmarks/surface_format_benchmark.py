@@ -0,0 +1,68 @@
+"""
+surface_format_benchmark.py - Compara o tempo de blit de cada asset antes e
+depois do otimizador de formato (convert_alpha em tudo vs. optimize_surface)
+
+Uso (a partir de games-plataform/):
+    python -m benchmarks.surface_format_benchmark
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from pathlib import Path
+from src.managers.asset_manager import IMAGE_FILES, optimize_surface
+
+SCREEN_SIZE = (1920, 1080)
+BLITS_PER_ASSET = 200
+
+
+def time_blits(screen, surface):
+    """
+    Mede o tempo médio de um blit da superfície na tela
+    
+    Returns:
+        float: Microssegundos por blit
+    """
+    screen.blit(surface, (0, 0))  # Aquecimento (gera o RLE na primeira vez)
+    start = time.perf_counter()
+    for _ in range(BLITS_PER_ASSET):
+        screen.blit(surface, (0, 0))
+    return (time.perf_counter() - start) / BLITS_PER_ASSET * 1_000_000
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    base_path = Path("assets")
+    
+    print(f"{'asset':<22} {'tamanho':>10} {'formato':>9} {'alpha (µs)':>11} {'otimizado (µs)':>15} {'ganho':>7}")
+    total_before = total_after = 0.0
+    
+    for key, filename in IMAGE_FILES.items():
+        path = base_path / filename
+        if not path.exists():
+            print(f"{key:<22} (arquivo não encontrado: {filename})")
+            continue
+        
+        loaded = pygame.image.load(str(path))
+        before = loaded.convert_alpha()
+        after, image_format = optimize_surface(loaded)
+        
+        before_us = time_blits(screen, before)
+        after_us = time_blits(screen, after)
+        total_before += before_us
+        total_after += after_us
+        
+        size = f"{before.get_width()}x{before.get_height()}"
+        print(f"{key:<22} {size:>10} {image_format:>9} {before_us:>11.1f} {after_us:>15.1f} {before_us / after_us:>6.2f}x")
+    
+    if total_after:
+        print(f"\n{'total':<22} {'':>10} {'':>9} {total_before:>11.1f} {total_after:>15.1f} {total_before / total_after:>6.2f}x")
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
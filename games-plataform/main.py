@@ -1,8 +1,18 @@
 """
 Arquivo principal - apenas inicializa o jogo
+
+Uso:
+    python main.py                    # inicia o jogo
+    python main.py --profile-startup  # mostra o tempo de cada etapa da inicialização
 """
-from src.game import Game
+import sys
+from src.utils.helpers import StartupProfiler
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    profiler = StartupProfiler(enabled="--profile-startup" in sys.argv)
+    
+    with profiler.step("import src.game (pygame + gerenciadores)"):
+        from src.game import Game
+    
+    game = Game(profiler)
+    game.run()
@@ -2,18 +2,19 @@
 button.py - Componente de botão reutilizável
 """
 import pygame
-from src.utils.constants import BUTTON_HOVER_SCALE
+from src.utils.constants import BUTTON_HOVER_SCALE, BUTTON_HOVER_DURATION, BUTTON_SCALE_STEPS
 
 class Button:
     """Botão interativo com efeito de hover"""
     
-    def __init__(self, image, x, y, name=""):
+    def __init__(self, image, x, y, name="", assets=None):
         """
         Args:
             image: Superfície pygame da imagem do botão
             x: Posição X do centro do botão
             y: Posição Y do centro do botão
             name: Nome identificador do botão
+            assets: AssetManager que contabiliza os quadros de hover (opcional)
         """
         self.original_image = image
         self.image = image
@@ -21,47 +22,103 @@ class Button:
         self.x = x
         self.y = y
         self.name = name
+        self.assets = assets
         self.rect = self.image.get_rect(center=(x, y))
         self.hovered = False
         self.hover_scale = BUTTON_HOVER_SCALE
+        
+        # Estado animável por tweens
+        self.scale = 1.0
+        self.alpha = 255
+        self.scale_frames = None  # Versões pré-escaladas (criadas no primeiro hover)
+        self.scale_tween = None
+        self._frame_scale = 1.0
+        self.faded_image = None  # Cópia para desenhar com alpha (a imagem do cache é compartilhada)
+    
+    def _build_scale_frames(self):
+        """Pré-calcula as imagens entre a escala 1.0 e hover_scale"""
+        self.scale_frames = [self.original_image]
+        for step in range(1, BUTTON_SCALE_STEPS):
+            scale = 1.0 + (self.hover_scale - 1.0) * step / (BUTTON_SCALE_STEPS - 1)
+            new_size = (
+                int(self.original_size[0] * scale),
+                int(self.original_size[1] * scale)
+            )
+            frame = pygame.transform.scale(self.original_image, new_size)
+            if self.assets is not None:
+                self.assets.track_surface(frame, f"botão {self.name} hover {step}")
+            self.scale_frames.append(frame)
+    
+    def _refresh_image(self):
+        """Escolhe a imagem pré-escalada mais próxima da escala atual"""
+        if self.scale_frames is None:
+            self._build_scale_frames()
+        
+        progress = (self.scale - 1.0) / (self.hover_scale - 1.0)
+        index = round(progress * (BUTTON_SCALE_STEPS - 1))
+        index = max(0, min(BUTTON_SCALE_STEPS - 1, index))
+        
+        self.image = self.scale_frames[index]
+        self._frame_scale = self.scale
+        self.rect = self.image.get_rect(center=(self.x, self.y))
     
-    def update_hover(self, mouse_pos):
+    def _on_scale_tween_complete(self):
+        """Solta a referência ao tween (ele volta para o pool)"""
+        self.scale_tween = None
+    
+    def update_hover(self, mouse_pos, tweens=None):
         """
         Atualiza o estado de hover do botão
         
         Args:
             mouse_pos: Tupla (x, y) com a posição do mouse
-            
+            tweens: TweenGroup da cena para animar a escala (None = troca instantânea)
+        
         Returns:
             bool: True se o hover começou neste frame
         """
+        if self.scale_tween is not None and tweens is not None and not tweens.owns(self.scale_tween):
+            # O grupo foi limpo ao sair da cena: a escala vai direto ao valor final
+            self.scale_tween = None
+            self.scale = self.hover_scale if self.hovered else 1.0
+        
         was_hovered = self.hovered
         self.hovered = self.rect.collidepoint(mouse_pos)
         
         # Se mudou o estado de hover, atualiza a aparência
         if was_hovered != self.hovered:
-            if self.hovered:
-                # Aumenta o botão
-                new_size = (
-                    int(self.original_size[0] * self.hover_scale),
-                    int(self.original_size[1] * self.hover_scale)
+            target_scale = self.hover_scale if self.hovered else 1.0
+            
+            if self.scale_tween is not None:
+                self.scale_tween.cancel()
+                self.scale_tween = None
+            
+            if tweens is not None:
+                self.scale_tween = tweens.tween(
+                    self, 'scale', target_scale, BUTTON_HOVER_DURATION,
+                    easing='out_quad', on_complete=self._on_scale_tween_complete
                 )
-                self.image = pygame.transform.scale(self.original_image, new_size)
-                self.rect = self.image.get_rect(center=(self.x, self.y))
             else:
-                # Volta ao tamanho original
-                self.image = self.original_image
-                self.rect = self.image.get_rect(center=(self.x, self.y))
+                self.scale = target_scale
+                self._refresh_image()
         
         return self.hovered and not was_hovered
     
+    def is_resting(self):
+        """
+        Returns:
+            bool: True se o botão está parado (sem hover, animação nem
+                transparência) e pode ficar numa camada em cache
+        """
+        return not self.hovered and self.scale == 1.0 and self.alpha == 255 and self.scale_tween is None
+    
     def is_clicked(self, mouse_pos):
         """
         Verifica se o botão foi clicado
         
         Args:
             mouse_pos: Tupla (x, y) com a posição do mouse
-            
+        
         Returns:
             bool: True se o mouse está sobre o botão
         """
@@ -74,4 +131,25 @@ class Button:
         Args:
             surface: Superfície pygame onde desenhar
         """
-        surface.blit(self.image, self.rect)
\ No newline at end of file
+        if self.scale != self._frame_scale:
+            self._refresh_image()
+        else:
+            # A posição pode estar sendo animada
+            self.rect.center = (self.x, self.y)
+        
+        if self.alpha < 255:
+            surface.blit(self._faded(), self.rect)
+        else:
+            self.faded_image = None
+            surface.blit(self.image, self.rect)
+    
+    def _faded(self):
+        """Cópia da imagem atual com o alpha do botão (refeita quando a imagem muda)"""
+        if self.faded_image is None or self.faded_image[0] is not self.image:
+            copy = self.image.copy()
+            if self.assets is not None:
+                self.assets.track_surface(copy, f"botão {self.name} alpha")
+            self.faded_image = (self.image, copy)
+        faded = self.faded_image[1]
+        faded.set_alpha(self.alpha)
+        return faded
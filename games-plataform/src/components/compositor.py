@@ -0,0 +1,220 @@
+"""
+compositor.py - Compositor de camadas com cache (modo retido)
+
+Cada cena declara suas camadas de baixo para cima. Camadas estáticas e
+semi-estáticas vizinhas são desenhadas juntas numa superfície em cache,
+refeita só quando alguma delas é invalidada; camadas dinâmicas são
+desenhadas direto na tela a cada frame, entre os grupos em cache.
+    
+    static       Conteúdo que só muda com a resolução (fundo, títulos)
+    semi_static  Muda de vez em quando e a cena avisa com invalidate()
+                 (botões parados, textos do jogo atual, cartas em repouso)
+    dynamic      Redesenhada todo frame (botões animados, partículas,
+                 carta sendo arrastada)
+"""
+import pygame
+
+LAYER_STATIC = "static"
+LAYER_SEMI_STATIC = "semi_static"
+LAYER_DYNAMIC = "dynamic"
+
+class Layer:
+    """Uma camada: nome, tipo e função que desenha numa superfície"""
+    
+    def __init__(self, name, kind, draw):
+        """
+        Args:
+            name: Nome usado em invalidate()
+            kind: LAYER_STATIC, LAYER_SEMI_STATIC ou LAYER_DYNAMIC
+            draw: Função draw(surface) que desenha o conteúdo da camada
+        """
+        if kind not in (LAYER_STATIC, LAYER_SEMI_STATIC, LAYER_DYNAMIC):
+            raise ValueError(f"Tipo de camada desconhecido: {kind}")
+        self.name = name
+        self.kind = kind
+        self.draw = draw
+        self.dirty = True
+
+
+class CachedGroup:
+    """Camadas em cache vizinhas, compostas numa única superfície"""
+    
+    def __init__(self, layers, opaque):
+        self.layers = layers
+        self.opaque = opaque  # O grupo de baixo cobre a tela toda (sem alpha)
+        self.surface = None
+        self.rect = None  # Área com conteúdo (só ela é copiada para a tela)
+        
+        # Prefixo estático: guardado à parte para que invalidar uma camada
+        # semi-estática não redesenhe o fundo
+        count = 0
+        for layer in layers:
+            if layer.kind != LAYER_STATIC:
+                break
+            count += 1
+        self.static_count = count if count < len(layers) else 0
+        self.static_surface = None
+    
+    def is_dirty(self):
+        return self.surface is None or any(layer.dirty for layer in self.layers)
+    
+    def _new_surface(self, screen):
+        if self.opaque:
+            return pygame.Surface(screen.get_size(), 0, screen)
+        surface = pygame.Surface(screen.get_size(), pygame.SRCALPHA)
+        surface.fill((0, 0, 0, 0))
+        return surface
+    
+    def rebuild(self, screen):
+        """Redesenha as camadas do grupo na superfície em cache"""
+        static_layers = self.layers[:self.static_count]
+        if static_layers and (self.static_surface is None or any(layer.dirty for layer in static_layers)):
+            self.static_surface = self._new_surface(screen)
+            for layer in static_layers:
+                layer.draw(self.static_surface)
+        
+        if self.static_surface is not None:
+            surface = self.static_surface.copy()
+        else:
+            surface = self._new_surface(screen)
+        for layer in self.layers[self.static_count:]:
+            layer.draw(surface)
+        
+        for layer in self.layers:
+            layer.dirty = False
+        
+        if self.opaque:
+            self.rect = surface.get_rect()
+        else:
+            # Grupos acima do fundo costumam ter pouco conteúdo (títulos, textos)
+            self.rect = surface.get_bounding_rect()
+            surface = surface.convert_alpha()
+        self.surface = surface
+
+
+class LayerCompositor:
+    """Desenha as camadas de uma cena reaproveitando as partes em cache"""
+    
+    def __init__(self, screen):
+        """
+        Args:
+            screen: Superfície onde a cena é desenhada
+        """
+        self.screen = screen
+        self.layers = []
+        self.groups = None  # Lista de CachedGroup ou Layer dinâmica (montada no primeiro draw)
+        self.cache_size = None
+        self.rebuilds = 0  # Quantas vezes algum grupo foi refeito (para medir)
+    
+    def add_layer(self, name, kind, draw, before=None):
+        """
+        Adiciona uma camada (por padrão, acima de todas as outras)
+        
+        Args:
+            name: Nome da camada
+            kind: LAYER_STATIC, LAYER_SEMI_STATIC ou LAYER_DYNAMIC
+            draw: Função draw(surface)
+            before: Nome de uma camada existente para inserir logo abaixo dela
+        
+        Returns:
+            Layer: Camada criada
+        """
+        layer = Layer(name, kind, draw)
+        if before is None:
+            self.layers.append(layer)
+        else:
+            index = next(i for i, existing in enumerate(self.layers) if existing.name == before)
+            self.layers.insert(index, layer)
+        self.groups = None
+        return layer
+    
+    def invalidate(self, name=None):
+        """
+        Marca uma camada (ou todas, com name=None) para ser redesenhada
+        
+        Args:
+            name: Nome da camada
+        """
+        for layer in self.layers:
+            if name is None or layer.name == name:
+                layer.dirty = True
+    
+    def _build_groups(self):
+        """Agrupa camadas em cache vizinhas entre as dinâmicas"""
+        self.groups = []
+        pending = []
+        for layer in self.layers:
+            if layer.kind == LAYER_DYNAMIC:
+                if pending:
+                    self.groups.append(CachedGroup(pending, opaque=not self.groups))
+                    pending = []
+                self.groups.append(layer)
+            else:
+                pending.append(layer)
+        if pending:
+            self.groups.append(CachedGroup(pending, opaque=not self.groups))
+        
+        for layer in self.layers:
+            layer.dirty = True
+        self.cache_size = self.screen.get_size()
+    
+    def draw(self):
+        """Um blit por grupo em cache + as camadas dinâmicas"""
+        if self.groups is None or self.cache_size != self.screen.get_size():
+            self._build_groups()
+        
+        for group in self.groups:
+            if isinstance(group, Layer):
+                group.draw(self.screen)
+                continue
+            if group.is_dirty():
+                group.rebuild(self.screen)
+                self.rebuilds += 1
+            self.screen.blit(group.surface, group.rect.topleft, group.rect)
+    
+    def draw_immediate(self):
+        """Desenha todas as camadas direto na tela, sem cache (comparação/depuração)"""
+        for layer in self.layers:
+            layer.draw(self.screen)
+
+
+class ButtonLayers:
+    """
+    Divide os botões entre uma camada semi-estática (botões parados) e uma
+    dinâmica (com hover, animação ou transparência)
+    """
+    
+    def __init__(self, compositor, buttons, name="buttons", before=None):
+        """
+        Args:
+            compositor: LayerCompositor da cena
+            buttons: Dicionário de Button da cena (pode mudar depois)
+            name: Nome da camada semi-estática ('<name>_active' para a dinâmica)
+            before: Camada acima das duas (None = no topo)
+        """
+        self.compositor = compositor
+        self.buttons = buttons
+        self.name = name
+        self.signature = None
+        compositor.add_layer(name, LAYER_SEMI_STATIC, self._draw_resting, before)
+        compositor.add_layer(f"{name}_active", LAYER_DYNAMIC, self._draw_active, before)
+    
+    def update(self):
+        """Invalida a camada de botões parados se algum entrou/saiu dela (chamar antes do draw)"""
+        signature = tuple(
+            (key, id(button.original_image), button.x, button.y)
+            for key, button in self.buttons.items() if button.is_resting()
+        )
+        if signature != self.signature:
+            self.signature = signature
+            self.compositor.invalidate(self.name)
+    
+    def _draw_resting(self, surface):
+        for button in self.buttons.values():
+            if button.is_resting():
+                button.draw(surface)
+    
+    def _draw_active(self, surface):
+        for button in self.buttons.values():
+            if not button.is_resting():
+                button.draw(surface)
@@ -0,0 +1,323 @@
+"""
+particles.py - Sistema de partículas com estado em arrays NumPy
+
+Cada emissor guarda posição, velocidade e vida das partículas em arrays
+pré-alocados, atualizados com operações vetorizadas. O desenho é feito com
+uma única chamada Surface.blits (ou fblits, no pygame-ce) por emissor,
+usando sprites pré-renderizados com níveis de transparência.
+"""
+import numpy as np
+import pygame
+from src.utils.constants import (
+    MAX_PARTICLES, PARTICLE_EMITTER_POOL, PARTICLE_EMITTER_CAPACITY, PARTICLE_FADE_LEVELS,
+)
+
+
+def _make_card_sprite(color):
+    """Cartinha com borda (cascata de vitória da paciência)"""
+    surface = pygame.Surface((18, 26), pygame.SRCALPHA)
+    pygame.draw.rect(surface, (250, 250, 250), surface.get_rect(), border_radius=3)
+    pygame.draw.rect(surface, color, surface.get_rect().inflate(-6, -6), border_radius=2)
+    return surface
+
+
+def _make_chip_sprite(color):
+    """Ficha de cassino (poker e blackjack)"""
+    surface = pygame.Surface((16, 16), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (8, 8), 8)
+    pygame.draw.circle(surface, (255, 255, 255), (8, 8), 5, 2)
+    return surface
+
+
+def _make_sparkle_sprite(color):
+    """Brilho em cruz (carrossel de jogos)"""
+    surface = pygame.Surface((9, 9), pygame.SRCALPHA)
+    pygame.draw.line(surface, color, (4, 0), (4, 8))
+    pygame.draw.line(surface, color, (0, 4), (8, 4))
+    surface.set_at((4, 4), (255, 255, 255))
+    return surface
+
+
+# Configuração de cada efeito (ângulos em graus, 270 = para cima)
+PARTICLE_PRESETS = {
+    'card_cascade': {
+        'sprite': _make_card_sprite,
+        'colors': [(200, 30, 30), (30, 30, 30), (30, 60, 180), (30, 140, 60)],
+        'count': 150,
+        'angle': 90,
+        'spread': 160,
+        'speed': (80, 320),
+        'gravity': 600,
+        'drag': 0.0,
+        'life': (2.0, 3.5),
+    },
+    'chip_burst': {
+        'sprite': _make_chip_sprite,
+        'colors': [(220, 40, 40), (40, 90, 220), (30, 160, 70), (20, 20, 20)],
+        'count': 80,
+        'angle': 270,
+        'spread': 360,
+        'speed': (150, 450),
+        'gravity': 500,
+        'drag': 0.5,
+        'life': (0.8, 1.6),
+    },
+    'sparkle': {
+        'sprite': _make_sparkle_sprite,
+        'colors': [(255, 255, 140), (255, 220, 255), (180, 240, 255)],
+        'count': 40,
+        'angle': 270,
+        'spread': 360,
+        'speed': (20, 120),
+        'gravity': -20,
+        'drag': 1.5,
+        'life': (0.4, 1.0),
+    },
+}
+
+
+def build_particle_frames(preset):
+    """
+    Pré-renderiza os sprites de um efeito em todos os níveis de transparência
+    
+    Args:
+        preset: Dicionário de PARTICLE_PRESETS
+    
+    Returns:
+        numpy.ndarray: Array de objetos com as superfícies, indexado por
+            variante * PARTICLE_FADE_LEVELS + nível
+    """
+    frames = []
+    convert = pygame.display.get_surface() is not None
+    
+    for color in preset['colors']:
+        base = preset['sprite'](color)
+        if convert:
+            base = base.convert_alpha()
+        
+        for level in range(PARTICLE_FADE_LEVELS):
+            alpha = int(255 * (level + 1) / PARTICLE_FADE_LEVELS)
+            frame = base.copy()
+            frame.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            frames.append(frame)
+    
+    frames_array = np.empty(len(frames), dtype=object)
+    frames_array[:] = frames
+    return frames_array
+
+
+class ParticleEmitter:
+    """Conjunto de partículas de um efeito, com arrays de tamanho fixo"""
+    
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity: Número máximo de partículas deste emissor
+        """
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.variant = np.zeros(capacity, dtype=np.int32)
+        self.count = 0
+        self.preset = None
+        self.frames = None
+        self.half_size = (0, 0)
+    
+    def reset(self, preset, frames):
+        """
+        Prepara o emissor (vindo do pool) para um novo efeito
+        
+        Args:
+            preset: Dicionário de PARTICLE_PRESETS
+            frames: Sprites gerados por build_particle_frames
+        """
+        self.preset = preset
+        self.frames = frames
+        self.count = 0
+        width, height = frames[0].get_size()
+        self.half_size = (width / 2, height / 2)
+    
+    def spawn(self, x, y, amount, rng):
+        """
+        Cria novas partículas em (x, y)
+        
+        Args:
+            x: Posição X de origem
+            y: Posição Y de origem
+            amount: Quantidade desejada
+            rng: numpy.random.Generator
+        
+        Returns:
+            int: Quantidade realmente criada (limitada pela capacidade)
+        """
+        amount = min(amount, self.capacity - self.count)
+        if amount <= 0:
+            return 0
+        
+        preset = self.preset
+        start, end = self.count, self.count + amount
+        
+        angle = np.radians(preset['angle'] + rng.uniform(-0.5, 0.5, amount) * preset['spread'])
+        speed = rng.uniform(*preset['speed'], amount)
+        life = rng.uniform(*preset['life'], amount)
+        
+        self.pos[start:end, 0] = x
+        self.pos[start:end, 1] = y
+        self.vel[start:end, 0] = np.cos(angle) * speed
+        self.vel[start:end, 1] = np.sin(angle) * speed
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.variant[start:end] = rng.integers(0, len(preset['colors']), amount)
+        
+        self.count = end
+        return amount
+    
+    def update(self, dt):
+        """
+        Avança a simulação de todas as partículas de uma vez
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        vel = self.vel[:n]
+        vel[:, 1] += self.preset['gravity'] * dt
+        if self.preset['drag']:
+            vel *= max(0.0, 1.0 - self.preset['drag'] * dt)
+        self.pos[:n] += vel * dt
+        self.life[:n] -= dt
+        
+        # Compacta as partículas vivas no início dos arrays
+        alive = self.life[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.variant):
+                array[:remaining] = array[:n][alive]
+            self.count = remaining
+    
+    def draw(self, surface):
+        """
+        Desenha todas as partículas com uma única chamada em lote
+        
+        Args:
+            surface: Superfície pygame onde desenhar
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        # Nível de transparência proporcional à vida restante
+        levels = (self.life[:n] / self.max_life[:n] * PARTICLE_FADE_LEVELS).astype(np.int32)
+        np.clip(levels, 0, PARTICLE_FADE_LEVELS - 1, out=levels)
+        sprites = self.frames[self.variant[:n] * PARTICLE_FADE_LEVELS + levels]
+        
+        positions = (self.pos[:n] - self.half_size).astype(np.int32).tolist()
+        
+        fblits = getattr(surface, 'fblits', None)
+        if fblits:
+            fblits(zip(sprites, positions))
+        else:
+            surface.blits(zip(sprites, positions), doreturn=False)
+    
+    @property
+    def finished(self):
+        """bool: True quando não há mais partículas vivas"""
+        return self.count == 0
+
+
+class ParticleSystem:
+    """Gerencia emissores reutilizáveis com um limite global de partículas"""
+    
+    def __init__(self, max_particles=MAX_PARTICLES, pool_size=PARTICLE_EMITTER_POOL, seed=None,
+                 emitter_capacity=PARTICLE_EMITTER_CAPACITY):
+        """
+        Args:
+            max_particles: Limite rígido de partículas vivas somando todos os emissores
+            pool_size: Quantidade de emissores pré-alocados
+            seed: Semente opcional do gerador aleatório
+            emitter_capacity: Partículas por emissor (a memória pré-alocada é
+                pool_size × capacidade, não pool_size × max_particles)
+        """
+        self.max_particles = max_particles
+        self.density = 1.0  # Fração das partículas emitidas (ajustada pelo nível de qualidade)
+        capacity = min(max_particles, emitter_capacity)
+        self.free_emitters = [ParticleEmitter(capacity) for _ in range(pool_size)]
+        self.active_emitters = []
+        self.frames = {}
+        self.rng = np.random.default_rng(seed)
+    
+    def _get_frames(self, preset_name):
+        """Retorna (e pré-renderiza na primeira vez) os sprites de um efeito"""
+        if preset_name not in self.frames:
+            self.frames[preset_name] = build_particle_frames(PARTICLE_PRESETS[preset_name])
+        return self.frames[preset_name]
+    
+    def emit(self, preset_name, x, y, count=None):
+        """
+        Dispara um efeito (usa mais de um emissor se a quantidade passar da
+        capacidade de um emissor)
+        
+        Args:
+            preset_name: Chave de PARTICLE_PRESETS
+            x: Posição X de origem
+            y: Posição Y de origem
+            count: Quantidade de partículas (padrão do efeito se None)
+        
+        Returns:
+            int: Partículas realmente criadas (0 se o limite/pool esgotou)
+        """
+        preset = PARTICLE_PRESETS[preset_name]
+        if count is None:
+            count = preset['count']
+        
+        count = min(int(count * self.density), self.max_particles - self.particle_count)
+        spawned = 0
+        while count > spawned and self.free_emitters:
+            emitter = self.free_emitters.pop()
+            emitter.reset(preset, self._get_frames(preset_name))
+            spawned += emitter.spawn(x, y, count - spawned, self.rng)
+            self.active_emitters.append(emitter)
+        return spawned
+    
+    def update(self, dt):
+        """
+        Atualiza os emissores e devolve ao pool os que terminaram
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        still_active = []
+        for emitter in self.active_emitters:
+            emitter.update(dt)
+            if emitter.finished:
+                self.free_emitters.append(emitter)
+            else:
+                still_active.append(emitter)
+        self.active_emitters = still_active
+    
+    def draw(self, surface):
+        """
+        Desenha todos os emissores ativos
+        
+        Args:
+            surface: Superfície pygame onde desenhar
+        """
+        for emitter in self.active_emitters:
+            emitter.draw(surface)
+    
+    def clear(self):
+        """Remove todas as partículas (ex.: ao sair da cena)"""
+        for emitter in self.active_emitters:
+            emitter.count = 0
+            self.free_emitters.append(emitter)
+        self.active_emitters = []
+    
+    @property
+    def particle_count(self):
+        """int: Total de partículas vivas"""
+        return sum(emitter.count for emitter in self.active_emitters)
@@ -0,0 +1,197 @@
+"""
+text_view.py - Texto longo com quebra de linha e rolagem virtualizada
+
+O texto é quebrado e renderizado uma única vez por largura: cada linha vira
+uma superfície em cache com sua posição y. No draw, bisect acha as linhas
+dentro da área visível e só elas são copiadas para a tela, então o custo
+por frame não depende do tamanho do texto.
+
+Formato do texto (uma linha do arquivo = um parágrafo):
+    # Título       título de seção
+    - item         item com marcador (linhas quebradas ficam recuadas)
+    linha vazia    espaço entre parágrafos
+"""
+import bisect
+import pygame
+
+BULLET = "•  "
+SCROLLBAR_WIDTH = 8
+SCROLLBAR_GAP = 16  # Espaço entre o texto e a barra de rolagem
+
+def wrap_words(font, text, width):
+    """
+    Quebra um parágrafo em linhas que cabem na largura
+    
+    Args:
+        font: Fonte usada para medir
+        text: Parágrafo
+        width: Largura máxima em pixels
+    
+    Returns:
+        list: Linhas (uma palavra maior que a largura fica sozinha na linha)
+    """
+    lines = []
+    current = ""
+    for word in text.split():
+        candidate = f"{current} {word}" if current else word
+        if current and font.size(candidate)[0] > width:
+            lines.append(current)
+            current = word
+        else:
+            current = candidate
+    if current:
+        lines.append(current)
+    return lines
+
+
+class TextLayout:
+    """Linhas de um texto já quebradas e renderizadas para uma largura"""
+    
+    def __init__(self, text, width, fonts, colors):
+        """
+        Args:
+            text: Texto no formato do módulo
+            width: Largura disponível em pixels
+            fonts: {'heading': Font, 'body': Font}
+            colors: {'heading': cor, 'body': cor}
+        """
+        self.width = width
+        self.lines = []  # (x, superfície)
+        self.tops = []
+        self.bottoms = []
+        
+        body = fonts['body']
+        gap = body.get_linesize() // 2
+        y = 0
+        for paragraph in text.splitlines():
+            paragraph = paragraph.strip()
+            if not paragraph:
+                y += gap
+                continue
+            
+            if paragraph.startswith("# "):
+                font, color = fonts['heading'], colors['heading']
+                if self.lines:
+                    y += gap
+                wrapped = [(0, line) for line in wrap_words(font, paragraph[2:], width)]
+            elif paragraph.startswith("- "):
+                font, color = body, colors['body']
+                indent = font.size(BULLET)[0]
+                wrapped = [(indent, line) for line in wrap_words(font, paragraph[2:], width - indent)]
+                if wrapped:
+                    wrapped[0] = (0, BULLET + wrapped[0][1])
+            else:
+                font, color = body, colors['body']
+                wrapped = [(0, line) for line in wrap_words(font, paragraph, width)]
+            
+            for x, line in wrapped:
+                surface = font.render(line, True, color).convert_alpha()
+                self.lines.append((x, surface))
+                self.tops.append(y)
+                y += font.get_linesize()
+                self.bottoms.append(y)
+        
+        self.height = y
+    
+    def visible_range(self, top, bottom):
+        """
+        Args:
+            top: Primeira linha de pixels visível (coordenada do texto)
+            bottom: Última linha de pixels visível (exclusiva)
+        
+        Returns:
+            tuple: (primeiro índice, último índice exclusivo) das linhas visíveis
+        """
+        first = bisect.bisect_right(self.bottoms, top)
+        last = bisect.bisect_left(self.tops, bottom)
+        return first, last
+
+
+class TextView:
+    """Área com rolagem que desenha só as linhas visíveis de um TextLayout"""
+    
+    def __init__(self, rect, fonts, colors, scrollbar_color=(255, 255, 255)):
+        """
+        Args:
+            rect: Área da tela ocupada pelo texto (inclui a barra de rolagem)
+            fonts: {'heading': Font, 'body': Font}
+            colors: {'heading': cor, 'body': cor}
+            scrollbar_color: Cor da barra de rolagem
+        """
+        self.rect = pygame.Rect(rect)
+        self.fonts = fonts
+        self.colors = colors
+        self.scrollbar_color = scrollbar_color
+        self.layouts = {}  # (chave, largura) -> TextLayout
+        self.layout = None
+        self.scroll = 0.0  # Pixels rolados (float para animar com tweens)
+    
+    @property
+    def text_width(self):
+        return self.rect.width - SCROLLBAR_WIDTH - SCROLLBAR_GAP
+    
+    def set_text(self, key, text):
+        """
+        Mostra um texto, quebrando e renderizando só na primeira vez por largura
+        
+        Args:
+            key: Identificador do texto no cache
+            text: Texto no formato do módulo
+        """
+        cache_key = (key, self.text_width)
+        layout = self.layouts.get(cache_key)
+        if layout is None:
+            layout = TextLayout(text, self.text_width, self.fonts, self.colors)
+            self.layouts[cache_key] = layout
+        self.layout = layout
+        self.scroll = 0.0
+    
+    def max_scroll(self):
+        """
+        Returns:
+            int: Maior deslocamento possível (0 se o texto cabe na área)
+        """
+        if self.layout is None:
+            return 0
+        return max(0, self.layout.height - self.rect.height)
+    
+    def clamp(self, value):
+        """
+        Args:
+            value: Deslocamento desejado
+        
+        Returns:
+            float: Deslocamento limitado a [0, max_scroll]
+        """
+        return min(max(0.0, float(value)), float(self.max_scroll()))
+    
+    def draw(self, surface):
+        """Copia as linhas visíveis (recortadas na área) e a barra de rolagem"""
+        if self.layout is None:
+            return
+        
+        offset = int(round(self.scroll))
+        first, last = self.layout.visible_range(offset, offset + self.rect.height)
+        left = self.rect.x
+        top = self.rect.y - offset
+        lines = self.layout.lines
+        tops = self.layout.tops
+        
+        previous_clip = surface.get_clip()
+        surface.set_clip(self.rect)
+        surface.blits([(lines[i][1], (left + lines[i][0], top + tops[i])) for i in range(first, last)], False)
+        surface.set_clip(previous_clip)
+        
+        self._draw_scrollbar(surface)
+    
+    def _draw_scrollbar(self, surface):
+        """Barra proporcional à fração visível (só se o texto não couber)"""
+        max_scroll = self.max_scroll()
+        if max_scroll <= 0:
+            return
+        
+        track_height = self.rect.height
+        thumb_height = max(40, track_height * track_height // self.layout.height)
+        thumb_y = self.rect.y + (track_height - thumb_height) * self.clamp(self.scroll) / max_scroll
+        thumb = pygame.Rect(self.rect.right - SCROLLBAR_WIDTH, int(thumb_y), SCROLLBAR_WIDTH, thumb_height)
+        pygame.draw.rect(surface, self.scrollbar_color, thumb, border_radius=SCROLLBAR_WIDTH // 2)
@@ -0,0 +1,154 @@
+"""
+ui_elements.py - Elementos de interface de depuração (overlays)
+"""
+import time
+import pygame
+from src.utils.constants import QUALITY_OVERLAY_FLASH
+
+class MemoryOverlay:
+    """Mostra o uso de memória das superfícies no canto da tela (F3)"""
+    
+    REFRESH_INTERVAL = 0.5  # Segundos entre atualizações do texto
+    
+    def __init__(self, assets, max_lines=8):
+        """
+        Args:
+            assets: Instância do AssetManager
+            max_lines: Quantidade de superfícies listadas
+        """
+        self.assets = assets
+        self.max_lines = max_lines
+        self.visible = False
+        self.font = None
+        self.rendered_lines = []
+        self.background = None
+        self.last_refresh = 0.0
+    
+    def toggle(self):
+        """Liga/desliga o overlay"""
+        self.visible = not self.visible
+        self.last_refresh = 0.0
+    
+    def _refresh(self):
+        """Renderiza o texto do relatório (só a cada REFRESH_INTERVAL)"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 24)
+        
+        report = self.assets.memory_report()
+        used_mb = report['total_bytes'] / 1048576
+        budget_mb = report['budget_bytes'] / 1048576
+        color = (255, 120, 120) if used_mb > budget_mb else (120, 255, 120)
+        
+        lines = [(f"Superfícies: {report['surface_count']}  {used_mb:.1f}/{budget_mb:.0f} MB", color)]
+        for owner, used in sorted(report['by_owner'].items(), key=lambda item: -item[1]):
+            lines.append((f"  {owner}: {used / 1048576:.2f} MB", (220, 220, 255)))
+        for entry in report['surfaces'][:self.max_lines]:
+            lines.append((f"  {entry['label']}: {entry['bytes'] / 1024:.0f} KB", (200, 200, 200)))
+        
+        self.rendered_lines = [self.font.render(text, True, line_color) for text, line_color in lines]
+        
+        # Fundo semitransparente do tamanho do texto
+        width = max(line.get_width() for line in self.rendered_lines) + 20
+        height = len(self.rendered_lines) * 22 + 12
+        self.background = pygame.Surface((width, height))
+        self.background.set_alpha(180)
+        
+        self.last_refresh = time.monotonic()
+    
+    def draw(self, surface):
+        """
+        Desenha o overlay
+        
+        Args:
+            surface: Superfície pygame onde desenhar
+        """
+        if not self.visible:
+            return
+        
+        if time.monotonic() - self.last_refresh >= self.REFRESH_INTERVAL:
+            self._refresh()
+        
+        surface.blit(self.background, (10, 10))
+        
+        for i, line in enumerate(self.rendered_lines):
+            surface.blit(line, (20, 16 + i * 22))
+
+
+class QualityOverlay:
+    """Mostra o nível de qualidade e o tempo dos frames no canto da tela (F4)"""
+    
+    REFRESH_INTERVAL = 0.5  # Segundos entre atualizações do texto
+    
+    def __init__(self, quality):
+        """
+        Args:
+            quality: Instância do QualityManager
+        """
+        self.quality = quality
+        self.visible = False
+        self.flash_until = 0.0
+        self.font = None
+        self.rendered_lines = []
+        self.background = None
+        self.last_refresh = 0.0
+    
+    def toggle(self):
+        """Liga/desliga o overlay"""
+        self.visible = not self.visible
+        self.last_refresh = 0.0
+    
+    def flash(self):
+        """Mostra o overlay por alguns segundos (chamado a cada troca de nível)"""
+        self.flash_until = time.monotonic() + QUALITY_OVERLAY_FLASH
+        self.last_refresh = 0.0
+    
+    def _refresh(self):
+        """Renderiza o texto (só a cada REFRESH_INTERVAL)"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 24)
+        
+        quality = self.quality
+        tier = quality.current
+        mode = "automática" if quality.auto else "fixa"
+        p90 = quality.percentile(90)
+        color = (255, 120, 120) if p90 > quality.budget_ms else (120, 255, 120)
+        
+        lines = [
+            (f"Qualidade: {quality.name} ({mode})", (255, 255, 255)),
+            (f"p90 {p90:.1f} ms  mediana {quality.percentile(50):.1f} ms  / {quality.budget_ms:.1f} ms", color),
+            (f"  partículas {tier['particles']:.0%}  transição {tier['transition']}", (200, 200, 200)),
+            (f"  smoothscale {'sim' if tier['smooth_scaling'] else 'não'}  "
+             f"gravação {'sim' if tier['clip_recorder'] else 'pausada'}", (200, 200, 200)),
+        ]
+        if quality.decisions:
+            previous, current, _ = quality.decisions[-1]
+            lines.append((f"  última troca: {previous} -> {current}", (220, 220, 255)))
+        
+        self.rendered_lines = [self.font.render(text, True, line_color) for text, line_color in lines]
+        
+        width = max(line.get_width() for line in self.rendered_lines) + 20
+        height = len(self.rendered_lines) * 22 + 12
+        self.background = pygame.Surface((width, height))
+        self.background.set_alpha(180)
+        
+        self.last_refresh = time.monotonic()
+    
+    def draw(self, surface):
+        """
+        Desenha o overlay no canto superior direito
+        
+        Args:
+            surface: Superfície pygame onde desenhar
+        """
+        now = time.monotonic()
+        if not self.visible and now >= self.flash_until:
+            return
+        
+        if now - self.last_refresh >= self.REFRESH_INTERVAL:
+            self._refresh()
+        
+        x = surface.get_width() - self.background.get_width() - 10
+        surface.blit(self.background, (x, 10))
+        
+        for i, line in enumerate(self.rendered_lines):
+            surface.blit(line, (x + 10, 16 + i * 22))
@@ -3,32 +3,137 @@ game.py - Classe principal do jogo
 """
 import pygame
 import sys
-from src.managers.asset_manager import AssetManager
+from src.managers.asset_manager import AssetManager, MENU_IMAGES
 from src.managers.scene_manager import SceneManager
+from src.managers.capture_manager import CaptureManager
+from src.managers.quality_manager import QualityManager, tier_index
+from src.components.ui_elements import MemoryOverlay, QualityOverlay
+from src.utils.constants import SURFACE_MEMORY_BUDGET_MB, STATS_DB_PATH
+from src.utils.helpers import StartupProfiler, load_settings, save_settings
 
 class Game:
     """Classe principal que controla o loop do jogo"""
     
-    def __init__(self):
-        """Inicializa o jogo"""
-        pygame.init()
+    def __init__(self, profiler=None):
+        """
+        Inicializa o jogo
+        
+        Só o display é iniciado antes do primeiro frame: a arte de loading
+        aparece imediatamente e o mixer/música ficam para depois do menu.
+        
+        Args:
+            profiler: StartupProfiler opcional (--profile-startup)
+        """
+        self.profiler = profiler or StartupProfiler()
+        self.settings = load_settings()
+        self.settings_changed = False  # Gravadas em _cleanup
         
         # Configurações da tela
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        pygame.display.set_caption("Let's Play The Game")
+        with self.profiler.step("pygame.display.init + set_mode"):
+            pygame.display.init()
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            pygame.display.set_caption("Let's Play The Game")
         
         # Clock para controlar FPS
         self.clock = pygame.time.Clock()
         
         # Gerenciadores
-        self.assets = AssetManager()
-        self.scene_manager = SceneManager(self.screen, self.assets)
+        self.assets = AssetManager(
+            memory_budget_mb=self.settings.get('surface_memory_budget_mb', SURFACE_MEMORY_BUDGET_MB)
+        )
+        
+        with self.profiler.step("tela de loading (primeiro frame)"):
+            self._present_boot_screen()
+        self.profiler.mark("primeiro frame na tela")
+        
+        # Nível de qualidade (começa do último gravado e se ajusta ao tempo dos frames)
+        self.quality = QualityManager(
+            tier=tier_index(self.settings.get('quality_tier')),
+            auto=self.settings.get('quality_auto', True),
+            on_change=self._on_quality_change,
+        )
+        self.assets.smooth_scaling = self.quality.current['smooth_scaling']
+        
+        with self.profiler.step("pygame.font.init"):
+            pygame.font.init()
+        
+        with self.profiler.step("assets do menu"):
+            self.assets.set_owner("main_menu")
+            self.assets.preload_images(MENU_IMAGES)
+        
+        with self.profiler.step("SceneManager + menu principal"):
+            self.scene_manager = SceneManager(self.screen, self.assets)
+        
+        # Overlay de memória das superfícies (F3)
+        self.memory_overlay = MemoryOverlay(self.assets)
+        
+        # Screenshots (F12) e anel com os últimos segundos de jogo (F11 salva, F10 liga/desliga)
+        self.capture = CaptureManager(self.screen, recording=self.settings.get('clip_recorder_enabled', True))
+        self.stats = None
+        
+        # Overlay do nível de qualidade (F4, aparece sozinho a cada troca)
+        self.quality_overlay = QualityOverlay(self.quality)
+        self._apply_quality(self.quality.current)
         
         # Estado do jogo
         self.running = True
+        self.startup_complete = False  # Mixer e música são iniciados após o primeiro frame do menu
+    
+    def _present_boot_screen(self):
+        """Mostra a arte de loading o mais cedo possível"""
+        self.screen.fill((0, 0, 0))
+        
+        loading_background = self.assets.get_scaled_image('loading_screen_bg', self.screen.get_size())
+        if loading_background:
+            self.screen.blit(loading_background, (0, 0))
+        
+        pygame.display.flip()
+    
+    def _finish_startup(self):
+        """Inicializações adiadas: mixer e música de fundo"""
+        with self.profiler.step("pygame.mixer.init + música"):
+            try:
+                pygame.mixer.init()
+                self.assets.load_music()
+            except pygame.error as e:
+                print(f"✗ Áudio indisponível: {e}")
+            
+            # Inicia música de fundo
+            self._start_music()
         
-        # Inicia música de fundo
-        self._start_music()
+        with self.profiler.step("estatísticas (sqlite3)"):
+            # Importado aqui: sqlite3 custa dezenas de ms no boot
+            from src.managers.stats_manager import StatsManager
+            self.stats = StatsManager(self.settings.get('stats_db_path', STATS_DB_PATH))
+            self.stats.start()
+            self.scene_manager.attach_stats(self.stats)
+        
+        self.profiler.mark("inicialização completa")
+        self.profiler.report()
+        self.startup_complete = True
+    
+    def _apply_quality(self, quality):
+        """
+        Repassa um nível de qualidade aos gerenciadores
+        
+        Args:
+            quality: dict de QUALITY_TIERS
+        """
+        self.assets.smooth_scaling = quality['smooth_scaling']
+        self.scene_manager.set_quality(quality)
+        self.capture.paused = not quality['clip_recorder']
+    
+    def _on_quality_change(self, quality):
+        """
+        Aplica o novo nível e mostra o overlay
+        
+        O nível só é gravado em config/settings.json ao sair: a troca acontece
+        justamente quando os frames estão acima do orçamento.
+        """
+        self._apply_quality(quality)
+        self.quality_overlay.flash()
+        self.settings['quality_tier'] = quality['name']
+        self.settings_changed = True
     
     def _start_music(self):
         """Inicia a música de fundo"""
@@ -69,9 +174,30 @@ class Game:
         
         elif key == pygame.K_MINUS:
             self._change_volume(-0.1)
+        
+        # Overlay de memória
+        elif key == pygame.K_F3:
+            self.memory_overlay.toggle()
+        
+        # Overlay de qualidade
+        elif key == pygame.K_F4:
+            self.quality_overlay.toggle()
+        
+        # Captura
+        elif key == pygame.K_F10:
+            self.capture.toggle_recording()
+        
+        elif key == pygame.K_F11:
+            self.capture.save_clip()
+        
+        elif key == pygame.K_F12:
+            self.capture.request_screenshot()
     
     def _toggle_music(self):
         """Liga/desliga a música"""
+        if not pygame.mixer.get_init():
+            return
+        
         if pygame.mixer.music.get_busy():
             self.assets.pause_music()
             print("🔇 Música pausada")
@@ -96,6 +222,10 @@ class Game:
         # Delta time em segundos
         dt = self.clock.tick(60) / 1000.0
         
+        # Tempo de trabalho do frame anterior (sem a espera do tick)
+        if self.startup_complete:
+            self.quality.record(self.clock.get_rawtime())
+        
         # Atualiza o gerenciador de cenas
         self.scene_manager.update(dt)
     
@@ -103,9 +233,18 @@ class Game:
         """Desenha tudo na tela"""
         # O gerenciador de cenas cuida de tudo
         self.scene_manager.draw()
+        self.memory_overlay.draw(self.screen)
+        self.quality_overlay.draw(self.screen)
         
         # Atualiza a tela
         pygame.display.flip()
+        
+        # Copia o frame pronto para a captura (compressão e disco ficam na thread de trabalho)
+        self.capture.after_flip(self.screen)
+        
+        if not self.startup_complete:
+            self.profiler.mark("primeiro frame do menu")
+            self._finish_startup()
     
     def run(self):
         """Loop principal do jogo"""
@@ -130,11 +269,21 @@ class Game:
         print("   M      - Mute/Unmute música")
         print("   +      - Aumentar volume")
         print("   -      - Diminuir volume")
+        print("   F3     - Memória das superfícies")
+        print("   F4     - Nível de qualidade e tempo dos frames")
+        print("   F10    - Liga/desliga gravação contínua")
+        print("   F11    - Salvar os últimos 30 segundos")
+        print("   F12    - Screenshot")
         print("\n▶️  Jogo iniciado!\n")
     
     def _cleanup(self):
         """Limpeza ao encerrar o jogo"""
         print("\n🛑 Encerrando...")
         self.assets.stop_music()
+        self.capture.close()
+        if self.stats is not None:
+            self.stats.close()
+        if self.settings_changed:
+            save_settings(self.settings)
         pygame.quit()
         sys.exit()
\ No newline at end of file
@@ -1,70 +1,211 @@
 """
 asset_manager.py - Gerenciador de assets (imagens, sons, músicas)
 """
+import time
+import weakref
 import pygame
 from pathlib import Path
+from src.utils.constants import SURFACE_MEMORY_BUDGET_MB
+
+# Todas as imagens conhecidas (chave -> arquivo dentro de assets/)
+IMAGE_FILES = {
+    # Menu principal
+    'main_menu_bg': 'images/menu-complete.PNG',
+    'menu_button': 'images/menu_button-menu.png',
+    'options_button': 'images/option_button-menu.png',
+    'start_button': 'images/start-button-menu.png',
+    'rules_button': 'images/rules-button.png',
+    
+    # Menu de seleção de jogos
+    'selection_menu_bg': 'images/poker-menu-background.png',
+    'poker_icon': 'images/poker-icon.png',
+    'paciencia_icon': 'images/paciencia_icon.PNG',
+    'jogo_da_velha_icon': 'images/jogo_da_velha_icon.PNG',
+    'blackjack_icon': 'images/blackjack_icon.PNG',
+    'arrow_left': 'images/arrow-left.png',
+    'arrow_right': 'images/arrow-right.png',
+    'back_arrow': 'images/back-arrow.png',
+    # Loading screen
+    'loading_screen_bg': 'images/loading-screen.png',
+}
+
+# Imagens necessárias para mostrar o menu principal; as demais são
+# carregadas sob demanda na primeira chamada de get_image
+MENU_IMAGES = ('main_menu_bg', 'start_button', 'menu_button', 'rules_button', 'options_button')
+
+# Imagens com margem transparente grande: a margem é recortada no carregamento
+# para que o conteúdo ocupe o tamanho pedido em get_scaled_image
+TRIMMED_IMAGES = {'rules_button'}
+
+MUSIC_FILE = "sounds/music/fliperama-main-menu-sound.mp3"
+
+# Formatos escolhidos pelo otimizador (do mais barato para o mais caro de desenhar)
+FORMAT_OPAQUE = "opaque"      # convert(): sem canal alpha
+FORMAT_COLORKEY = "colorkey"  # convert() + colorkey com RLE: alpha só 0 ou 255
+FORMAT_ALPHA = "alpha"        # convert_alpha(): transparência parcial
+
+# Cores candidatas a colorkey (a primeira que não aparece na imagem é usada)
+COLORKEY_CANDIDATES = [(255, 0, 255), (0, 255, 0), (1, 2, 3), (254, 1, 253)]
+
+def optimize_surface(image):
+    """
+    Escolhe a representação mais barata e correta para uma imagem
+    
+    Inspeciona o canal alpha: totalmente opaca vira convert(); alpha só
+    0/255 vira colorkey com RLEACCEL; qualquer outro caso mantém alpha
+    por pixel.
+    
+    Args:
+        image: Superfície recém-carregada (requer display inicializado)
+    
+    Returns:
+        tuple: (pygame.Surface otimizada, formato)
+    """
+    rgba = image.convert_alpha()
+    raw = pygame.image.tobytes(rgba, "RGBA")
+    alpha = raw[3::4]
+    
+    if not alpha or min(alpha) == 255:
+        return image.convert(), FORMAT_OPAQUE
+    
+    # Alpha binário: só valores 0 e 255
+    if not alpha.translate(None, b"\x00\xff"):
+        colorkey = _find_unused_color(raw)
+        if colorkey:
+            opaque = pygame.Surface(rgba.get_size()).convert()
+            opaque.fill(colorkey)
+            opaque.blit(rgba, (0, 0))
+            opaque.set_colorkey(colorkey, pygame.RLEACCEL)
+            return opaque, FORMAT_COLORKEY
+    
+    return rgba, FORMAT_ALPHA
+
+def surface_format(surface):
+    """
+    Identifica o formato de uma superfície já convertida
+    
+    Args:
+        surface: Superfície pygame
+    
+    Returns:
+        str: FORMAT_OPAQUE, FORMAT_COLORKEY ou FORMAT_ALPHA
+    """
+    if surface.get_flags() & pygame.SRCALPHA:
+        return FORMAT_ALPHA
+    if surface.get_colorkey() is not None:
+        return FORMAT_COLORKEY
+    return FORMAT_OPAQUE
+
+def _find_unused_color(raw):
+    """
+    Procura uma cor de COLORKEY_CANDIDATES que não esteja na imagem
+    
+    Args:
+        raw: Bytes RGBA da imagem
+    
+    Returns:
+        tuple ou None: Cor (r, g, b) livre
+    """
+    for color in COLORKEY_CANDIDATES:
+        pattern = bytes(color)
+        position = raw.find(pattern)
+        # Só conta se a ocorrência estiver alinhada a um pixel
+        while position != -1 and position % 4 != 0:
+            position = raw.find(pattern, position + 1)
+        if position == -1:
+            return color
+    return None
 
 class AssetManager:
     """Carrega e gerencia todos os assets do jogo"""
     
-    def __init__(self):
+    def __init__(self, memory_budget_mb=SURFACE_MEMORY_BUDGET_MB):
+        """
+        Args:
+            memory_budget_mb: Limite de memória (MB) das superfícies entregues
+        """
         self.images = {}
         self.sounds = {}
         self.base_path = Path("assets")
         self.music_loaded = False
-        self._load_all_assets()
-    
-    def _load_all_assets(self):
-        """Carrega todos os assets necessários"""
-        self._load_images()
-        self._load_music()
-    
-    def _load_images(self):
-        """Carrega todas as imagens"""
-        image_files = {
-            # Menu principal
-            'main_menu_bg': 'images/menu-complete.png',
-            'menu_button': 'images/menu_button-menu.png',
-            'options_button': 'images/option_button-menu.png',
-            'start_button': 'images/start-button-menu.png',
-            
-            # Menu de seleção de jogos
-            'selection_menu_bg': 'images/poker-menu-background.png',
-            'poker_icon': 'images/poker-icon.png',
-            'paciencia_icon': 'images/paciencia_icon.PNG',
-            'jogo_da_velha_icon': 'images/jogo_da_velha_icon.PNG',
-            'blackjack_icon': 'images/blackjack_icon.PNG',
-            'arrow_left': 'images/arrow-left.png',
-            'arrow_right': 'images/arrow-right.png',
-            'back_arrow': 'images/back-arrow.png',
-            # Loading screen
-            'loading_screen_bg': 'images/loading-screen.png',
-        }
         
-        print("\n📦 Carregando assets...")
+        # Metadados de cada imagem carregada: formato escolhido e tamanho
+        self.image_info = {}
+        
+        # Cópias no tamanho de exibição: (chave, tamanho) -> superfície
+        self.scaled_images = {}
         
-        for key, filename in image_files.items():
-            path = self.base_path / filename
-            
-            if not path.exists():
-                print(f"⚠ Arquivo não encontrado: {filename}")
-                print(f"   Caminho procurado: {path.absolute()}")
-                self.images[key] = self._create_placeholder(key, filename)
-                continue
-            
-            try:
-                self.images[key] = pygame.image.load(str(path)).convert_alpha()
-                size = self.images[key].get_size()
-                print(f"✓ Carregado: {filename} ({size[0]}x{size[1]})")
-            except pygame.error as e:
-                print(f"✗ Erro ao carregar {filename}: {e}")
-                self.images[key] = self._create_placeholder(key, filename)
+        # Contabilidade de memória: id(superfície) -> registro
+        self.surface_records = {}
+        self.memory_budget = int(memory_budget_mb * 1024 * 1024)
+        self.current_owner = "boot"
+        self.budget_warning_shown = False
         
+        # smoothscale nas cópias escalonadas (desligado nos níveis de qualidade baixos)
+        self._smooth_scaling = False
+    
+    @property
+    def smooth_scaling(self):
+        """bool: Se as cópias escalonadas usam smoothscale"""
+        return self._smooth_scaling
+    
+    @smooth_scaling.setter
+    def smooth_scaling(self, enabled):
+        # As cópias em cache usam o filtro anterior: esvazia o cache para que os
+        # próximos pedidos usem o novo (quem já guarda uma cópia fica com ela)
+        if enabled != self._smooth_scaling:
+            self._smooth_scaling = enabled
+            self.scaled_images.clear()
+    
+    def preload_images(self, keys):
+        """
+        Carrega antecipadamente um conjunto de imagens
+        
+        Args:
+            keys: Chaves de IMAGE_FILES
+        """
+        print("\n📦 Carregando assets...")
+        for key in keys:
+            self.get_image(key)
         print("")
     
-    def _load_music(self):
-        """Carrega a música do menu"""
-        music_path = self.base_path / "sounds/music/fliperama-main-menu-sound.mp3"
+    def _load_image(self, key):
+        """
+        Carrega uma imagem de IMAGE_FILES (ou um placeholder se falhar)
+        
+        Args:
+            key: Chave da imagem
+        """
+        filename = IMAGE_FILES[key]
+        path = self.base_path / filename
+        
+        if not path.exists():
+            print(f"⚠ Arquivo não encontrado: {filename}")
+            print(f"   Caminho procurado: {path.absolute()}")
+            self.images[key] = self._create_placeholder(key, filename)
+            self.image_info[key] = {'format': FORMAT_ALPHA, 'size': self.images[key].get_size()}
+            self.track_surface(self.images[key], key)
+            return
+        
+        try:
+            loaded = pygame.image.load(str(path))
+            if key in TRIMMED_IMAGES:
+                loaded = loaded.subsurface(loaded.get_bounding_rect()).copy()
+            image, image_format = optimize_surface(loaded)
+            self.images[key] = image
+            self.image_info[key] = {'format': image_format, 'size': image.get_size()}
+            size = image.get_size()
+            print(f"✓ Carregado: {filename} ({size[0]}x{size[1]}, {image_format})")
+        except pygame.error as e:
+            print(f"✗ Erro ao carregar {filename}: {e}")
+            self.images[key] = self._create_placeholder(key, filename)
+            self.image_info[key] = {'format': FORMAT_ALPHA, 'size': self.images[key].get_size()}
+        
+        self.track_surface(self.images[key], key)
+    
+    def load_music(self):
+        """Carrega a música do menu (requer o mixer inicializado)"""
+        music_path = self.base_path / MUSIC_FILE
         
         if not music_path.exists():
             print(f"⚠ Música não encontrada: {music_path}")
@@ -86,7 +227,7 @@ class AssetManager:
         Args:
             key: Chave do asset
             filename: Nome do arquivo original
-            
+        
         Returns:
             pygame.Surface: Superfície placeholder
         """
@@ -114,7 +255,10 @@ class AssetManager:
         # Borda branca
         pygame.draw.rect(surface, (255, 255, 255), surface.get_rect(), 3)
         
-        # Texto com o nome do arquivo
+        # Texto com o nome do arquivo (a fonte pode ainda não estar inicializada no boot)
+        if not pygame.font.get_init():
+            return surface
+        
         font = pygame.font.Font(None, 24)
         text_lines = [
             key.upper(),
@@ -136,27 +280,218 @@ class AssetManager:
         
         Args:
             key: Chave da imagem
-            
+        
         Returns:
             pygame.Surface ou None: A imagem ou None se não existir
         """
-        return self.images.get(key)
+        if key not in self.images and key in IMAGE_FILES:
+            # Primeiro uso (ou original descartado pelo limite de memória)
+            self._load_image(key)
+            self._enforce_budget(keep=key)
+        
+        image = self.images.get(key)
+        if image:
+            self._touch_surface(image)
+        return image
     
     def get_scaled_image(self, key, new_size):
         """
         Retorna uma versão escalonada de uma imagem
         
+        A cópia é guardada em cache: chamadas com o mesmo tamanho devolvem a
+        mesma superfície, então ela não deve ser modificada por quem a recebe.
+        
         Args:
             key: Chave da imagem
             new_size: Tupla (largura, altura)
-            
+        
         Returns:
             pygame.Surface ou None: Imagem escalonada ou None
         """
+        cache_key = (key, tuple(new_size))
+        scaled = self.scaled_images.get(cache_key)
+        if scaled:
+            self._touch_surface(scaled)
+            return scaled
+        
         original = self.get_image(key)
-        if original:
-            return pygame.transform.scale(original, new_size)
-        return None
+        if not original:
+            return None
+        
+        scaled = self._scale(original, new_size)
+        original = None  # Sem referência local: o original pode ser liberado pelo limite
+        self.scaled_images[cache_key] = scaled
+        self.track_surface(scaled, f"{key}@{new_size[0]}x{new_size[1]}")
+        self._enforce_budget(keep=key)
+        return scaled
+    
+    def _scale(self, image, new_size, smooth=None):
+        """
+        Escala com smoothscale quando permitido, senão com scale
+        
+        Args:
+            image: Superfície de origem
+            new_size: Tupla (largura, altura)
+            smooth: Força o modo (None segue smooth_scaling)
+        
+        Returns:
+            pygame.Surface: Nova superfície
+        """
+        if smooth is None:
+            smooth = self.smooth_scaling
+        
+        # smoothscale só aceita 24/32 bits, misturaria a cor do colorkey nas bordas
+        # e borraria a pixel art ao ampliar: só é usado para reduzir
+        width, height = image.get_size()
+        shrinking = new_size[0] <= width and new_size[1] <= height
+        if smooth and shrinking and image.get_bitsize() in (24, 32) and image.get_colorkey() is None:
+            return pygame.transform.smoothscale(image, new_size)
+        return pygame.transform.scale(image, new_size)
+    
+    def set_owner(self, owner):
+        """
+        Define a quem são atribuídas as próximas superfícies entregues
+        
+        Args:
+            owner: Nome da cena (ex.: SceneType.value)
+        """
+        self.current_owner = owner
+    
+    def track_surface(self, surface, label):
+        """
+        Registra uma superfície na contabilidade de memória
+        
+        Usado para as superfícies dos assets e também para as criadas fora
+        deles (quadros de hover dos botões, cartas desenhadas pelas cenas).
+        O registro só some quando a superfície é liberada, então uma imagem
+        tirada do cache mas ainda usada por uma cena continua contada.
+        
+        Args:
+            surface: Superfície a contabilizar
+            label: Descrição (chave e tamanho)
+        """
+        surface_id = id(surface)
+        if surface_id in self.surface_records:
+            return
+        self.surface_records[surface_id] = {
+            'label': label,
+            'bytes': surface.get_pitch() * surface.get_height(),
+            'size': surface.get_size(),
+            'format': surface_format(surface),
+            'owner': self.current_owner,
+            'last_used': time.monotonic(),
+        }
+        weakref.finalize(surface, self.surface_records.pop, surface_id, None)
+    
+    def _touch_surface(self, surface):
+        """Atualiza o último uso de uma superfície"""
+        record = self.surface_records.get(id(surface))
+        if record:
+            record['last_used'] = time.monotonic()
+    
+    @property
+    def memory_used(self):
+        """int: Bytes ocupados pelas superfícies vivas entregues pelos assets"""
+        return sum(record['bytes'] for record in self.surface_records.values())
+    
+    def _enforce_budget(self, keep=None):
+        """
+        Mantém a memória dentro do limite
+        
+        1. Descarta originais (do menos usado para o mais usado) que já
+           têm cópia no tamanho de exibição; voltam do disco se pedidos.
+        2. Reduz originais maiores que a tela para o tamanho da tela.
+        
+        Chamar sem referências locais às superfícies: um original descartado
+        ou reduzido sai da contabilidade quando é liberado (na hora, se
+        nenhuma cena o guardou).
+        
+        Args:
+            keep: Chave da imagem sendo entregue agora (nunca descartada)
+        """
+        if self.memory_used <= self.memory_budget:
+            return
+        
+        scaled_keys = {key for key, _ in self.scaled_images}
+        evictable = [key for key in self.images
+                     if key in scaled_keys and key in IMAGE_FILES and key != keep]
+        evictable.sort(key=lambda key: self._last_used(self.images[key]))
+        
+        for key in evictable:
+            del self.images[key]
+            print(f"♻ Original descartado (limite de memória): {key}")
+            if self.memory_used <= self.memory_budget:
+                return
+        
+        display = pygame.display.get_surface()
+        if display:
+            display_w, display_h = display.get_size()
+            for key in list(self.images):
+                width, height = self.images[key].get_size()
+                if width > display_w or height > display_h:
+                    ratio = min(display_w / width, display_h / height)
+                    new_size = (max(1, int(width * ratio)), max(1, int(height * ratio)))
+                    self.images[key] = self._scale(self.images[key], new_size, smooth=True)
+                    self.track_surface(self.images[key], key)
+                    if key in self.image_info:
+                        self.image_info[key]['size'] = new_size
+                    print(f"♻ Original reduzido para {new_size[0]}x{new_size[1]}: {key}")
+                    if self.memory_used <= self.memory_budget:
+                        return
+        
+        if not self.budget_warning_shown:
+            print(f"⚠ Memória de superfícies acima do limite: {self.memory_used / 1048576:.1f} MB")
+            self.budget_warning_shown = True
+    
+    def _last_used(self, surface):
+        """Retorna o último uso registrado de uma superfície"""
+        record = self.surface_records.get(id(surface))
+        return record['last_used'] if record else 0.0
+    
+    def memory_report(self):
+        """
+        Retorna o uso de memória das superfícies
+        
+        Returns:
+            dict: total_bytes, budget_bytes, surface_count, by_owner
+                (bytes por cena) e surfaces (registros, maiores primeiro)
+        """
+        now = time.monotonic()
+        cached_ids = {id(surface) for surface in self.images.values()}
+        cached_ids.update(id(surface) for surface in self.scaled_images.values())
+        
+        surfaces = []
+        by_owner = {}
+        for surface_id, record in self.surface_records.items():
+            by_owner[record['owner']] = by_owner.get(record['owner'], 0) + record['bytes']
+            surfaces.append({
+                'label': record['label'],
+                'bytes': record['bytes'],
+                'size': record['size'],
+                'format': record['format'],
+                'owner': record['owner'],
+                'idle_seconds': now - record['last_used'],
+                'cached': surface_id in cached_ids,
+            })
+        surfaces.sort(key=lambda entry: entry['bytes'], reverse=True)
+        
+        return {
+            'total_bytes': sum(entry['bytes'] for entry in surfaces),
+            'budget_bytes': self.memory_budget,
+            'surface_count': len(surfaces),
+            'by_owner': by_owner,
+            'surfaces': surfaces,
+        }
+    
+    def print_memory_report(self):
+        """Imprime o relatório de memória no console"""
+        report = self.memory_report()
+        print(f"\n🧠 Superfícies: {report['surface_count']} | "
+              f"{report['total_bytes'] / 1048576:.1f} MB de {report['budget_bytes'] / 1048576:.0f} MB")
+        for owner, used in sorted(report['by_owner'].items(), key=lambda item: -item[1]):
+            print(f"   {owner:<20} {used / 1048576:7.2f} MB")
+        for entry in report['surfaces']:
+            print(f"   {entry['label']:<36} {entry['bytes'] / 1024:9.0f} KB  {entry['format']:<8} {entry['owner']}")
     
     def play_music(self, loops=-1, volume=0.5):
         """
@@ -165,11 +500,11 @@ class AssetManager:
         Args:
             loops: Número de repetições (-1 = infinito)
             volume: Volume (0.0 a 1.0)
-            
+        
         Returns:
             bool: True se conseguiu tocar
         """
-        if self.music_loaded:
+        if self.music_loaded and pygame.mixer.get_init():
             pygame.mixer.music.play(loops=loops)
             pygame.mixer.music.set_volume(volume)
             return True
@@ -177,15 +512,18 @@ class AssetManager:
     
     def stop_music(self):
         """Para a música"""
-        pygame.mixer.music.stop()
+        if pygame.mixer.get_init():
+            pygame.mixer.music.stop()
     
     def pause_music(self):
         """Pausa a música"""
-        pygame.mixer.music.pause()
+        if pygame.mixer.get_init():
+            pygame.mixer.music.pause()
     
     def unpause_music(self):
         """Retoma a música pausada"""
-        pygame.mixer.music.unpause()
+        if pygame.mixer.get_init():
+            pygame.mixer.music.unpause()
     
     def set_music_volume(self, volume):
         """
@@ -194,7 +532,8 @@ class AssetManager:
         Args:
             volume: Volume (0.0 a 1.0)
         """
-        pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
+        if pygame.mixer.get_init():
+            pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
     
     def get_music_volume(self):
         """
@@ -203,4 +542,6 @@ class AssetManager:
         Returns:
             float: Volume (0.0 a 1.0)
         """
+        if not pygame.mixer.get_init():
+            return 0.0
         return pygame.mixer.music.get_volume()
\ No newline at end of file
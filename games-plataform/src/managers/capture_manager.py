@@ -0,0 +1,297 @@
+"""
+capture_manager.py - Capturas de tela e gravação contínua de clipes
+
+Logo após pygame.display.flip() a thread do jogo só copia a tela para um
+buffer pré-alocado (reduzido para o tamanho do clipe) e o entrega a uma
+thread de trabalho, que comprime o quadro e o guarda num anel em memória
+com os últimos segundos de jogo. Salvar o clipe só copia a lista do anel:
+a gravação dos arquivos também acontece na thread de trabalho.
+
+Os clipes são salvos como sequência de PNGs + clip.json. Para gerar um vídeo:
+    ffmpeg -framerate 15 -i frame_%04d.png clip.mp4
+"""
+import collections
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+import numpy as np
+import pygame
+from src.utils.constants import (
+    CAPTURE_DIR, CLIP_SECONDS, CLIP_FPS, CLIP_WIDTH, CAPTURE_BUFFER_POOL,
+)
+
+# Tarefas da thread de trabalho
+JOB_FRAME = 0
+JOB_SCREENSHOT = 1
+JOB_CLIP = 2
+
+class CaptureManager:
+    """Screenshots e anel de quadros recentes, processados fora do loop principal"""
+    
+    def __init__(self, screen, output_dir=CAPTURE_DIR, clip_seconds=CLIP_SECONDS, clip_fps=CLIP_FPS,
+                 clip_width=CLIP_WIDTH, pool_size=CAPTURE_BUFFER_POOL, recording=True):
+        """
+        Args:
+            screen: Superfície do display (define formato e proporção dos buffers)
+            output_dir: Pasta onde screenshots e clipes são salvos
+            clip_seconds: Duração do anel de quadros recentes
+            clip_fps: Quadros por segundo gravados no anel
+            clip_width: Largura dos quadros do clipe (altura segue a proporção da tela)
+            pool_size: Buffers pré-alocados para quadros em trânsito
+            recording: Se o anel começa gravando
+        """
+        self.output_dir = output_dir
+        self.clip_fps = clip_fps
+        self.frame_interval = 1.0 / clip_fps
+        width, height = screen.get_size()
+        self.frame_size = (clip_width, round(clip_width * height / width))
+        
+        # Buffers no mesmo formato da tela: transform.scale escreve direto neles
+        self.free_buffers = queue.SimpleQueue()
+        for _ in range(pool_size):
+            self.free_buffers.put(pygame.Surface(self.frame_size, 0, screen))
+        self.screenshot_buffer = None  # Tamanho cheio, criado no primeiro screenshot
+        self.screenshot_busy = False
+        self.screenshot_requested = False
+        
+        # Anel de quadros comprimidos: (instante, linhas do PNG já comprimidas)
+        self.ring = collections.deque(maxlen=clip_seconds * clip_fps)
+        self.ring_lock = threading.Lock()
+        self.ring_bytes = 0
+        
+        self.recording = recording
+        self.paused = False  # Pausa temporária do anel (nível de qualidade mínimo)
+        self.next_frame_time = 0.0
+        self.jobs = queue.SimpleQueue()
+        self.worker = None
+        
+        # Custo na thread do jogo (ms por chamada de after_flip)
+        self.frame_costs = collections.deque(maxlen=600)
+        self.frames_captured = 0
+        self.frames_dropped = 0
+    
+    def _start_worker(self):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._worker_loop, name="capture-worker", daemon=True)
+            self.worker.start()
+    
+    def toggle_recording(self):
+        """Liga/desliga o anel de quadros recentes"""
+        self.recording = not self.recording
+        if self.recording:
+            print(f"⏺  Gravação contínua ligada (últimos {self.ring.maxlen // self.clip_fps}s)")
+        else:
+            with self.ring_lock:
+                self.ring.clear()
+                self.ring_bytes = 0
+            print("⏹  Gravação contínua desligada")
+    
+    def request_screenshot(self):
+        """Agenda uma captura do próximo frame completo (feita em after_flip)"""
+        self.screenshot_requested = True
+    
+    def after_flip(self, screen):
+        """
+        Copia a tela para os buffers (chamar logo após pygame.display.flip)
+        
+        Args:
+            screen: Superfície do display
+        """
+        start = time.perf_counter()
+        
+        if self.screenshot_requested:
+            self.screenshot_requested = False
+            self._capture_screenshot(screen)
+        
+        if self.recording and not self.paused and start >= self.next_frame_time:
+            # Mantém o ritmo do clipe sem acumular atraso após frames lentos
+            self.next_frame_time = max(self.next_frame_time + self.frame_interval, start)
+            try:
+                buffer = self.free_buffers.get_nowait()
+            except queue.Empty:
+                # Thread de trabalho atrasada: descarta o quadro em vez de esperar
+                self.frames_dropped += 1
+            else:
+                pygame.transform.scale(screen, self.frame_size, buffer)
+                self._start_worker()
+                self.jobs.put((JOB_FRAME, buffer, time.time()))
+                self.frames_captured += 1
+        
+        self.frame_costs.append((time.perf_counter() - start) * 1000)
+    
+    def _capture_screenshot(self, screen):
+        """Copia a tela inteira para o buffer de screenshot"""
+        if self.screenshot_busy:
+            print("✗ Screenshot anterior ainda sendo salvo")
+            return
+        if self.screenshot_buffer is None or self.screenshot_buffer.get_size() != screen.get_size():
+            self.screenshot_buffer = pygame.Surface(screen.get_size(), 0, screen)
+        self.screenshot_buffer.blit(screen, (0, 0))
+        self.screenshot_busy = True
+        
+        path = os.path.join(self.output_dir, f"screenshot_{_timestamp()}.png")
+        self._start_worker()
+        self.jobs.put((JOB_SCREENSHOT, self.screenshot_buffer, path))
+    
+    def save_clip(self):
+        """
+        Salva os últimos segundos gravados (instantâneo: só copia o anel)
+        
+        Returns:
+            str ou None: Pasta do clipe (gravada em segundo plano)
+        """
+        with self.ring_lock:
+            frames = list(self.ring)
+        if not frames:
+            print("✗ Nenhum quadro gravado ainda")
+            return None
+        
+        path = os.path.join(self.output_dir, f"clip_{_timestamp()}")
+        self._start_worker()
+        self.jobs.put((JOB_CLIP, frames, path))
+        print(f"🎬 Salvando clipe ({len(frames)} quadros, {frames[-1][0] - frames[0][0]:.1f}s) em {path}")
+        self.print_timing()
+        return path
+    
+    def timing_report(self):
+        """
+        Returns:
+            dict: Custo na thread do jogo (média, p99 e máximo em ms),
+                quadros capturados/descartados e tamanho do anel
+        """
+        costs = sorted(self.frame_costs)
+        return {
+            'avg_ms': sum(costs) / len(costs) if costs else 0.0,
+            'p99_ms': costs[int(len(costs) * 0.99)] if costs else 0.0,
+            'max_ms': costs[-1] if costs else 0.0,
+            'captured': self.frames_captured,
+            'dropped': self.frames_dropped,
+            'ring_frames': len(self.ring),
+            'ring_bytes': self.ring_bytes,
+        }
+    
+    def print_timing(self):
+        """Mostra o custo da captura na thread do jogo"""
+        report = self.timing_report()
+        print(f"⏱  Captura na thread do jogo: média {report['avg_ms']:.3f} ms, p99 {report['p99_ms']:.3f} ms, "
+              f"máx {report['max_ms']:.3f} ms | {report['captured']} quadros, {report['dropped']} descartados, "
+              f"anel {report['ring_frames']} quadros ({report['ring_bytes'] / 1048576:.1f} MB)")
+    
+    def close(self):
+        """Termina as gravações pendentes e encerra a thread de trabalho"""
+        if self.worker is not None:
+            self.jobs.put(None)
+            self.worker.join(timeout=30.0)
+            self.worker = None
+    
+    def _worker_loop(self):
+        """Comprime quadros e grava arquivos, na ordem em que chegam"""
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            kind, payload, extra = job
+            try:
+                if kind == JOB_FRAME:
+                    self._store_frame(payload, extra)
+                elif kind == JOB_SCREENSHOT:
+                    self._write_screenshot(payload, extra)
+                elif kind == JOB_CLIP:
+                    self._write_clip(payload, extra)
+            except (OSError, pygame.error) as e:
+                print(f"✗ Erro na captura: {e}")
+    
+    def _store_frame(self, buffer, timestamp):
+        """Comprime o quadro, devolve o buffer ao pool e guarda no anel"""
+        rows = _png_rows(buffer)
+        self.free_buffers.put(buffer)
+        compressed = zlib.compress(rows, 1)
+        
+        with self.ring_lock:
+            if len(self.ring) == self.ring.maxlen:
+                self.ring_bytes -= len(self.ring[0][1])
+            self.ring.append((timestamp, compressed))
+            self.ring_bytes += len(compressed)
+    
+    def _write_screenshot(self, buffer, path):
+        try:
+            rows = _png_rows(buffer)
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(_png_file(buffer.get_size(), zlib.compress(rows, 6)))
+            print(f"📸 Screenshot salvo: {path}")
+        finally:
+            self.screenshot_busy = False
+    
+    def _write_clip(self, frames, path):
+        """Grava os quadros do clipe como PNGs numerados + clip.json"""
+        os.makedirs(path, exist_ok=True)
+        for index, (_, compressed) in enumerate(frames):
+            # Os quadros do anel já estão no formato do PNG: só falta o cabeçalho
+            with open(os.path.join(path, f"frame_{index:04d}.png"), "wb") as f:
+                f.write(_png_file(self.frame_size, compressed))
+        
+        info = {
+            'fps': self.clip_fps,
+            'size': list(self.frame_size),
+            'frames': len(frames),
+            'duration': frames[-1][0] - frames[0][0],
+        }
+        with open(os.path.join(path, "clip.json"), "w", encoding="utf-8") as f:
+            json.dump(info, f, indent=4)
+        print(f"✓ Clipe salvo: {path}")
+
+
+def _png_rows(surface):
+    """
+    Linhas RGB da superfície no formato do PNG (um byte de filtro 0 por linha)
+    
+    Lê o buffer da superfície com numpy em vez de usar pygame.image.tobytes/save,
+    que seguram o GIL durante toda a conversão e travariam a thread do jogo.
+    
+    Returns:
+        np.ndarray: Matriz (altura, 1 + largura * 3) de bytes
+    """
+    width, height = surface.get_size()
+    rows = np.zeros((height, 1 + width * 3), np.uint8)
+    rgb = rows[:, 1:].reshape(height, width, 3)
+    
+    if surface.get_bytesize() == 4 and sys.byteorder == 'little':
+        proxy = surface.get_buffer()
+        pixels = np.frombuffer(proxy, np.uint8).reshape(height, surface.get_pitch())
+        pixels = pixels[:, :width * 4].reshape(height, width, 4)
+        for channel, shift in enumerate(surface.get_shifts()[:3]):
+            rgb[..., channel] = pixels[..., shift // 8]
+        # Libera o lock da superfície antes de devolvê-la ao pool
+        del pixels, proxy
+    else:
+        rgb[...] = np.frombuffer(pygame.image.tobytes(surface, 'RGB'), np.uint8).reshape(height, width, 3)
+    return rows
+
+def _png_chunk(tag, data):
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+def _png_file(size, compressed_rows):
+    """
+    Monta um PNG RGB de 8 bits a partir das linhas já comprimidas
+    
+    Args:
+        size: (largura, altura)
+        compressed_rows: Saída de zlib.compress(_png_rows(...))
+    
+    Returns:
+        bytes: Arquivo PNG completo
+    """
+    header = struct.pack(">IIBBBBB", size[0], size[1], 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", compressed_rows) + _png_chunk(b"IEND", b""))
+
+def _timestamp():
+    """Nome de arquivo com data e hora (até milissegundos)"""
+    now = time.time()
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime(now)) + f"_{int(now * 1000) % 1000:03d}"
@@ -0,0 +1,165 @@
+"""
+quality_manager.py - Governador automático de qualidade gráfica
+
+Observa uma janela móvel com o tempo de trabalho de cada frame (o que o
+clock.tick mede antes de esperar) e troca o nível de qualidade: desce um
+nível quando o p90 da janela passa do limite e só volta a subir depois de
+uma folga sustentada. Os limites de descida e subida são diferentes e a
+espera para subir dobra sempre que uma subida é desfeita logo em seguida,
+então a qualidade não fica oscilando entre dois níveis.
+"""
+import collections
+from src.utils.constants import (
+    QUALITY_FRAME_BUDGET_MS, QUALITY_WINDOW, QUALITY_CHECK_INTERVAL,
+    QUALITY_DOWNGRADE_RATIO, QUALITY_UPGRADE_RATIO, QUALITY_UPGRADE_DELAY,
+    QUALITY_UPGRADE_DELAY_MAX, QUALITY_UPGRADE_PROBATION,
+)
+
+# Modos de transição entre cenas
+TRANSITION_FULL = "full"  # Fade/slide compondo os snapshots
+TRANSITION_CHEAP = "cheap"  # Troca seca na metade da transição
+TRANSITION_OFF = "off"  # Troca direta, sem snapshots
+
+# Níveis do mais barato ao mais bonito (o índice é o nível)
+QUALITY_TIERS = [
+    {'name': 'mínima', 'smooth_scaling': False, 'particles': 0.0,
+     'transition': TRANSITION_OFF, 'clip_recorder': False},
+    {'name': 'baixa', 'smooth_scaling': False, 'particles': 0.25,
+     'transition': TRANSITION_OFF, 'clip_recorder': True},
+    {'name': 'média', 'smooth_scaling': False, 'particles': 0.5,
+     'transition': TRANSITION_CHEAP, 'clip_recorder': True},
+    {'name': 'alta', 'smooth_scaling': True, 'particles': 1.0,
+     'transition': TRANSITION_FULL, 'clip_recorder': True},
+]
+
+QUALITY_NAMES = [tier['name'] for tier in QUALITY_TIERS]
+
+def tier_index(name, default=len(QUALITY_TIERS) - 1):
+    """
+    Índice do nível com o nome dado
+    
+    Args:
+        name: Nome do nível (ex.: lido de config/settings.json)
+        default: Nível usado se o nome for desconhecido
+    
+    Returns:
+        int: Índice em QUALITY_TIERS
+    """
+    return QUALITY_NAMES.index(name) if name in QUALITY_NAMES else default
+
+class QualityManager:
+    """Escolhe o nível de qualidade a partir do tempo dos frames"""
+    
+    def __init__(self, tier=len(QUALITY_TIERS) - 1, auto=True, on_change=None,
+                 budget_ms=QUALITY_FRAME_BUDGET_MS, window=QUALITY_WINDOW):
+        """
+        Args:
+            tier: Nível inicial (índice em QUALITY_TIERS)
+            auto: Se False, o nível fica fixo
+            on_change: Função chamada com o novo nível (dict de QUALITY_TIERS)
+            budget_ms: Orçamento de um frame em ms
+            window: Quantidade de frames na janela móvel
+        """
+        self.tier = max(0, min(len(QUALITY_TIERS) - 1, tier))
+        self.auto = auto
+        self.on_change = on_change
+        self.budget_ms = budget_ms
+        self.frame_times = collections.deque(maxlen=window)
+        
+        # Hysteresis: espera (em frames) antes de tentar subir de nível
+        self.upgrade_delay = QUALITY_UPGRADE_DELAY
+        self.frames_since_change = 0
+        self.last_change_was_upgrade = False
+        
+        # Último p90 avaliado e histórico das decisões (overlay/benchmark)
+        self.p90 = 0.0
+        self.decisions = []
+    
+    @property
+    def current(self):
+        """dict: Configuração do nível atual"""
+        return QUALITY_TIERS[self.tier]
+    
+    @property
+    def name(self):
+        """str: Nome do nível atual"""
+        return QUALITY_NAMES[self.tier]
+    
+    def record(self, frame_ms):
+        """
+        Registra o tempo de um frame e decide se troca de nível
+        
+        Args:
+            frame_ms: Tempo de trabalho do frame em ms (clock.get_rawtime())
+        """
+        self.frame_times.append(frame_ms)
+        self.frames_since_change += 1
+        
+        # Só decide com a janela cheia de frames medidos no nível atual
+        if not self.auto or len(self.frame_times) < self.frame_times.maxlen:
+            return
+        if self.frames_since_change % QUALITY_CHECK_INTERVAL:
+            return
+        
+        self.p90 = self.percentile(90)
+        
+        if self.p90 > self.budget_ms * QUALITY_DOWNGRADE_RATIO and self.tier > 0:
+            if self.last_change_was_upgrade and self.frames_since_change < QUALITY_UPGRADE_PROBATION:
+                # A subida anterior não se sustentou: espera mais antes da próxima
+                self.upgrade_delay = min(self.upgrade_delay * 2, QUALITY_UPGRADE_DELAY_MAX)
+            self._change(self.tier - 1, f"p90 {self.p90:.1f} ms acima de "
+                                        f"{self.budget_ms * QUALITY_DOWNGRADE_RATIO:.1f} ms")
+        
+        elif (self.p90 < self.budget_ms * QUALITY_UPGRADE_RATIO and self.tier < len(QUALITY_TIERS) - 1
+                and self.frames_since_change >= self.upgrade_delay):
+            self._change(self.tier + 1, f"p90 {self.p90:.1f} ms abaixo de "
+                                        f"{self.budget_ms * QUALITY_UPGRADE_RATIO:.1f} ms "
+                                        f"por {self.frames_since_change} frames")
+        
+        elif self.last_change_was_upgrade and self.frames_since_change >= QUALITY_UPGRADE_PROBATION:
+            # Subida confirmada: volta à espera normal
+            self.upgrade_delay = QUALITY_UPGRADE_DELAY
+            self.last_change_was_upgrade = False
+    
+    def percentile(self, percent):
+        """
+        Percentil dos tempos na janela
+        
+        Args:
+            percent: 0 a 100
+        
+        Returns:
+            float: Tempo em ms (0 se a janela estiver vazia)
+        """
+        if not self.frame_times:
+            return 0.0
+        ordered = sorted(self.frame_times)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+    
+    def set_tier(self, tier, reason="manual"):
+        """
+        Força um nível (ex.: configuração ou teste)
+        
+        Args:
+            tier: Índice em QUALITY_TIERS
+            reason: Motivo registrado no log
+        """
+        tier = max(0, min(len(QUALITY_TIERS) - 1, tier))
+        if tier != self.tier:
+            self._change(tier, reason)
+    
+    def _change(self, tier, reason):
+        """Troca de nível, registra a decisão e recomeça a janela"""
+        previous = self.name
+        self.last_change_was_upgrade = tier > self.tier
+        self.tier = tier
+        self.frames_since_change = 0
+        self.frame_times.clear()
+        
+        self.decisions.append((previous, self.name, reason))
+        arrow = "⬆" if self.last_change_was_upgrade else "⬇"
+        print(f"{arrow}  Qualidade {previous} → {self.name} ({reason}; "
+              f"próxima subida após {self.upgrade_delay} frames)")
+        
+        if self.on_change:
+            self.on_change(self.current)
@@ -1,14 +1,25 @@
 """
 scene_manager.py - Gerenciador de cenas e transições
 """
-import pygame
-from src.utils.constants import SceneType, TRANSITION_SPEED
-from src.scenes.main_menu_scene import MainMenuScene
-from src.scenes.game_selection_scene import GameSelectionScene
-from src.scenes.games.poker_game_scene import PokerGameScene
-from src.scenes.games.paciencia_game_scene import PacienciaGameScene
-from src.scenes.games.jogo_da_velha_game_scene import JogoDaVelhaGameScene
-from src.scenes.games.blackjack_game_scene import BlackjackGameScene
+import importlib
+import time
+from src.managers.tween_manager import TweenManager
+from src.managers.quality_manager import QUALITY_TIERS, TRANSITION_CHEAP, TRANSITION_OFF
+from src.utils.constants import (
+    SceneType, TransitionType, TRANSITION_SPEED, TRANSITION_FRAME_BUDGET, TRANSITION_COMPOSE_BUDGET,
+    TRANSITION_BUDGET_FRAMES,
+)
+
+# Módulo e classe de cada cena: importados só quando a cena é usada pela primeira vez
+SCENE_CLASSES = {
+    SceneType.MAIN_MENU: ('src.scenes.main_menu_scene', 'MainMenuScene'),
+    SceneType.GAME_SELECTION: ('src.scenes.game_selection_scene', 'GameSelectionScene'),
+    SceneType.RULES: ('src.scenes.rules_scene', 'RulesScene'),
+    SceneType.POKER_GAME: ('src.scenes.games.poker_game_scene', 'PokerGameScene'),
+    SceneType.PACIENCIA_GAME: ('src.scenes.games.paciencia_game_scene', 'PacienciaGameScene'),
+    SceneType.JOGO_DA_VELHA_GAME: ('src.scenes.games.jogo_da_velha_game_scene', 'JogoDaVelhaGameScene'),
+    SceneType.BLACKJACK_GAME: ('src.scenes.games.blackjack_game_scene', 'BlackjackGameScene'),
+}
 
 class SceneManager:
     """Gerencia cenas e transições entre elas"""
@@ -24,10 +35,8 @@ class SceneManager:
         self.scenes = {}
         self.current_scene = None
         
-        # Carrega o background de loading
-        self.loading_background = assets.get_image('loading_screen_bg')
-        if self.loading_background: 
-            self.loading_background = self.loading_background.convert()
+        # Carrega o background de loading (já no tamanho da tela e no formato otimizado)
+        self.loading_background = assets.get_scaled_image('loading_screen_bg', screen.get_size())
         
         # Controle de transição com loading
         self.is_loading = False  
@@ -35,41 +44,149 @@ class SceneManager:
         self.loading_duration = 1.0 
         self.next_scene_type = None  # Qual cena carregar após o loading
         
+        # Controle de transição animada (fade/slide entre snapshots)
+        self.is_transitioning = False
+        self.transition_type = TransitionType.NONE
+        self.transition_progress = 0.0
+        self.outgoing_snapshot = None  # Última imagem da cena que está saindo
+        self.incoming_snapshot = None  # Primeira imagem da cena que está entrando
+        self.cheap_transition = False  # Composição simplificada se estourar o orçamento
+        self.transition_cost = 0.0  # Segundos gastos capturando/compondo esta transição
+        self.transition_frames = 0
+        
+        # Agendador central de animações (um grupo de tweens por cena)
+        self.tweens = TweenManager()
+        
+        # Estatísticas: criadas depois do primeiro frame (ver attach_stats)
+        self.stats = None
+        
+        # Nível de qualidade aplicado às cenas (ver set_quality)
+        self.quality = QUALITY_TIERS[-1]
+        
         self._setup_scenes()
     
     def _setup_scenes(self):
-        """Cria todas as cenas disponíveis"""
-        self.scenes = {
-            SceneType.MAIN_MENU: MainMenuScene(self.screen, self.assets),
-            SceneType.GAME_SELECTION: GameSelectionScene(self.screen, self.assets),
-            SceneType.POKER_GAME: PokerGameScene(self.screen, self.assets),
-            SceneType.PACIENCIA_GAME: PacienciaGameScene(self.screen, self.assets),
-            SceneType.JOGO_DA_VELHA_GAME: JogoDaVelhaGameScene(self.screen, self.assets),
-            SceneType.BLACKJACK_GAME: BlackjackGameScene(self.screen, self.assets),
-        }
-        
+        """Cria a cena inicial (as demais são criadas sob demanda)"""
         # Define cena inicial (SEM loading)
-        self.current_scene = self.scenes[SceneType.MAIN_MENU]
+        self.current_scene = self._get_scene(SceneType.MAIN_MENU)
         self.current_scene.on_enter()
         print(f"✓ Cena inicial: {SceneType.MAIN_MENU.value}")
     
+    def _get_scene(self, scene_type):
+        """
+        Retorna a cena, importando o módulo e criando-a na primeira vez
+        
+        Args:
+            scene_type: Tipo da cena
+        
+        Returns:
+            Scene: Instância da cena
+        """
+        if scene_type not in self.scenes:
+            module_name, class_name = SCENE_CLASSES[scene_type]
+            scene_class = getattr(importlib.import_module(module_name), class_name)
+            
+            # Superfícies pedidas durante a criação são atribuídas à cena
+            self.assets.set_owner(scene_type.value)
+            scene = scene_class(self.screen, self.assets)
+            scene.tweens = self.tweens.group(scene_type)
+            scene.stats = self.stats
+            scene.apply_quality(self.quality)
+            self.scenes[scene_type] = scene
+        
+        return self.scenes[scene_type]
+    
+    def attach_stats(self, stats):
+        """
+        Disponibiliza o StatsManager para as cenas atuais e futuras
+        
+        Args:
+            stats: Instância do StatsManager
+        """
+        self.stats = stats
+        for scene in self.scenes.values():
+            scene.stats = stats
+    
+    def set_quality(self, quality):
+        """
+        Aplica um nível de qualidade às transições e às cenas já criadas
+        
+        Args:
+            quality: dict de QUALITY_TIERS
+        """
+        self.quality = quality
+        for scene in self.scenes.values():
+            scene.apply_quality(quality)
+    
     def change_scene(self, scene_type):
         """
-        Inicia transição para uma nova cena (com tela de loading)
+        Inicia transição para uma nova cena
+        
+        Usa o tipo de transição da cena de destino: FADE/SLIDE compõem
+        snapshots das duas cenas; NONE mantém a tela de loading. Nos níveis
+        de qualidade sem transição, FADE/SLIDE viram troca direta.
         
         Args:
             scene_type: Tipo da cena de destino
         """
-        if scene_type in self.scenes and not self.is_loading:
+        if scene_type in SCENE_CLASSES and not self.is_loading and not self.is_transitioning:
             print(f"🔄 Iniciando transição para: {scene_type.value}")
             
-            # Sai da cena atual
+            # Sai da cena atual e descarta suas animações
             self.current_scene.on_exit()
+            self.current_scene.tweens.clear()
             
-            # Ativa o modo loading
-            self.is_loading = True
-            self.loading_timer = 0
-            self.next_scene_type = scene_type
+            transition_type = self._get_scene(scene_type).transition_type
+            if transition_type == TransitionType.NONE:
+                # Ativa o modo loading
+                self.is_loading = True
+                self.loading_timer = 0
+                self.next_scene_type = scene_type
+            elif self.quality['transition'] == TRANSITION_OFF:
+                self._enter_scene(scene_type)
+                print(f"✓ Troca direta (qualidade {self.quality['name']})")
+            else:
+                self._start_transition(scene_type, transition_type)
+    
+    def _enter_scene(self, scene_type):
+        """
+        Torna a cena atual
+        
+        Args:
+            scene_type: Tipo da cena (já criada por _get_scene)
+        """
+        self.current_scene = self.scenes[scene_type]
+        self.assets.set_owner(scene_type.value)
+        self.current_scene.on_enter()
+    
+    def _start_transition(self, scene_type, transition_type):
+        """
+        Captura a cena atual e prepara a transição animada
+        
+        O snapshot de entrada é capturado no primeiro draw da transição,
+        para não somar os dois renders no mesmo frame.
+        
+        Args:
+            scene_type: Tipo da cena de destino
+            transition_type: TransitionType usado na composição
+        """
+        # A tela ainda contém o último frame desenhado da cena que sai
+        self.outgoing_snapshot = self.screen.copy()
+        self.incoming_snapshot = None
+        
+        self._enter_scene(scene_type)
+        
+        self.is_transitioning = True
+        self.transition_type = transition_type
+        self.transition_progress = 0.0
+        self.cheap_transition = self.quality['transition'] == TRANSITION_CHEAP
+        self.transition_cost = 0.0
+        self.transition_frames = 0
+    
+    def _capture_incoming_snapshot(self):
+        """Desenha a cena de destino uma única vez e guarda o resultado"""
+        self.current_scene.draw()
+        self.incoming_snapshot = self.screen.copy()
     
     def update(self, dt):
         """
@@ -85,27 +202,46 @@ class SceneManager:
             # Verifica se passaram 2 segundos
             if self.loading_timer >= self.loading_duration:
                 self._finish_loading()
+        elif self.is_transitioning:
+            # Limita o passo para que um frame lento (ex.: captura) não pule a animação
+            step = min(dt, TRANSITION_FRAME_BUDGET * 2)
+            self.transition_progress += step * TRANSITION_SPEED
+            
+            if self.transition_progress >= 1.0:
+                self._finish_transition()
         else:
             if self.current_scene.next_scene:
-                self.change_scene(self.current_scene.next_scene)
-                self.current_scene.next_scene = None
+                # Guarda a cena de origem: com transição, current_scene muda aqui dentro
+                leaving_scene = self.current_scene
+                self.change_scene(leaving_scene.next_scene)
+                leaving_scene.next_scene = None
             
-            # Atualiza a cena atual
-            self.current_scene.update(dt)
+            # Atualiza as animações e a cena atual
+            if not self.is_transitioning:
+                self.tweens.update(dt)
+                self.current_scene.update(dt)
     
     def _finish_loading(self):
         """Finaliza o loading e muda para a nova cena"""
         print(f"✓ Loading concluído! Entrando em: {self.next_scene_type.value}")
         
         # Muda para a nova cena
-        self.current_scene = self.scenes[self.next_scene_type]
-        self.current_scene.on_enter()
+        self._enter_scene(self.next_scene_type)
         
         # Desativa o modo loading
         self.is_loading = False
         self.loading_timer = 0
         self.next_scene_type = None
     
+    def _finish_transition(self):
+        """Finaliza a transição e libera os snapshots"""
+        print(f"✓ Transição concluída: {self.transition_type.name}")
+        
+        self.is_transitioning = False
+        self.transition_progress = 0.0
+        self.outgoing_snapshot = None
+        self.incoming_snapshot = None
+    
     def handle_events(self, events):
         """
         Passa eventos para a cena atual
@@ -113,8 +249,8 @@ class SceneManager:
         Args:
             events: Lista de eventos do pygame
         """
-        # Não processa eventos durante loading
-        if not self.is_loading:
+        # Não processa eventos durante loading ou transição
+        if not self.is_loading and not self.is_transitioning:
             self.current_scene.handle_events(events)
     
     def draw(self):
@@ -122,23 +258,69 @@ class SceneManager:
         if self.is_loading:
             # Desenha a tela de loading
             self._draw_loading_screen()
+        elif self.is_transitioning:
+            self._draw_transition()
         else:
             # Desenha a cena atual
             self.current_scene.draw()
     
     def _draw_loading_screen(self):
         """Desenha a tela de loading com o background"""
-        screen_size = self.screen.get_size()
-        
         # Preenche com preto (fallback)
         self.screen.fill((0, 0, 0))
         
         # Desenha o background de loading se disponível
         if self.loading_background:
             try:
-                scaled_bg = pygame.transform.scale(self.loading_background, screen_size)
-                self.screen.blit(scaled_bg, (0, 0))
+                self.screen.blit(self.loading_background, (0, 0))
             except Exception as e:
                 print(f"❌ Erro ao desenhar loading background: {e}")
                 self.screen.fill((120, 80, 200))  # Fallback roxo
-        
\ No newline at end of file
+    
+    def _draw_transition(self):
+        """
+        Compõe a transição a partir dos snapshots (sem redesenhar as cenas)
+        
+        O custo medido inclui a captura do snapshot de entrada (a parte cara,
+        feita no primeiro frame). A média por frame, depois de alguns frames,
+        é comparada com metade do frame: a outra metade fica para o resto do loop.
+        """
+        start = time.perf_counter()
+        
+        if self.incoming_snapshot is None:
+            self._capture_incoming_snapshot()
+        
+        # Suaviza o movimento (smoothstep)
+        t = max(0.0, min(1.0, self.transition_progress))
+        t = t * t * (3 - 2 * t)
+        
+        if self.cheap_transition:
+            # Hardware lento: troca seca na metade da transição
+            snapshot = self.incoming_snapshot if t >= 0.5 else self.outgoing_snapshot
+            self.screen.blit(snapshot, (0, 0))
+        
+        elif self.transition_type == TransitionType.FADE:
+            self.screen.blit(self.outgoing_snapshot, (0, 0))
+            self.incoming_snapshot.set_alpha(int(255 * t))
+            self.screen.blit(self.incoming_snapshot, (0, 0))
+        
+        else:
+            width = self.screen.get_width()
+            offset = int(width * t)
+            if self.transition_type == TransitionType.SLIDE_LEFT:
+                # Nova cena entra pela direita
+                self.screen.blit(self.outgoing_snapshot, (-offset, 0))
+                self.screen.blit(self.incoming_snapshot, (width - offset, 0))
+            else:
+                # Nova cena entra pela esquerda
+                self.screen.blit(self.outgoing_snapshot, (offset, 0))
+                self.screen.blit(self.incoming_snapshot, (offset - width, 0))
+        
+        # Se a média por frame estourar o orçamento, usa a versão simplificada
+        self.transition_cost += time.perf_counter() - start
+        self.transition_frames += 1
+        average = self.transition_cost / self.transition_frames
+        if (self.transition_frames >= TRANSITION_BUDGET_FRAMES and average > TRANSITION_COMPOSE_BUDGET
+                and not self.cheap_transition):
+            print(f"⚠ Transição acima do orçamento ({average * 1000:.1f} ms por frame), usando troca simples")
+            self.cheap_transition = True
@@ -0,0 +1,299 @@
+"""
+stats_manager.py - Estatísticas locais (SQLite) dos resultados das partidas
+
+As cenas só enfileiram resultados: uma thread de fundo grava em lotes
+(uma transação por lote, banco em modo WAL) e mantém a tabela 'totals'
+com os agregados já calculados por jogo e jogador. Assim telas de
+estatísticas e rankings leem poucas linhas indexadas, mesmo com milhões
+de mãos registradas em 'results'.
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from src.utils.constants import (
+    STATS_DB_PATH, STATS_BATCH_SIZE, STATS_FLUSH_INTERVAL,
+    RESULT_WIN, RESULT_LOSS, KIND_HAND,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    outcome INTEGER NOT NULL,
+    amount INTEGER NOT NULL DEFAULT 0,
+    played_at REAL NOT NULL,
+    details TEXT
+);
+CREATE INDEX IF NOT EXISTS results_by_game ON results (game, played_at);
+CREATE INDEX IF NOT EXISTS results_by_player ON results (game, player, played_at);
+
+CREATE TABLE IF NOT EXISTS totals (
+    game TEXT NOT NULL,
+    player TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    played INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    best_streak INTEGER NOT NULL,
+    last_played REAL NOT NULL,
+    PRIMARY KEY (game, kind, player)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS totals_leaderboard ON totals (game, kind, wins DESC);
+"""
+
+TOTALS_COLUMNS = ("game", "player", "kind", "played", "wins", "losses", "draws",
+                  "amount", "streak", "best_streak", "last_played")
+
+class StatsManager:
+    """Registro de resultados com escrita em lote numa thread de fundo"""
+    
+    def __init__(self, path=STATS_DB_PATH, batch_size=STATS_BATCH_SIZE, flush_interval=STATS_FLUSH_INTERVAL):
+        """
+        Args:
+            path: Arquivo do banco SQLite
+            batch_size: Máximo de resultados gravados por transação
+            flush_interval: Tempo máximo (s) que um resultado espera na fila
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        
+        self.queue = queue.SimpleQueue()
+        self.writer = None
+        self.reader = None  # Conexão de leitura (thread do jogo)
+        self.enabled = True
+        self.records_written = 0
+    
+    def _connect(self):
+        """Abre uma conexão com o banco em modo WAL"""
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        # Em WAL, NORMAL só sincroniza nos checkpoints: commits sem fsync
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+    
+    def start(self):
+        """Cria o banco (se preciso) e inicia a thread de escrita"""
+        if self.writer is not None or not self.enabled:
+            return
+        
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = self._connect()
+            connection.executescript(SCHEMA)
+            connection.close()
+        except (OSError, sqlite3.Error) as e:
+            print(f"✗ Estatísticas desativadas: {e}")
+            self.enabled = False
+            return
+        
+        self.writer = threading.Thread(target=self._writer_loop, name="stats-writer", daemon=True)
+        self.writer.start()
+        print(f"✓ Estatísticas em: {self.path}")
+    
+    def record(self, game, player, outcome, amount=0, kind=KIND_HAND, details=None):
+        """
+        Enfileira um resultado (não bloqueia: a gravação é feita em lote)
+        
+        Nunca abre o banco: start() é chamado no boot. Resultados enfileirados
+        antes disso são gravados quando a thread de escrita começar.
+        
+        Args:
+            game: Chave do jogo (ex.: 'poker')
+            player: Nome do jogador
+            outcome: RESULT_WIN, RESULT_LOSS ou RESULT_DRAW
+            amount: Saldo do jogador (fichas, pontos...)
+            kind: KIND_HAND ou KIND_GAME
+            details: Dados extras (serializados em JSON)
+        """
+        if not self.enabled:
+            return
+        self.queue.put((game, player, kind, outcome, amount, time.time(),
+                        json.dumps(details) if details is not None else None))
+    
+    def flush(self, timeout=5.0):
+        """
+        Espera a gravação de tudo o que já foi enfileirado
+        
+        Returns:
+            bool: True se a fila foi gravada dentro do tempo
+        """
+        if self.writer is None:
+            return True
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+    
+    def close(self):
+        """Grava o que falta e encerra a thread de escrita"""
+        if self.writer is not None:
+            self.queue.put(None)
+            self.writer.join(timeout=5.0)
+            self.writer = None
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+    
+    # ------------------------------------------------------------------
+    # Thread de escrita
+    # ------------------------------------------------------------------
+    
+    def _writer_loop(self):
+        """Junta resultados da fila e grava um lote por transação"""
+        connection = self._connect()
+        running = True
+        while running:
+            item = self.queue.get()
+            batch = []
+            waiting = []  # Pedidos de flush atendidos após este lote
+            deadline = time.monotonic() + self.flush_interval
+            
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiting.append(item)
+                    # Flush: grava imediatamente o que já chegou
+                    deadline = 0
+                else:
+                    batch.append(item)
+                
+                if len(batch) >= self.batch_size:
+                    break
+                timeout = deadline - time.monotonic()
+                try:
+                    item = self.queue.get(timeout=timeout) if timeout > 0 else self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    self._write_batch(connection, batch)
+                except sqlite3.Error as e:
+                    print(f"✗ Erro ao gravar estatísticas ({len(batch)} resultados perdidos): {e}")
+            for event in waiting:
+                event.set()
+        
+        connection.close()
+    
+    def _write_batch(self, connection, batch):
+        """
+        Insere os resultados e atualiza os agregados na mesma transação
+        
+        Args:
+            connection: Conexão da thread de escrita
+            batch: Lista de tuplas (game, player, kind, outcome, amount, played_at, details)
+        """
+        with connection:
+            connection.executemany(
+                "INSERT INTO results (game, player, kind, outcome, amount, played_at, details) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+            
+            # Agregados atuais só das chaves presentes no lote
+            totals = {}
+            for game, player, kind, outcome, amount, played_at, _ in batch:
+                key = (game, player, kind)
+                row = totals.get(key)
+                if row is None:
+                    found = connection.execute(
+                        "SELECT played, wins, losses, draws, amount, streak, best_streak, last_played "
+                        "FROM totals WHERE game = ? AND kind = ? AND player = ?", (game, kind, player)).fetchone()
+                    row = totals[key] = list(found) if found else [0, 0, 0, 0, 0, 0, 0, 0.0]
+                
+                row[0] += 1
+                row[4] += amount
+                row[7] = played_at
+                if outcome == RESULT_WIN:
+                    row[1] += 1
+                    # Sequência positiva = vitórias seguidas, negativa = derrotas seguidas
+                    row[5] = row[5] + 1 if row[5] > 0 else 1
+                    row[6] = max(row[6], row[5])
+                elif outcome == RESULT_LOSS:
+                    row[2] += 1
+                    row[5] = row[5] - 1 if row[5] < 0 else -1
+                else:
+                    row[3] += 1
+                    row[5] = 0
+            
+            connection.executemany(
+                f"INSERT OR REPLACE INTO totals ({', '.join(TOTALS_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TOTALS_COLUMNS))})",
+                [(game, player, kind, *row) for (game, player, kind), row in totals.items()])
+        
+        self.records_written += len(batch)
+    
+    # ------------------------------------------------------------------
+    # Consultas (thread do jogo; só leem índices e agregados)
+    # ------------------------------------------------------------------
+    
+    def _read(self, sql, params=()):
+        """Executa uma consulta na conexão de leitura"""
+        if not self.enabled:
+            return []
+        if self.reader is None:
+            self.start()
+            if not self.enabled:
+                return []
+            self.reader = self._connect()
+            self.reader.row_factory = sqlite3.Row
+        return [dict(row) for row in self.reader.execute(sql, params)]
+    
+    def player_stats(self, game, player, kind=KIND_HAND):
+        """
+        Agregados de um jogador
+        
+        Returns:
+            dict ou None: Colunas de 'totals' + win_rate
+        """
+        rows = self._read("SELECT * FROM totals WHERE game = ? AND kind = ? AND player = ?", (game, kind, player))
+        return _with_win_rate(rows[0]) if rows else None
+    
+    def leaderboard(self, game, kind=KIND_HAND, limit=10):
+        """
+        Jogadores com mais vitórias (percorre o índice totals_leaderboard)
+        
+        Returns:
+            list: Dicts com as colunas de 'totals' + win_rate
+        """
+        rows = self._read(
+            "SELECT * FROM totals WHERE game = ? AND kind = ? ORDER BY wins DESC LIMIT ?", (game, kind, limit))
+        return [_with_win_rate(row) for row in rows]
+    
+    def game_totals(self):
+        """
+        Totais por jogo e tipo de registro (soma das linhas de 'totals')
+        
+        Returns:
+            dict: {(jogo, tipo): {'played', 'wins', 'losses', 'draws', 'players'}}
+        """
+        rows = self._read(
+            "SELECT game, kind, SUM(played) AS played, SUM(wins) AS wins, SUM(losses) AS losses, "
+            "SUM(draws) AS draws, COUNT(*) AS players FROM totals GROUP BY game, kind")
+        return {(row.pop('game'), row.pop('kind')): row for row in rows}
+    
+    def recent_results(self, game, limit=20):
+        """
+        Últimos resultados de um jogo (percorre o índice results_by_game)
+        
+        Returns:
+            list: Dicts com as colunas de 'results'
+        """
+        return self._read(
+            "SELECT * FROM results WHERE game = ? ORDER BY played_at DESC LIMIT ?", (game, limit))
+
+
+def _with_win_rate(row):
+    """Acrescenta a taxa de vitórias (0 a 1) a uma linha de 'totals'"""
+    row['win_rate'] = row['wins'] / row['played'] if row['played'] else 0.0
+    return row
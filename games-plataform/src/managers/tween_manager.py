@@ -0,0 +1,321 @@
+"""
+tween_manager.py - Agendador central de tweens (posição, escala, alpha, cor)
+
+Os tweens são objetos com __slots__ reaproveitados de um pool (free list) e
+agrupados por cena. Limpar um grupo ao sair da cena é O(1): a lista é
+apenas trocada por uma nova e nenhum callback roda. Quem precisa das
+animações no valor final usa TweenGroup.finish_all.
+"""
+from src.utils.easing import EASINGS
+
+TWEEN_FINISH_PASSES = 4  # Rodadas de finish_all() para tweens criados pelos próprios callbacks
+
+class Tween:
+    """
+    Interpola um atributo de um objeto ao longo do tempo
+    
+    Instâncias vêm do pool do TweenManager e são reaproveitadas: não guarde a
+    referência depois que o tween terminar (use on_complete para soltá-la)
+    ou depois de chamar cancel().
+    """
+    
+    __slots__ = (
+        'manager', 'target', 'attr', 'start', 'end', 'duration', 'elapsed',
+        'delay', 'easing', 'on_complete', 'next', 'alive', 'started', 'integer',
+        'generation',
+    )
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self._reset()
+    
+    def _reset(self):
+        """Limpa as referências antes de voltar ao pool"""
+        self.target = None
+        self.attr = None
+        self.start = None
+        self.end = None
+        self.duration = 0.0
+        self.elapsed = 0.0
+        self.delay = 0.0
+        self.easing = None
+        self.on_complete = None
+        self.next = None
+        self.alive = False
+        self.started = False
+        self.integer = False
+        self.generation = 0
+    
+    def then(self, attr, end, duration, easing='linear', target=None, on_complete=None):
+        """
+        Encadeia um tween que começa quando este terminar
+        
+        Args:
+            attr: Nome do atributo a animar
+            end: Valor final (número ou tupla)
+            duration: Duração em segundos
+            easing: Nome em EASINGS ou função
+            target: Objeto animado (padrão: o mesmo deste tween)
+            on_complete: Callback opcional chamado ao terminar
+        
+        Returns:
+            Tween: O tween encadeado (permite .then(...).then(...))
+        """
+        chained = self.manager._acquire(
+            self.target if target is None else target,
+            attr, end, duration, easing, 0.0, on_complete
+        )
+        chained.generation = self.generation
+        self.next = chained
+        return chained
+    
+    def cancel(self):
+        """Cancela o tween e toda a cadeia seguinte (sem chamar on_complete)"""
+        self.alive = False
+        self.next = None
+    
+    def _finish(self):
+        """Leva o atributo direto ao valor final (sem interpolar)"""
+        setattr(self.target, self.attr, self.end)
+    
+    def _step(self, dt):
+        """
+        Avança o tween
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        
+        Returns:
+            bool: True se terminou neste passo
+        """
+        if self.delay > 0:
+            self.delay -= dt
+            if self.delay > 0:
+                return False
+            dt = -self.delay
+            self.delay = 0.0
+        
+        if not self.started:
+            # O valor inicial é lido só agora, para tweens encadeados/atrasados
+            if self.start is None:
+                self.start = getattr(self.target, self.attr)
+            self.started = True
+        
+        self.elapsed += dt
+        if self.duration <= 0 or self.elapsed >= self.duration:
+            t = 1.0
+        else:
+            t = self.elapsed / self.duration
+        k = self.easing(t)
+        
+        start, end = self.start, self.end
+        if isinstance(end, tuple):
+            value = tuple(s + (e - s) * k for s, e in zip(start, end))
+            if self.integer:
+                value = tuple(int(round(v)) for v in value)
+        else:
+            value = start + (end - start) * k
+            if self.integer:
+                value = int(round(value))
+        setattr(self.target, self.attr, value)
+        
+        return t >= 1.0
+
+
+class TweenGroup:
+    """Tweens ativos de uma cena"""
+    
+    def __init__(self, manager):
+        self.manager = manager
+        self.tweens = []
+        self.generation = 0  # Muda a cada clear(): tweens de gerações antigas foram descartados
+    
+    def tween(self, target, attr, end, duration, easing='linear', delay=0.0, start=None, on_complete=None):
+        """
+        Inicia um tween neste grupo
+        
+        Args:
+            target: Objeto animado
+            attr: Nome do atributo (ex.: 'x', 'scale', 'alpha', 'color')
+            end: Valor final (número ou tupla)
+            duration: Duração em segundos
+            easing: Nome em EASINGS ou função
+            delay: Espera em segundos antes de começar
+            start: Valor inicial (padrão: valor atual quando o tween começar)
+            on_complete: Callback opcional chamado ao terminar
+        
+        Returns:
+            Tween: O tween criado
+        """
+        tween = self.manager._acquire(target, attr, end, duration, easing, delay, on_complete)
+        tween.start = start
+        tween.generation = self.generation
+        self.tweens.append(tween)
+        return tween
+    
+    def update(self, dt):
+        """
+        Avança todos os tweens do grupo
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        if not self.tweens:
+            return
+        
+        # Callbacks que criam tweens (ou limpam o grupo) mexem só na lista nova
+        current = self.tweens
+        generation = self.generation
+        self.tweens = []
+        remaining = []
+        for tween in current:
+            if tween.alive and not tween._step(dt):
+                remaining.append(tween)
+                continue
+            
+            if tween.alive:
+                # Terminou normalmente: dispara o callback e inicia a cadeia
+                if tween.next is not None:
+                    remaining.append(tween.next)
+                if tween.on_complete is not None:
+                    tween.on_complete()
+            self.manager._release(tween)
+        
+        # Se um callback chamou clear(), só ficam os tweens criados depois dele
+        if self.generation == generation:
+            remaining.extend(self.tweens)
+            self.tweens = remaining
+    
+    def clear(self):
+        """
+        Descarta todos os tweens do grupo em O(1)
+        
+        Nenhum valor final é aplicado e nenhum on_complete é chamado. Os
+        tweens descartados não voltam ao pool: quem ainda guarda um deles
+        pode chamar cancel() sem afetar outra animação, e owns() diz se o
+        tween foi descartado.
+        """
+        self.tweens = []
+        self.generation += 1
+    
+    def owns(self, tween):
+        """
+        Args:
+            tween: Tween criado por este grupo
+        
+        Returns:
+            bool: False se o tween foi descartado por clear()
+        """
+        return tween.generation == self.generation
+    
+    def finish_all(self):
+        """
+        Termina todos os tweens do grupo na hora
+        
+        Cada tween vivo (e sua cadeia) vai para o valor final e chama
+        on_complete, como se tivesse terminado. Todos voltam ao pool.
+        """
+        # Callbacks podem criar tweens novos; poucas passadas bastam e evitam laço infinito
+        for _ in range(TWEEN_FINISH_PASSES):
+            current = self.tweens
+            if not current:
+                return
+            self.tweens = []
+            for tween in current:
+                self._finish_chain(tween)
+        
+        for tween in self.tweens:
+            self.manager._release_chain(tween)
+        self.tweens = []
+    
+    def _finish_chain(self, tween):
+        """Aplica o valor final de um tween e dos encadeados a ele"""
+        while tween is not None:
+            chained = tween.next
+            if tween.alive:
+                tween._finish()
+                if tween.on_complete is not None:
+                    tween.on_complete()
+            else:
+                chained = None  # cancel() já descartou a cadeia
+            self.manager._release(tween)
+            tween = chained
+    
+    def __len__(self):
+        return len(self.tweens)
+
+
+class TweenManager:
+    """Agendador central: pool de tweens e grupos por cena"""
+    
+    def __init__(self):
+        self.free_tweens = []
+        self.groups = {}
+    
+    def group(self, key):
+        """
+        Retorna (criando se preciso) o grupo de uma cena
+        
+        Args:
+            key: Identificador do grupo (ex.: SceneType)
+        
+        Returns:
+            TweenGroup: Grupo de tweens
+        """
+        if key not in self.groups:
+            self.groups[key] = TweenGroup(self)
+        return self.groups[key]
+    
+    def drop_group(self, key):
+        """
+        Descarta todos os tweens de um grupo em O(1) (ver TweenGroup.clear)
+        
+        Args:
+            key: Identificador do grupo
+        """
+        if key in self.groups:
+            self.groups[key].clear()
+    
+    def update(self, dt):
+        """
+        Avança os tweens de todos os grupos
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        for group in self.groups.values():
+            group.update(dt)
+    
+    def _acquire(self, target, attr, end, duration, easing, delay, on_complete):
+        """Pega um tween do pool (ou cria um novo) e o configura"""
+        tween = self.free_tweens.pop() if self.free_tweens else Tween(self)
+        tween.target = target
+        tween.attr = attr
+        tween.end = end
+        tween.duration = duration
+        tween.delay = delay
+        tween.easing = EASINGS[easing] if isinstance(easing, str) else easing
+        tween.on_complete = on_complete
+        tween.alive = True
+        if isinstance(end, tuple):
+            tween.integer = all(isinstance(value, int) for value in end)
+        else:
+            tween.integer = isinstance(end, int)
+        return tween
+    
+    def _release(self, tween):
+        """Devolve um tween ao pool"""
+        tween._reset()
+        self.free_tweens.append(tween)
+    
+    def _release_chain(self, tween):
+        """Devolve ao pool um tween e os encadeados a ele, sem aplicá-los"""
+        while tween is not None:
+            chained = tween.next
+            self._release(tween)
+            tween = chained
+    
+    @property
+    def active_count(self):
+        """int: Total de tweens ativos (sem contar os encadeados pendentes)"""
+        return sum(len(group) for group in self.groups.values())
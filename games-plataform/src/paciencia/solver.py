@@ -0,0 +1,115 @@
+"""
+solver.py - Dicas para a paciência (busca limitada sobre os estados imutáveis)
+
+A busca expande PacienciaState diretamente: cada filho compartilha as pilhas
+do pai, então explorar milhares de estados custa pouca memória. A dica é a
+primeira jogada do caminho até o melhor estado encontrado dentro do limite.
+HintSearch guarda a fronteira entre chamadas, então a cena pode buscar um
+pouco a cada frame sem estourar o orçamento do frame.
+"""
+import heapq
+import itertools
+import time
+from src.paciencia.state import DRAW_MOVE
+
+HINT_MAX_NODES = 500  # Estados expandidos por dica
+HINT_TIME_LIMIT = 0.04  # Tempo máximo (s) de find_hint (busca inteira de uma vez)
+HINT_STEP_TIME = 0.004  # Tempo de busca por frame na cena (bem abaixo de 1/60 s)
+
+def score(state):
+    """
+    Quão perto da vitória o estado está
+    
+    Cartas nas fundações valem mais; cartas viradas para baixo pesam contra.
+    """
+    empty_columns = sum(1 for down, up in state.tableau if not down and not up)
+    return state.foundation_cards() * 10 - state.hidden_cards() * 6 + empty_columns * 2
+
+class HintSearch:
+    """Busca de dica que pode ser continuada em vários frames"""
+    
+    def __init__(self, state, max_nodes=HINT_MAX_NODES):
+        """
+        Args:
+            state: PacienciaState de onde a dica parte
+            max_nodes: Limite de estados expandidos
+        """
+        self.state = state
+        self.max_nodes = max_nodes
+        self.best = (score(state), 0)
+        self.best_move = None
+        self.won_move = None
+        
+        self.order = itertools.count()
+        self.frontier = [(-self.best[0], 0, next(self.order), state, None)]
+        self.seen = {state.key()}
+        self.expanded = 0
+    
+    @property
+    def done(self):
+        """bool: True quando a busca terminou (vitória, fronteira vazia ou limite)"""
+        return self.won_move is not None or not self.frontier or self.expanded >= self.max_nodes
+    
+    def step(self, time_limit=HINT_STEP_TIME):
+        """
+        Continua a busca por até time_limit segundos
+        
+        Args:
+            time_limit: Tempo máximo desta chamada em segundos
+        
+        Returns:
+            bool: True se a busca terminou
+        """
+        deadline = time.perf_counter() + time_limit
+        while not self.done and time.perf_counter() < deadline:
+            _, depth, _, current, first_move = heapq.heappop(self.frontier)
+            self.expanded += 1
+            
+            for move in current.legal_moves():
+                child = current.apply(move)
+                key = child.key()
+                if key in self.seen:
+                    continue
+                self.seen.add(key)
+                
+                child_first = first_move or move
+                if child.is_won():
+                    self.won_move = child_first
+                    return True
+                
+                child_score = score(child)
+                # Melhor pontuação; em caso de empate, o caminho mais curto
+                if (child_score, -(depth + 1)) > self.best:
+                    self.best = (child_score, -(depth + 1))
+                    self.best_move = child_first
+                heapq.heappush(self.frontier, (-child_score, depth + 1, next(self.order), child, child_first))
+        return self.done
+    
+    def result(self):
+        """
+        Returns:
+            Move ou None: Primeira jogada do melhor caminho encontrado até agora
+                (comprar do monte se só isso ajudar, None se não há jogadas)
+        """
+        if self.won_move is not None:
+            return self.won_move
+        if self.best_move is not None:
+            return self.best_move
+        return DRAW_MOVE if self.state.stock or self.state.waste else None
+
+def find_hint(state, max_nodes=HINT_MAX_NODES, time_limit=HINT_TIME_LIMIT):
+    """
+    Procura uma jogada que melhore a posição, numa busca só
+    
+    Args:
+        state: PacienciaState atual
+        max_nodes: Limite de estados expandidos
+        time_limit: Limite de tempo em segundos
+    
+    Returns:
+        Move ou None: Primeira jogada do melhor caminho encontrado (comprar do
+            monte se só isso ajudar, None se não há jogadas)
+    """
+    search = HintSearch(state, max_nodes)
+    search.step(time_limit)
+    return search.result()
@@ -0,0 +1,422 @@
+"""
+state.py - Estado imutável da paciência (Klondike, virando 1 carta)
+
+Cada jogada cria um novo PacienciaState que compartilha com o anterior tudo
+o que não mudou: as pilhas são listas encadeadas persistentes (Pile), então
+tirar ou pôr cartas só cria nós para as cartas movidas, e as colunas que não
+participaram da jogada são as mesmas instâncias. Por isso o histórico de
+desfazer pode guardar todos os estados, e o solver de dicas e o save usam os
+mesmos objetos sem copiar nada.
+
+Cartas seguem o formato de src.poker.cards (inteiros 0 a 51, naipe = carta % 4),
+mas na paciência o Ás vale 1 (card_value).
+"""
+import random
+from collections import namedtuple
+from src.poker.cards import new_deck, card_rank, card_suit
+
+# Origens/destinos de uma jogada
+STOCK = "stock"
+WASTE = "waste"
+FOUNDATION = "foundation"
+TABLEAU = "tableau"
+
+TABLEAU_COLUMNS = 7
+KING = 13
+
+# Jogada: de (source, source_index) para (target, target_index), com count cartas.
+# Comprar do monte (ou reciclar o descarte quando o monte acaba) é STOCK -> WASTE.
+Move = namedtuple("Move", "source source_index target target_index count")
+
+DRAW_MOVE = Move(STOCK, 0, WASTE, 0, 1)
+
+# Tabelas por carta (legal_moves roda milhares de vezes por dica)
+CARD_VALUES = tuple(1 if card_rank(card) == 12 else card_rank(card) + 2 for card in range(52))
+CARD_RED = tuple(card_suit(card) in (1, 2) for card in range(52))  # Ouros e copas
+
+def card_value(card):
+    """
+    Args:
+        card: Carta (0 a 51)
+    
+    Returns:
+        int: 1 (Ás) a 13 (Rei)
+    """
+    return CARD_VALUES[card]
+
+def is_red(card):
+    return CARD_RED[card]
+
+def card_of(value, suit):
+    """Carta (0 a 51) a partir do valor da paciência (1 a 13) e do naipe"""
+    return (12 if value == 1 else value - 2) * 4 + suit
+
+
+class Pile:
+    """
+    Pilha persistente: carta do topo + pilha de baixo (compartilhada)
+    
+    Nunca é modificada depois de criada; push/pop devolvem pilhas novas.
+    """
+    
+    __slots__ = ('top', 'below', 'size')
+    
+    def __init__(self, top, below):
+        self.top = top
+        self.below = below
+        self.size = below.size + 1
+    
+    def push(self, card):
+        return Pile(card, self)
+    
+    def push_all(self, cards):
+        """Empilha cards (de baixo para cima)"""
+        pile = self
+        for card in cards:
+            pile = Pile(card, pile)
+        return pile
+    
+    def take(self, count):
+        """
+        Separa as count cartas de cima
+        
+        Returns:
+            tuple: (cartas de baixo para cima, pilha restante)
+        """
+        cards = []
+        pile = self
+        for _ in range(count):
+            cards.append(pile.top)
+            pile = pile.below
+        cards.reverse()
+        return cards, pile
+    
+    def cards(self):
+        """
+        Returns:
+            list: Cartas de baixo para cima
+        """
+        return self.take(self.size)[0]
+    
+    def __len__(self):
+        return self.size
+    
+    def __bool__(self):
+        return self.size > 0
+
+
+class _EmptyPile(Pile):
+    """Pilha vazia (instância única, base de todas as outras)"""
+    
+    __slots__ = ()
+    
+    def __init__(self):
+        self.top = None
+        self.below = None
+        self.size = 0
+
+EMPTY_PILE = _EmptyPile()
+
+def pile_of(cards):
+    """Pilha com cards (de baixo para cima)"""
+    return EMPTY_PILE.push_all(cards)
+
+
+class PacienciaState:
+    """
+    Um momento da partida (imutável)
+    
+    Attributes:
+        stock: Pile do monte (topo = próxima carta comprada)
+        waste: Pile do descarte (topo = carta jogável)
+        foundations: Tupla com o valor da carta do topo de cada naipe (0 = vazia)
+        tableau: Tupla de 7 colunas (cartas viradas para baixo, cartas para cima)
+        moves: Jogadas feitas até aqui
+    """
+    
+    __slots__ = ('stock', 'waste', 'foundations', 'tableau', 'moves')
+    
+    def __init__(self, stock, waste, foundations, tableau, moves=0):
+        self.stock = stock
+        self.waste = waste
+        self.foundations = foundations
+        self.tableau = tableau
+        self.moves = moves
+    
+    def _replace(self, stock=None, waste=None, foundations=None, tableau=None):
+        """Novo estado reaproveitando todos os campos não informados"""
+        return PacienciaState(
+            self.stock if stock is None else stock,
+            self.waste if waste is None else waste,
+            self.foundations if foundations is None else foundations,
+            self.tableau if tableau is None else tableau,
+            self.moves + 1,
+        )
+    
+    def is_won(self):
+        return sum(self.foundations) == 4 * KING
+    
+    def foundation_cards(self):
+        return sum(self.foundations)
+    
+    def hidden_cards(self):
+        return sum(len(down) for down, _ in self.tableau)
+    
+    def key(self):
+        """
+        Identidade do estado para o solver (ignora o número de jogadas)
+        
+        Só compara estados da mesma partida: comprar e reciclar preservam a
+        ordem do monte + descarte, então esses dois ficam determinados pelas
+        cartas que estão no resto da mesa e pelo tamanho do descarte.
+        
+        Returns:
+            tuple: Chave hashable
+        """
+        columns = []
+        for down, up in self.tableau:
+            cards = [down.size]
+            pile = up
+            while pile.size:
+                cards.append(pile.top)
+                pile = pile.below
+            columns.append(tuple(cards))
+        return (self.waste.size, self.foundations, tuple(columns))
+    
+    def _accepts_on_foundation(self, card):
+        return self.foundations[card % 4] == CARD_VALUES[card] - 1
+    
+    def _accepts_on_column(self, card, column):
+        """Rei em coluna vazia; senão uma carta a menos e de cor oposta"""
+        down, up = self.tableau[column]
+        if not up:
+            return not down and CARD_VALUES[card] == KING
+        return CARD_VALUES[up.top] == CARD_VALUES[card] + 1 and CARD_RED[up.top] != CARD_RED[card]
+    
+    def _column_targets(self):
+        """
+        Returns:
+            tuple: ({(valor, vermelha): colunas que aceitam essa carta}, colunas vazias)
+        """
+        wanted = {}
+        empty = []
+        for column, (down, up) in enumerate(self.tableau):
+            if up:
+                top = up.top
+                wanted.setdefault((CARD_VALUES[top] - 1, not CARD_RED[top]), []).append(column)
+            elif not down:
+                empty.append(column)
+        return wanted, empty
+    
+    def legal_moves(self):
+        """
+        Jogadas possíveis neste estado
+        
+        Returns:
+            list: Move, na ordem: para as fundações, entre colunas, do descarte,
+                das fundações para as colunas e por fim comprar
+        """
+        to_foundation = []
+        between_columns = []
+        from_waste = []
+        from_foundation = []
+        wanted, empty = self._column_targets()
+        
+        def targets(card):
+            return empty if CARD_VALUES[card] == KING else wanted.get((CARD_VALUES[card], CARD_RED[card]), ())
+        
+        if self.waste:
+            card = self.waste.top
+            if self._accepts_on_foundation(card):
+                to_foundation.append(Move(WASTE, 0, FOUNDATION, card % 4, 1))
+            for target in targets(card):
+                from_waste.append(Move(WASTE, 0, TABLEAU, target, 1))
+        
+        for column, (down, up) in enumerate(self.tableau):
+            if not up:
+                continue
+            if self._accepts_on_foundation(up.top):
+                to_foundation.append(Move(TABLEAU, column, FOUNDATION, up.top % 4, 1))
+            
+            # Qualquer sequência que termina no topo pode ser movida
+            cards = up.cards()
+            for start, card in enumerate(cards):
+                # Rei que já está no fundo de uma coluna não precisa ir para outra vazia
+                if start == 0 and not down and CARD_VALUES[card] == KING:
+                    continue
+                for target in targets(card):
+                    if target != column:
+                        between_columns.append(Move(TABLEAU, column, TABLEAU, target, len(cards) - start))
+        
+        for suit, value in enumerate(self.foundations):
+            if value > 1:
+                for target in wanted.get((value, CARD_RED[card_of(value, suit)]), ()):
+                    from_foundation.append(Move(FOUNDATION, suit, TABLEAU, target, 1))
+        
+        moves = to_foundation + between_columns + from_waste + from_foundation
+        if self.stock or self.waste:
+            moves.append(DRAW_MOVE)
+        return moves
+    
+    def apply(self, move):
+        """
+        Aplica uma jogada
+        
+        Args:
+            move: Move
+        
+        Returns:
+            PacienciaState: Novo estado (este continua válido e inalterado)
+        
+        Raises:
+            ValueError: Se a jogada não é permitida neste estado
+        """
+        if move.source == STOCK:
+            if self.stock:
+                return self._replace(stock=self.stock.below, waste=self.waste.push(self.stock.top))
+            if self.waste:
+                # Recicla o descarte: a primeira carta descartada volta a ser a primeira comprada
+                return self._replace(stock=pile_of(reversed(self.waste.cards())), waste=EMPTY_PILE)
+            raise ValueError("monte e descarte vazios")
+        
+        # Retira as cartas da origem
+        tableau = self.tableau
+        foundations = self.foundations
+        waste = None
+        if move.source == WASTE:
+            if not self.waste:
+                raise ValueError("descarte vazio")
+            cards = [self.waste.top]
+            waste = self.waste.below
+        elif move.source == TABLEAU:
+            down, up = tableau[move.source_index]
+            if not 0 < move.count <= len(up):
+                raise ValueError(f"a coluna {move.source_index} não tem {move.count} cartas viradas")
+            cards, up = up.take(move.count)
+            if not up and down:
+                # Vira a carta de cima das viradas para baixo
+                up = EMPTY_PILE.push(down.top)
+                down = down.below
+            tableau = _set_column(tableau, move.source_index, (down, up))
+        elif move.source == FOUNDATION:
+            value = foundations[move.source_index]
+            if value == 0:
+                raise ValueError("fundação vazia")
+            cards = [card_of(value, move.source_index)]
+            foundations = _set_foundation(foundations, move.source_index, value - 1)
+        else:
+            raise ValueError(f"origem desconhecida: {move.source}")
+        
+        # Coloca no destino (validando contra o estado original)
+        card = cards[0]
+        if move.target == FOUNDATION:
+            if len(cards) != 1 or card_suit(card) != move.target_index or not self._accepts_on_foundation(card):
+                raise ValueError("a carta não pode ir para a fundação")
+            foundations = _set_foundation(foundations, move.target_index, card_value(card))
+        elif move.target == TABLEAU:
+            if move.target_index == move.source_index and move.source == TABLEAU:
+                raise ValueError("origem e destino iguais")
+            if not self._accepts_on_column(card, move.target_index):
+                raise ValueError(f"a carta não pode ir para a coluna {move.target_index}")
+            down, up = tableau[move.target_index]
+            tableau = _set_column(tableau, move.target_index, (down, up.push_all(cards)))
+        else:
+            raise ValueError(f"destino inválido: {move.target}")
+        
+        return self._replace(waste=waste, foundations=foundations, tableau=tableau)
+    
+    def to_dict(self):
+        """
+        Returns:
+            dict: Estado serializável em JSON (para o save)
+        """
+        return {
+            'stock': self.stock.cards(),
+            'waste': self.waste.cards(),
+            'foundations': list(self.foundations),
+            'tableau': [[down.cards(), up.cards()] for down, up in self.tableau],
+            'moves': self.moves,
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Args:
+            data: Saída de to_dict
+        
+        Returns:
+            PacienciaState: Estado reconstruído
+        """
+        return cls(
+            pile_of(data['stock']),
+            pile_of(data['waste']),
+            tuple(data['foundations']),
+            tuple((pile_of(down), pile_of(up)) for down, up in data['tableau']),
+            data.get('moves', 0),
+        )
+
+
+def _set_column(tableau, index, column):
+    """Nova tupla de colunas trocando só uma (as outras são as mesmas pilhas)"""
+    return tableau[:index] + (column,) + tableau[index + 1:]
+
+def _set_foundation(foundations, suit, value):
+    return foundations[:suit] + (value,) + foundations[suit + 1:]
+
+def deal(seed=None):
+    """
+    Embaralha e distribui uma partida nova
+    
+    Args:
+        seed: Semente do embaralhamento (None = aleatória)
+    
+    Returns:
+        PacienciaState: Estado inicial
+    """
+    deck = new_deck()
+    random.Random(seed).shuffle(deck)
+    
+    tableau = []
+    for column in range(TABLEAU_COLUMNS):
+        cards = [deck.pop() for _ in range(column + 1)]
+        tableau.append((pile_of(cards[:-1]), pile_of(cards[-1:])))
+    return PacienciaState(pile_of(deck), EMPTY_PILE, (0, 0, 0, 0), tuple(tableau))
+
+
+class History:
+    """
+    Desfazer/refazer ilimitado: lista de estados + posição atual
+    
+    Desfazer e refazer só movem o índice (O(1)); como os estados compartilham
+    as pilhas, cada jogada guardada custa só os nós que ela criou.
+    """
+    
+    def __init__(self, state):
+        self.states = [state]
+        self.index = 0
+    
+    @property
+    def current(self):
+        return self.states[self.index]
+    
+    def push(self, state):
+        """Registra um novo estado (descarta o que poderia ser refeito)"""
+        del self.states[self.index + 1:]
+        self.states.append(state)
+        self.index += 1
+    
+    def can_undo(self):
+        return self.index > 0
+    
+    def can_redo(self):
+        return self.index < len(self.states) - 1
+    
+    def undo(self):
+        if self.can_undo():
+            self.index -= 1
+        return self.current
+    
+    def redo(self):
+        if self.can_redo():
+            self.index += 1
+        return self.current
@@ -0,0 +1,83 @@
+"""
+bots.py - Jogadores automáticos de poker com nível de dificuldade
+"""
+from src.poker.cards import evaluate, card_rank, card_suit, PAIR, TWO_PAIR, THREE_OF_A_KIND
+from src.poker.table import FOLD, CHECK, CALL, RAISE
+
+# Níveis de dificuldade: (força mínima para pagar, força para aumentar, taxa de blefe)
+BOT_LEVELS = {
+    'easy': (0.20, 0.75, 0.02),
+    'medium': (0.35, 0.65, 0.06),
+    'hard': (0.45, 0.60, 0.10),
+}
+
+def _preflop_strength(hole):
+    """
+    Estimativa simples (0 a 1) da força das duas cartas fechadas
+    
+    Args:
+        hole: Lista com as duas cartas
+    """
+    high, low = sorted((card_rank(card) for card in hole), reverse=True)
+    strength = (high + low) / 24 * 0.6
+    if high == low:
+        strength += 0.3 + low / 12 * 0.1
+    if card_suit(hole[0]) == card_suit(hole[1]):
+        strength += 0.05
+    if high - low == 1:
+        strength += 0.03
+    return min(strength, 1.0)
+
+def _postflop_strength(hole, board):
+    """Força (0 a 1) a partir da categoria da mão feita"""
+    category = evaluate(hole + board)[0]
+    if category >= THREE_OF_A_KIND:
+        return 0.8 + min(category - THREE_OF_A_KIND, 5) * 0.04
+    if category == TWO_PAIR:
+        return 0.7
+    if category == PAIR:
+        # Par com carta da mão vale mais que par só na mesa
+        board_ranks = [card_rank(card) for card in board]
+        uses_hole = any(card_rank(card) in board_ranks for card in hole) or card_rank(hole[0]) == card_rank(hole[1])
+        return 0.5 if uses_hole else 0.25
+    return 0.15
+
+def choose_action(table, seat, rng, level='medium'):
+    """
+    Decide a ação de um bot no momento em que é a vez dele
+    
+    Args:
+        table: PokerTable
+        seat: Assento do bot (deve ser table.to_act)
+        rng: random.Random
+        level: Chave de BOT_LEVELS
+    
+    Returns:
+        tuple: (ação, valor)
+    """
+    call_threshold, raise_threshold, bluff_rate = BOT_LEVELS[level]
+    hole = table.hole[seat]
+    if table.board:
+        strength = _postflop_strength(hole, table.board)
+    else:
+        strength = _preflop_strength(hole)
+    strength += rng.uniform(-0.05, 0.05)
+    
+    to_call, min_raise, max_raise = table.legal_actions()
+    pot = max(table.pot, table.big_blind)
+    
+    if strength >= raise_threshold or rng.random() < bluff_rate:
+        if max_raise > table.current_bet:
+            # Aposta proporcional ao pote, respeitando o mínimo
+            target = table.current_bet + int(pot * (0.5 + strength * 0.5))
+            return RAISE, max(min_raise, min(target, max_raise))
+        return CALL, 0
+    
+    if to_call == 0:
+        return CHECK, 0
+    
+    # Paga se a força compensa o preço
+    price = to_call / (pot + to_call)
+    if strength >= call_threshold or strength > price + 0.2:
+        return CALL, 0
+    return FOLD, 0
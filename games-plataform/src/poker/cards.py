@@ -0,0 +1,133 @@
+"""
+cards.py - Baralho e avaliação de mãos de poker
+
+Cartas são inteiros de 0 a 51: valor = carta // 4 (0 = 2 ... 12 = Ás) e
+naipe = carta % 4. O formato compacto vai direto nas mensagens do servidor.
+"""
+RANKS = "23456789TJQKA"
+SUITS = "♣♦♥♠"
+
+# Categorias de mão (maior é melhor)
+HIGH_CARD = 0
+PAIR = 1
+TWO_PAIR = 2
+THREE_OF_A_KIND = 3
+STRAIGHT = 4
+FLUSH = 5
+FULL_HOUSE = 6
+FOUR_OF_A_KIND = 7
+STRAIGHT_FLUSH = 8
+
+CATEGORY_NAMES = [
+    "Carta alta", "Par", "Dois pares", "Trinca", "Sequência",
+    "Flush", "Full house", "Quadra", "Straight flush",
+]
+
+def new_deck():
+    """
+    Returns:
+        list: As 52 cartas (inteiros)
+    """
+    return list(range(52))
+
+def card_rank(card):
+    return card // 4
+
+def card_suit(card):
+    return card % 4
+
+def card_name(card):
+    """
+    Args:
+        card: Carta (0 a 51)
+    
+    Returns:
+        str: Nome curto (ex.: 'A♠')
+    """
+    return RANKS[card // 4] + SUITS[card % 4]
+
+def _straight_high(ranks):
+    """
+    Retorna o valor mais alto de uma sequência entre os valores dados
+    
+    Args:
+        ranks: Conjunto de valores (0 a 12)
+    
+    Returns:
+        int ou None: Valor da carta mais alta da sequência
+    """
+    for high in range(12, 3, -1):
+        if all(high - i in ranks for i in range(5)):
+            return high
+    # Sequência com Ás baixo (A-2-3-4-5)
+    if {12, 0, 1, 2, 3} <= ranks:
+        return 3
+    return None
+
+def evaluate(cards):
+    """
+    Avalia a melhor mão de 5 cartas entre 5 a 7 cartas
+    
+    Args:
+        cards: Lista de cartas (inteiros)
+    
+    Returns:
+        tuple: (categoria, desempates...) comparável diretamente com outra mão
+    """
+    counts = [0] * 13
+    suits = [[] for _ in range(4)]
+    for card in cards:
+        rank = card // 4
+        counts[rank] += 1
+        suits[card % 4].append(rank)
+    
+    # Flush e straight flush
+    for suited in suits:
+        if len(suited) >= 5:
+            high = _straight_high(set(suited))
+            if high is not None:
+                return (STRAIGHT_FLUSH, high)
+            flush_ranks = sorted(suited, reverse=True)[:5]
+            flush = (FLUSH, *flush_ranks)
+            break
+    else:
+        flush = None
+    
+    quads, trips, pairs, singles = [], [], [], []
+    for rank in range(12, -1, -1):
+        count = counts[rank]
+        if count == 4:
+            quads.append(rank)
+        elif count == 3:
+            trips.append(rank)
+        elif count == 2:
+            pairs.append(rank)
+        elif count == 1:
+            singles.append(rank)
+    
+    if quads:
+        kicker = max(trips + pairs + singles + quads[1:])
+        return (FOUR_OF_A_KIND, quads[0], kicker)
+    
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return (FULL_HOUSE, trips[0], pair)
+    
+    if flush:
+        return flush
+    
+    high = _straight_high({rank for rank in range(13) if counts[rank]})
+    if high is not None:
+        return (STRAIGHT, high)
+    
+    if trips:
+        return (THREE_OF_A_KIND, trips[0], *singles[:2])
+    
+    if len(pairs) >= 2:
+        kicker = max(pairs[2:] + singles[:1])
+        return (TWO_PAIR, pairs[0], pairs[1], kicker)
+    
+    if pairs:
+        return (PAIR, pairs[0], *singles[:3])
+    
+    return (HIGH_CARD, *singles[:5])
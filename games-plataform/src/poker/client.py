@@ -0,0 +1,127 @@
+"""
+client.py - Clientes do servidor de mesas
+
+LocalPokerService roda o TableServer numa thread com seu próprio loop
+asyncio, para que o loop do pygame nunca espere pela lógica do jogo.
+PokerClient é o lado do jogo: envia mensagens e lê as respostas sem bloquear.
+SocketClient fala com o servidor pelo socket local.
+"""
+import asyncio
+import queue
+import threading
+from src.poker.server import TableServer
+from src.poker.protocol import encode, decode
+
+class PokerClient:
+    """Cliente em processo, seguro para usar a partir da thread do pygame"""
+    
+    def __init__(self, service, connection, inbox):
+        self.service = service
+        self.connection = connection
+        self.inbox = inbox
+    
+    def send(self, message):
+        """
+        Envia uma mensagem ao servidor (não bloqueia)
+        
+        Args:
+            message: Lista da mensagem (ver protocol.py)
+        """
+        self.service.loop.call_soon_threadsafe(self.service.server.handle_message, self.connection, message)
+    
+    def poll(self):
+        """
+        Retorna as mensagens recebidas desde a última chamada
+        
+        Returns:
+            list: Mensagens (listas)
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return messages
+    
+    def close(self):
+        """Sai de todas as mesas"""
+        self.service.loop.call_soon_threadsafe(self.service.server.disconnect, self.connection)
+
+
+class LocalPokerService:
+    """TableServer rodando numa thread de fundo"""
+    
+    def __init__(self):
+        self.loop = None
+        self.server = None
+        self.thread = None
+        self._ready = threading.Event()
+    
+    def start(self):
+        """Inicia a thread do servidor (se ainda não estiver rodando)"""
+        if self.thread is not None:
+            return
+        self.thread = threading.Thread(target=self._run, name="poker-server", daemon=True)
+        self.thread.start()
+        self._ready.wait()
+    
+    def _run(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.server = TableServer()
+        self._ready.set()
+        self.loop.run_forever()
+    
+    def connect(self):
+        """
+        Cria um cliente em processo
+        
+        Returns:
+            PokerClient: Cliente conectado
+        """
+        self.start()
+        inbox = queue.SimpleQueue()
+        connection = self.server.connect(inbox.put)
+        return PokerClient(self, connection, inbox)
+    
+    def stop(self):
+        """Encerra o loop e a thread do servidor"""
+        if self.thread is None:
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=1.0)
+        self.thread = None
+
+
+class SocketClient:
+    """Cliente asyncio pelo socket local (JSON compacto por linha)"""
+    
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+    
+    @classmethod
+    async def open(cls, host="127.0.0.1", port=0):
+        """
+        Conecta ao servidor
+        
+        Returns:
+            SocketClient: Cliente conectado
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+    
+    def send(self, message):
+        self.writer.write(encode(message))
+    
+    async def receive(self):
+        """
+        Returns:
+            list ou None: Próxima mensagem (None se a conexão caiu)
+        """
+        line = await self.reader.readline()
+        return decode(line) if line else None
+    
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
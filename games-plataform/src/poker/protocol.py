@@ -0,0 +1,62 @@
+"""
+protocol.py - Mensagens entre o servidor de mesas e os clientes
+
+Cada mensagem é uma lista curta começando pelo código da operação. No
+transporte em processo a lista é entregue como está; no socket local ela
+vira uma linha JSON compacta (sem espaços), terminada em '\\n'.
+
+Cliente -> servidor:
+    [MSG_CREATE, pedido, assentos, assentos_humanos, fichas, small, big, nível_bot, atraso]
+    [MSG_JOIN, mesa, [assentos]]
+    [MSG_ACT, mesa, assento, ação, valor]
+    [MSG_LEAVE, mesa]
+    [MSG_CLOSE, mesa]
+
+Servidor -> cliente:
+    [MSG_CREATED, pedido, mesa]
+    [MSG_JOINED, mesa, [assentos]]
+    [MSG_EVENT, mesa, código_evento, *argumentos]  (ver EV_* em table.py)
+    [MSG_ERROR, mesa, texto]
+
+Quando um cliente desconecta, as mesas que ele criou são fechadas.
+Um cliente do socket que para de ler é desconectado (ver
+SOCKET_WRITE_BUFFER_LIMIT em server.py).
+"""
+import json
+
+MSG_CREATE = 1
+MSG_JOIN = 2
+MSG_ACT = 3
+MSG_LEAVE = 4
+MSG_CLOSE = 5
+
+MSG_CREATED = 11
+MSG_JOINED = 12
+MSG_EVENT = 13
+MSG_ERROR = 14
+
+def encode(message):
+    """
+    Args:
+        message: Lista da mensagem
+    
+    Returns:
+        bytes: Linha JSON compacta
+    """
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+def decode(line):
+    """
+    Args:
+        line: Linha recebida do socket
+    
+    Returns:
+        list: Mensagem
+    
+    Raises:
+        ValueError: Se a linha não for uma mensagem válida
+    """
+    message = json.loads(line)
+    if not isinstance(message, list) or not message or not isinstance(message[0], int):
+        raise ValueError("mensagem inválida")
+    return message
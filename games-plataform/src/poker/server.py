@@ -0,0 +1,372 @@
+"""
+server.py - Servidor asyncio que hospeda muitas mesas de poker ao mesmo tempo
+
+Cada mesa roda numa task própria. Assentos de bot decidem no próprio
+servidor; assentos humanos esperam a ação de um cliente conectado (por
+transporte em processo ou socket local).
+"""
+import asyncio
+import random
+from src.poker.bots import choose_action
+from src.poker.table import PokerTable, EV_TURN, EV_HOLE, FOLD, CHECK, CALL, RAISE
+from src.poker.protocol import (
+    encode, decode,
+    MSG_CREATE, MSG_JOIN, MSG_ACT, MSG_LEAVE, MSG_CLOSE,
+    MSG_CREATED, MSG_JOINED, MSG_EVENT, MSG_ERROR,
+)
+
+ACTIONS = (FOLD, CHECK, CALL, RAISE)
+
+# Bytes esperando envio por cliente do socket; quem fica para trás além disso
+# (lento ou parado) é desconectado em vez de acumular memória no servidor
+SOCKET_WRITE_BUFFER_LIMIT = 1024 * 1024
+
+def validate_action(action, amount):
+    """
+    Confere os tipos de uma ação vinda de um cliente
+    
+    Valores fora disso derrubariam a task da mesa dentro de table.act.
+    
+    Raises:
+        ValueError: Ação desconhecida ou valor que não é inteiro
+    """
+    if isinstance(action, bool) or action not in ACTIONS:
+        raise ValueError(f"ação inválida: {action!r}")
+    if isinstance(amount, bool) or not isinstance(amount, int):
+        raise ValueError(f"valor inválido: {amount!r}")
+
+class Connection:
+    """Cliente conectado ao servidor"""
+    
+    def __init__(self, deliver):
+        """
+        Args:
+            deliver: Função chamada com cada mensagem (lista) para o cliente
+        """
+        self.deliver = deliver
+        self.tables = set()
+        self.created_tables = set()  # Mesas criadas por este cliente (fechadas ao desconectar)
+    
+    def send(self, message):
+        self.deliver(message)
+
+
+class SocketConnection(Connection):
+    """
+    Cliente conectado pelo socket local (mensagens em JSON por linha)
+    
+    Os eventos das mesas são escritos sem esperar o drain; em troca, o
+    buffer de saída de cada cliente tem limite.
+    """
+    
+    def __init__(self, writer):
+        super().__init__(self._write)
+        self.writer = writer
+        self.closed = False
+    
+    def _write(self, message):
+        if self.closed:
+            return
+        self.writer.write(encode(message))
+        if self.writer.transport.get_write_buffer_size() > SOCKET_WRITE_BUFFER_LIMIT:
+            print(f"⚠ Cliente de poker com mais de {SOCKET_WRITE_BUFFER_LIMIT // 1024} KB pendentes: desconectando")
+            self.close()
+    
+    def close(self):
+        """Derruba o socket (o loop de leitura termina e desconecta o cliente)"""
+        if not self.closed:
+            self.closed = True
+            self.writer.transport.abort()
+
+
+class TableRunner:
+    """Loop de uma mesa: distribui mãos, pede ações e transmite eventos"""
+    
+    def __init__(self, server, table_id, table, human_seats, bot_level, action_delay, max_hands):
+        self.server = server
+        self.table_id = table_id
+        self.table = table
+        self.human_seats = set(human_seats)
+        self.bot_level = bot_level
+        self.action_delay = action_delay
+        self.max_hands = max_hands
+        self.rng = random.Random(table.rng.random())
+        
+        self.subscribers = set()
+        self.seat_owners = {}  # assento humano -> Connection
+        self.pending_action = None  # Future aguardando um assento humano
+        self.waiting_seat = None
+        self.hands_played = 0
+        self.task = None
+    
+    def _broadcast(self, events):
+        """Envia eventos aos inscritos (eventos privados só ao dono do assento)"""
+        for code, args, private_seat in events:
+            message = [MSG_EVENT, self.table_id, code, *args]
+            if private_seat is None:
+                for connection in self.subscribers:
+                    connection.send(message)
+            else:
+                owner = self.seat_owners.get(private_seat)
+                if owner is not None:
+                    owner.send(message)
+    
+    async def run(self):
+        """Joga mãos até a mesa ser fechada (ou atingir max_hands)"""
+        table = self.table
+        while self.max_hands is None or self.hands_played < self.max_hands:
+            self._broadcast(table.start_hand())
+            
+            while table.to_act is not None:
+                seat = table.to_act
+                to_call, min_raise, max_raise = table.legal_actions()
+                self._broadcast([(EV_TURN, [seat, to_call, min_raise, max_raise, table.pot], None)])
+                
+                if seat in self.human_seats:
+                    events = await self._wait_human(seat)
+                else:
+                    if self.action_delay:
+                        await asyncio.sleep(self.action_delay)
+                    action, amount = choose_action(table, seat, self.rng, self.bot_level)
+                    events = table.act(seat, action, amount)
+                    # Cede a vez para as outras mesas
+                    await asyncio.sleep(0)
+                
+                self._broadcast(events)
+            
+            self.hands_played += 1
+            if self.action_delay:
+                await asyncio.sleep(self.action_delay * 2)
+    
+    async def _wait_human(self, seat):
+        """Espera uma ação válida do dono do assento"""
+        while True:
+            self.waiting_seat = seat
+            self.pending_action = asyncio.get_running_loop().create_future()
+            action, amount = await self.pending_action
+            self.pending_action = None
+            try:
+                return self.table.act(seat, action, amount)
+            except ValueError as e:
+                owner = self.seat_owners.get(seat)
+                if owner is not None:
+                    owner.send([MSG_ERROR, self.table_id, str(e)])
+    
+    def submit(self, connection, seat, action, amount):
+        """Recebe a ação de um cliente para um assento humano"""
+        try:
+            validate_action(action, amount)
+        except ValueError as e:
+            connection.send([MSG_ERROR, self.table_id, str(e)])
+        else:
+            self._submit_valid(connection, seat, action, amount)
+    
+    def _submit_valid(self, connection, seat, action, amount):
+        if self.seat_owners.get(seat) is not connection:
+            connection.send([MSG_ERROR, self.table_id, f"assento {seat} não pertence a este cliente"])
+        elif self.pending_action is None or self.waiting_seat != seat or self.pending_action.done():
+            connection.send([MSG_ERROR, self.table_id, f"não é a vez do assento {seat}"])
+        else:
+            self.pending_action.set_result((action, amount))
+
+
+class TableServer:
+    """Hospeda as mesas e atende os clientes"""
+    
+    def __init__(self):
+        self.tables = {}
+        self.next_table_id = 1
+    
+    def create_table(self, seats=6, human_seats=(), stack=1000, small_blind=5, big_blind=10,
+                     bot_level='medium', action_delay=0.0, max_hands=None, seed=None):
+        """
+        Cria uma mesa e começa a jogar (deve ser chamado dentro do loop asyncio)
+        
+        Args:
+            seats: Número de assentos
+            human_seats: Assentos controlados por clientes (o resto é bot)
+            stack: Fichas iniciais
+            small_blind: Valor do small blind
+            big_blind: Valor do big blind
+            bot_level: Dificuldade dos bots (ver BOT_LEVELS)
+            action_delay: Pausa (s) antes de cada ação de bot (0 = o mais rápido possível)
+            max_hands: Encerra a mesa após N mãos (None = sem limite)
+            seed: Semente do embaralhamento
+        
+        Returns:
+            int: Identificador da mesa
+        """
+        table_id = self.next_table_id
+        self.next_table_id += 1
+        
+        table = PokerTable(seats, stack, small_blind, big_blind, seed)
+        runner = TableRunner(self, table_id, table, human_seats, bot_level, action_delay, max_hands)
+        runner.task = asyncio.get_running_loop().create_task(runner.run())
+        runner.task.add_done_callback(lambda task: self._on_table_done(table_id, task))
+        self.tables[table_id] = runner
+        return table_id
+    
+    def _on_table_done(self, table_id, task):
+        """Tira a mesa encerrada do servidor e mostra erros que derrubaram seu loop"""
+        runner = self.tables.pop(table_id, None)
+        if runner is not None:
+            for connection in runner.subscribers:
+                connection.tables.discard(table_id)
+        
+        if not task.cancelled() and task.exception() is not None:
+            print(f"✗ Mesa de poker encerrada por erro: {task.exception()!r}")
+            if runner is not None:
+                for connection in runner.subscribers:
+                    connection.send([MSG_ERROR, table_id, "mesa encerrada por erro"])
+    
+    async def close_table(self, table_id):
+        """Encerra a task da mesa"""
+        runner = self.tables.pop(table_id, None)
+        if runner is None:
+            return
+        runner.task.cancel()
+        try:
+            await runner.task
+        except asyncio.CancelledError:
+            pass
+        for connection in runner.subscribers:
+            connection.tables.discard(table_id)
+    
+    def connect(self, deliver):
+        """
+        Conecta um cliente em processo
+        
+        Args:
+            deliver: Função chamada com cada mensagem para o cliente
+        
+        Returns:
+            Connection: Conexão a ser passada em handle_message
+        """
+        return Connection(deliver)
+    
+    def disconnect(self, connection):
+        """
+        Remove o cliente de todas as mesas e fecha as que ele criou
+        
+        Sem isso, um cliente que sai antes de ler MSG_CREATED (e portanto
+        sem saber o id para mandar MSG_CLOSE) deixaria a mesa esperando
+        para sempre pelo assento humano.
+        """
+        for table_id in list(connection.tables):
+            self._leave(connection, table_id)
+        for table_id in connection.created_tables:
+            if table_id in self.tables:
+                asyncio.get_running_loop().create_task(self.close_table(table_id))
+        connection.created_tables.clear()
+    
+    def handle_message(self, connection, message):
+        """
+        Processa uma mensagem de um cliente
+        
+        Args:
+            connection: Connection de origem
+            message: Lista da mensagem (ver protocol.py)
+        """
+        op = message[0]
+        try:
+            if op == MSG_CREATE:
+                _, request_id, seats, human_seats, stack, small_blind, big_blind, bot_level, action_delay = message
+                table_id = self.create_table(seats, human_seats, stack, small_blind, big_blind, bot_level, action_delay)
+                connection.created_tables.add(table_id)
+                connection.send([MSG_CREATED, request_id, table_id])
+            
+            elif op == MSG_JOIN:
+                _, table_id, seats = message
+                self._join(connection, table_id, seats)
+            
+            elif op == MSG_ACT:
+                _, table_id, seat, action, amount = message
+                runner = self._runner(table_id)
+                runner.submit(connection, seat, action, amount)
+            
+            elif op == MSG_LEAVE:
+                self._leave(connection, message[1])
+            
+            elif op == MSG_CLOSE:
+                self._runner(message[1])
+                asyncio.get_running_loop().create_task(self.close_table(message[1]))
+            
+            else:
+                raise ValueError(f"operação desconhecida: {op}")
+        
+        except (ValueError, KeyError, TypeError) as e:
+            table_id = message[1] if len(message) > 1 and op != MSG_CREATE else 0
+            connection.send([MSG_ERROR, table_id, str(e)])
+    
+    def _runner(self, table_id):
+        runner = self.tables.get(table_id)
+        if runner is None:
+            raise KeyError(f"mesa {table_id} não existe")
+        return runner
+    
+    def _join(self, connection, table_id, seats):
+        """Inscreve o cliente nos eventos da mesa e reserva assentos humanos"""
+        runner = self._runner(table_id)
+        for seat in seats:
+            if seat not in runner.human_seats:
+                raise ValueError(f"assento {seat} não é humano")
+            if runner.seat_owners.get(seat) not in (None, connection):
+                raise ValueError(f"assento {seat} já ocupado")
+        
+        for seat in seats:
+            runner.seat_owners[seat] = connection
+        runner.subscribers.add(connection)
+        connection.tables.add(table_id)
+        connection.send([MSG_JOINED, table_id, list(seats)])
+        
+        # Se a mesa já espera por este assento, repete a vez para o novo dono
+        if runner.pending_action is not None and runner.waiting_seat in seats:
+            table = runner.table
+            to_call, min_raise, max_raise = table.legal_actions()
+            seat = runner.waiting_seat
+            hole = table.hole[seat]
+            connection.send([MSG_EVENT, table_id, EV_HOLE, seat, *hole])
+            connection.send([MSG_EVENT, table_id, EV_TURN, seat, to_call, min_raise, max_raise, table.pot])
+    
+    def _leave(self, connection, table_id):
+        runner = self.tables.get(table_id)
+        connection.tables.discard(table_id)
+        if runner is None:
+            return
+        runner.subscribers.discard(connection)
+        for seat, owner in list(runner.seat_owners.items()):
+            if owner is connection:
+                del runner.seat_owners[seat]
+    
+    async def serve(self, host="127.0.0.1", port=0):
+        """
+        Abre o socket local
+        
+        Args:
+            host: Endereço (padrão: apenas a máquina local)
+            port: Porta (0 = escolhida pelo sistema)
+        
+        Returns:
+            asyncio.Server: Servidor aberto (use .sockets[0].getsockname() para a porta)
+        """
+        return await asyncio.start_server(self._handle_socket, host, port)
+    
+    async def _handle_socket(self, reader, writer):
+        """Atende um cliente do socket até ele desconectar"""
+        connection = SocketConnection(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = decode(line)
+                except ValueError as e:
+                    connection.send([MSG_ERROR, 0, f"mensagem inválida: {e}"])
+                    continue
+                self.handle_message(connection, message)
+        except ConnectionError:
+            pass
+        finally:
+            self.disconnect(connection)
+            connection.close()
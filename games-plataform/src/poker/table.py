@@ -0,0 +1,304 @@
+"""
+table.py - Regras de uma mesa de Texas Hold'em (sem limite)
+
+A mesa é puramente lógica: não conhece pygame, asyncio nem rede. Cada
+chamada devolve a lista de eventos gerados, no formato
+(código, [argumentos], assento_privado). Quando assento_privado não é None,
+o evento só deve ser enviado ao dono daquele assento (cartas fechadas).
+"""
+import random
+from src.poker.cards import new_deck, evaluate
+
+# Ações
+FOLD = 0
+CHECK = 1
+CALL = 2
+RAISE = 3
+BLIND = 4  # Só aparece em eventos (blinds postados)
+
+# Códigos de evento
+EV_HAND_START = "h"  # [mão, dealer, fichas por assento]
+EV_HOLE = "o"        # [assento, carta1, carta2] (privado)
+EV_TURN = "t"        # [assento, para_pagar, aumento_mínimo, aumento_máximo, pote]
+EV_ACTION = "a"      # [assento, ação, valor, fichas_restantes]
+EV_BOARD = "b"       # [cartas da mesa...]
+EV_SHOWDOWN = "s"    # [[assento, carta1, carta2, categoria], ...]
+EV_HAND_END = "e"    # [ganhos por assento, fichas por assento]
+
+class PokerTable:
+    """Estado e regras de uma mesa"""
+    
+    def __init__(self, seats=6, stack=1000, small_blind=5, big_blind=10, seed=None):
+        """
+        Args:
+            seats: Número de assentos
+            stack: Fichas iniciais (e de recompra) de cada jogador
+            small_blind: Valor do small blind
+            big_blind: Valor do big blind
+            seed: Semente do embaralhamento (None = aleatório)
+        """
+        self.seats = seats
+        self.starting_stack = stack
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.rng = random.Random(seed)
+        
+        self.stacks = [stack] * seats
+        self.dealer = seats - 1
+        self.hand_number = 0
+        
+        self.in_hand = [False] * seats
+        self.folded = [False] * seats
+        self.all_in = [False] * seats
+        self.hole = [None] * seats
+        self.board = []
+        self.deck = []
+        self.bets = [0] * seats          # Apostas da rodada atual
+        self.contributed = [0] * seats   # Total colocado no pote nesta mão
+        self.current_bet = 0
+        self.last_raise = big_blind
+        self.pending = set()             # Quem ainda precisa agir nesta rodada
+        self.to_act = None
+    
+    @property
+    def pot(self):
+        """int: Total de fichas no pote"""
+        return sum(self.contributed)
+    
+    def _next_seat(self, seat, condition):
+        """Próximo assento (em sentido horário) que satisfaz a condição"""
+        for offset in range(1, self.seats + 1):
+            candidate = (seat + offset) % self.seats
+            if condition(candidate):
+                return candidate
+        return None
+    
+    def _can_act(self, seat):
+        return self.in_hand[seat] and not self.folded[seat] and not self.all_in[seat]
+    
+    def _live(self, seat):
+        return self.in_hand[seat] and not self.folded[seat]
+    
+    def start_hand(self):
+        """
+        Embaralha, posta os blinds e distribui as cartas
+        
+        Returns:
+            list: Eventos gerados
+        """
+        # Mesa sem adversários suficientes: todos recompram
+        if sum(1 for stack in self.stacks if stack > 0) < 2:
+            self.stacks = [self.starting_stack] * self.seats
+        
+        self.hand_number += 1
+        self.in_hand = [stack > 0 for stack in self.stacks]
+        self.folded = [False] * self.seats
+        self.all_in = [False] * self.seats
+        self.bets = [0] * self.seats
+        self.contributed = [0] * self.seats
+        self.board = []
+        self.deck = new_deck()
+        self.rng.shuffle(self.deck)
+        
+        self.dealer = self._next_seat(self.dealer, lambda s: self.in_hand[s])
+        players = sum(self.in_hand)
+        if players == 2:
+            # Heads-up: o dealer posta o small blind
+            small = self.dealer
+        else:
+            small = self._next_seat(self.dealer, lambda s: self.in_hand[s])
+        big = self._next_seat(small, lambda s: self.in_hand[s])
+        
+        events = [(EV_HAND_START, [self.hand_number, self.dealer, list(self.stacks)], None)]
+        
+        self._post(small, self.small_blind)
+        self._post(big, self.big_blind)
+        events.append((EV_ACTION, [small, BLIND, self.bets[small], self.stacks[small]], None))
+        events.append((EV_ACTION, [big, BLIND, self.bets[big], self.stacks[big]], None))
+        self.current_bet = max(self.bets)
+        self.last_raise = self.big_blind
+        
+        for seat in range(self.seats):
+            if self.in_hand[seat]:
+                self.hole[seat] = [self.deck.pop(), self.deck.pop()]
+                events.append((EV_HOLE, [seat, *self.hole[seat]], seat))
+            else:
+                self.hole[seat] = None
+        
+        self.pending = {seat for seat in range(self.seats) if self._can_act(seat)}
+        first = self._next_seat(big, self._can_act)
+        events.extend(self._continue(first))
+        return events
+    
+    def _post(self, seat, amount):
+        """Coloca fichas do jogador na aposta atual"""
+        amount = min(amount, self.stacks[seat])
+        self.stacks[seat] -= amount
+        self.bets[seat] += amount
+        self.contributed[seat] += amount
+        if self.stacks[seat] == 0:
+            self.all_in[seat] = True
+    
+    def legal_actions(self):
+        """
+        Limites da ação do jogador da vez
+        
+        Returns:
+            tuple: (para_pagar, aumento_mínimo, aumento_máximo), com os
+                aumentos expressos como o total apostado na rodada
+        """
+        seat = self.to_act
+        to_call = min(self.current_bet - self.bets[seat], self.stacks[seat])
+        max_raise = self.bets[seat] + self.stacks[seat]
+        min_raise = min(self.current_bet + self.last_raise, max_raise)
+        return to_call, min_raise, max_raise
+    
+    def act(self, seat, action, amount=0):
+        """
+        Aplica a ação do jogador da vez
+        
+        Args:
+            seat: Assento que está agindo
+            action: FOLD, CHECK, CALL ou RAISE
+            amount: Para RAISE, o total apostado na rodada após o aumento
+        
+        Returns:
+            list: Eventos gerados
+        
+        Raises:
+            ValueError: Se não for a vez do assento ou a ação for inválida
+        """
+        if seat != self.to_act:
+            raise ValueError(f"não é a vez do assento {seat}")
+        
+        to_call, min_raise, max_raise = self.legal_actions()
+        
+        if action == FOLD:
+            self.folded[seat] = True
+        elif action == CHECK:
+            if to_call > 0:
+                raise ValueError("não é possível dar check com aposta pendente")
+        elif action == CALL:
+            self._post(seat, to_call)
+        elif action == RAISE:
+            if amount >= max_raise:
+                amount = max_raise  # All-in
+            elif amount < min_raise:
+                raise ValueError(f"aumento mínimo é {min_raise}")
+            if amount <= self.current_bet:
+                # All-in menor que a aposta atual conta como call
+                self._post(seat, amount - self.bets[seat])
+            else:
+                raise_size = amount - self.current_bet
+                self._post(seat, amount - self.bets[seat])
+                if raise_size >= self.last_raise:
+                    self.last_raise = raise_size
+                self.current_bet = amount
+                # Todos os outros precisam responder ao aumento
+                self.pending = {s for s in range(self.seats) if self._can_act(s)}
+        else:
+            raise ValueError(f"ação desconhecida: {action}")
+        
+        self.pending.discard(seat)
+        events = [(EV_ACTION, [seat, action, self.bets[seat], self.stacks[seat]], None)]
+        events.extend(self._continue(self._next_seat(seat, self._can_act)))
+        return events
+    
+    def _continue(self, candidate):
+        """
+        Define o próximo a agir ou avança a mão (nova rodada / fim)
+        
+        Args:
+            candidate: Próximo assento que pode agir (ou None)
+        
+        Returns:
+            list: Eventos gerados
+        """
+        live = [seat for seat in range(self.seats) if self._live(seat)]
+        if len(live) == 1:
+            return self._finish([live[0]])
+        
+        # Ainda há quem precise agir nesta rodada
+        if self.pending and candidate is not None:
+            for offset in range(self.seats):
+                seat = (candidate + offset) % self.seats
+                if seat in self.pending:
+                    self.to_act = seat
+                    return []
+        
+        return self._next_street()
+    
+    def _next_street(self):
+        """Fecha a rodada de apostas e abre as próximas cartas"""
+        events = []
+        self.bets = [0] * self.seats
+        self.current_bet = 0
+        self.last_raise = self.big_blind
+        
+        can_act = [seat for seat in range(self.seats) if self._can_act(seat)]
+        while len(self.board) < 5:
+            self.deck.pop()  # Carta queimada
+            self.board.extend(self.deck.pop() for _ in range(3 if not self.board else 1))
+            events.append((EV_BOARD, list(self.board), None))
+            
+            # Com no máximo um jogador com fichas, só se abrem as cartas
+            if len(can_act) >= 2:
+                self.pending = set(can_act)
+                first = self._next_seat(self.dealer, self._can_act)
+                self.to_act = first
+                return events
+        
+        events.extend(self._showdown())
+        return events
+    
+    def _showdown(self):
+        """Compara as mãos e divide os potes (incluindo potes paralelos)"""
+        live = [seat for seat in range(self.seats) if self._live(seat)]
+        ranking = {seat: evaluate(self.hole[seat] + self.board) for seat in live}
+        events = [(EV_SHOWDOWN, [[seat, *self.hole[seat], ranking[seat][0]] for seat in live], None)]
+        events.extend(self._finish(live, ranking))
+        return events
+    
+    def _finish(self, live, ranking=None):
+        """
+        Distribui o pote e encerra a mão
+        
+        Args:
+            live: Assentos ainda na mão
+            ranking: Avaliação das mãos (None se todos os outros desistiram)
+        
+        Returns:
+            list: Eventos gerados
+        """
+        winnings = [0] * self.seats
+        
+        if ranking is None:
+            winnings[live[0]] = self.pot
+        else:
+            # Um pote por nível de contribuição (all-ins criam potes paralelos)
+            levels = sorted(set(self.contributed))
+            previous = 0
+            for level in levels:
+                if level == 0:
+                    continue
+                portion = sum(min(c, level) - min(c, previous) for c in self.contributed)
+                eligible = [seat for seat in live if self.contributed[seat] >= level]
+                previous = level
+                if not eligible:
+                    # Sobra de quem desistiu: vai para o melhor entre os que cobriram o nível anterior
+                    eligible = live
+                best = max(ranking[seat] for seat in eligible)
+                winners = [seat for seat in eligible if ranking[seat] == best]
+                share, remainder = divmod(portion, len(winners))
+                for seat in winners:
+                    winnings[seat] += share
+                # Fichas indivisíveis vão para o primeiro vencedor após o dealer
+                first = self._next_seat(self.dealer, lambda s: s in winners)
+                winnings[first] += remainder
+        
+        for seat in range(self.seats):
+            self.stacks[seat] += winnings[seat]
+        
+        self.to_act = None
+        self.pending = set()
+        return [(EV_HAND_END, [winnings, list(self.stacks)], None)]
@@ -9,6 +9,8 @@ class Scene:
         self.assets = assets
         self.next_scene = None
         self.transition_type = TransitionType.FADE
+        self.tweens = None  # TweenGroup da cena (definido pelo SceneManager)
+        self.stats = None  # StatsManager (definido pelo SceneManager após o boot)
     
     def handle_events(self, events):
         raise NotImplementedError
@@ -23,4 +25,8 @@ class Scene:
         pass
     
     def on_exit(self):
+        pass
+    
+    def apply_quality(self, quality):
+        """Ajusta efeitos ao nível de qualidade (dict de QUALITY_TIERS)"""
         pass
\ No newline at end of file
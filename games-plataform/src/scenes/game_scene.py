@@ -0,0 +1,102 @@
+"""
+game_scene.py - Cena base para os jogos da plataforma
+"""
+import pygame
+from src.scenes.base_scene import Scene
+from src.components.button import Button
+from src.components.particles import ParticleSystem
+from src.components.compositor import LayerCompositor, ButtonLayers, LAYER_STATIC, LAYER_DYNAMIC
+from src.utils.constants import SceneType, KIND_HAND
+
+class GameScene(Scene):
+    """Cena base de um jogo: fundo, título e botão de voltar"""
+    
+    # Nome exibido no topo da tela (definido pelas subclasses)
+    title = "GAME"
+    # Chave do jogo nas estatísticas (definida pelas subclasses)
+    stats_key = "game"
+    background_color = (20, 90, 50)
+    
+    def __init__(self, screen, assets):
+        super().__init__(screen, assets)
+        self.buttons = {}
+        self._setup_back_button()
+        
+        # Fundo e título em cache; as subclasses inserem suas camadas abaixo dos botões
+        self.title_font = pygame.font.Font(None, 80)
+        self.layers = LayerCompositor(screen)
+        self.layers.add_layer('background', LAYER_STATIC, self._draw_background)
+        self.button_layers = ButtonLayers(self.layers, self.buttons)
+        
+        # Efeitos de vitória (cascata de cartas, fichas) acima de tudo
+        self.particles = ParticleSystem(max_particles=600, pool_size=8)
+        self.layers.add_layer('particles', LAYER_DYNAMIC, self.particles.draw)
+    
+    def _setup_back_button(self):
+        """Configura o botão de voltar (canto superior esquerdo)"""
+        back_arrow_size = 150
+        back_arrow_scaled = self.assets.get_scaled_image('back_arrow', (back_arrow_size, back_arrow_size))
+        if back_arrow_scaled:
+            self.buttons['back'] = Button(back_arrow_scaled, 80, 80, 'back', self.assets)
+    
+    def handle_events(self, events):
+        """Processa eventos comuns a todos os jogos"""
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for button in self.buttons.values():
+            button.update_hover(mouse_pos, self.tweens)
+        
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                if 'back' in self.buttons and self.buttons['back'].is_clicked(mouse_pos):
+                    print("🔙 Voltando para a seleção de jogos")
+                    self.next_scene = SceneType.GAME_SELECTION
+    
+    def record_result(self, player, outcome, amount=0, kind=KIND_HAND, details=None):
+        """
+        Registra o resultado de uma mão/partida nas estatísticas
+        
+        Args:
+            player: Nome do jogador
+            outcome: RESULT_WIN, RESULT_LOSS ou RESULT_DRAW
+            amount: Saldo do jogador no resultado
+            kind: KIND_HAND (uma mão) ou KIND_GAME (partida completa)
+            details: Dados extras (dict serializável em JSON)
+        """
+        if self.stats is not None:
+            self.stats.record(self.stats_key, player, outcome, amount, kind, details)
+    
+    def _draw_background(self, surface):
+        """Camada estática: fundo e título"""
+        surface.fill(self.background_color)
+        
+        title = self.title_font.render(self.title, True, (255, 255, 255))
+        title_rect = title.get_rect(center=(surface.get_width() // 2, 120))
+        surface.blit(title, title_rect)
+    
+    def update(self, dt):
+        """
+        Atualiza os efeitos de partículas
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        self.particles.update(dt)
+    
+    def apply_quality(self, quality):
+        """Menos partículas nos níveis de qualidade baixos"""
+        self.particles.density = quality['particles']
+    
+    def draw(self):
+        """Desenha as camadas da cena (partes paradas vêm do cache)"""
+        self.button_layers.update()
+        self.layers.draw()
+    
+    def on_enter(self):
+        """Chamado ao entrar na cena"""
+        print(f"📍 Cena ativa: {self.title}")
+    
+    def on_exit(self):
+        """Chamado ao sair da cena"""
+        print(f"📍 Saindo de {self.title}")
+        self.particles.clear()
@@ -4,7 +4,11 @@ game_selection_scene.py - Cena de seleção de jogos
 import pygame
 from src.scenes.base_scene import Scene
 from src.components.button import Button
-from src.utils.constants import SceneType
+from src.components.particles import ParticleSystem
+from src.components.compositor import (
+    LayerCompositor, ButtonLayers, LAYER_STATIC, LAYER_SEMI_STATIC, LAYER_DYNAMIC,
+)
+from src.utils.constants import SceneType, CAROUSEL_SLIDE_DURATION
 
 class GameSelectionScene(Scene):
     """Menu de seleção de jogos disponíveis"""
@@ -12,41 +16,35 @@ class GameSelectionScene(Scene):
     def __init__(self, screen, assets):
         super().__init__(screen, assets)
         
-        # Carrega background
-        self.background = assets.get_image('selection_menu_bg')
+        # Carrega background (já no tamanho da tela)
+        self.background = assets.get_scaled_image('selection_menu_bg', screen.get_size())
         if self.background:
-            self.background = self.background.convert()
             print(f"✓ Background GameSelection carregado: {self.background.get_size()}")
         
         # MAPEAMENTO: cada jogo com seu ícone e cena
         self.games_data = [
             {
-                'icon': assets.get_image('poker_icon'),
+                'icon_key': 'poker_icon',
                 'scene': SceneType.POKER_GAME,
                 'name': 'Poker'
             },
             {
-                'icon': assets.get_image('paciencia_icon'),
+                'icon_key': 'paciencia_icon',
                 'scene': SceneType.PACIENCIA_GAME,
                 'name': 'Paciência'
             },
             {
-                'icon': assets.get_image('jogo_da_velha_icon'),
+                'icon_key': 'jogo_da_velha_icon',
                 'scene': SceneType.JOGO_DA_VELHA_GAME,
                 'name': 'Jogo da Velha'
             },
             {
-                'icon': assets.get_image('blackjack_icon'),
+                'icon_key': 'blackjack_icon',
                 'scene': SceneType.BLACKJACK_GAME,
                 'name': 'Blackjack'
             }
         ]
         
-        # Carrega setas de navegação
-        self.arrow_left = assets.get_image('arrow_left')
-        self.arrow_right = assets.get_image('arrow_right')
-        self.back_arrow = assets.get_image('back_arrow')
-        
         # Índice do jogo atual no carrossel
         self.current_game_index = 0
         
@@ -56,7 +54,26 @@ class GameSelectionScene(Scene):
         # Escala todos os ícones
         self.game_icon_scaled = []
         
+        # Brilho ao trocar o jogo do carrossel
+        self.particles = ParticleSystem(max_particles=600, pool_size=8)
+        
+        self.font_large = pygame.font.Font(None, 80)
+        self.font_small = pygame.font.Font(None, 30)
+        
         self._setup_elements()
+        self._setup_layers()
+    
+    def _setup_layers(self):
+        """
+        Fundo, textos e botões parados ficam em cache; só botões animados e
+        partículas são desenhados a cada frame
+        """
+        self.layers = LayerCompositor(self.screen)
+        self.layers.add_layer('background', LAYER_STATIC, self._draw_background)
+        self.layers.add_layer('titles', LAYER_STATIC, self._draw_titles)
+        self.layers.add_layer('game_name', LAYER_SEMI_STATIC, self._draw_game_name)
+        self.button_layers = ButtonLayers(self.layers, self.buttons)
+        self.layers.add_layer('particles', LAYER_DYNAMIC, self.particles.draw)
     
     def _setup_elements(self):
         """Configura todos os elementos visuais da cena"""
@@ -68,14 +85,15 @@ class GameSelectionScene(Scene):
         # Escala todos os ícones de jogos (tamanho pequeno para navegação)
         icon_size = int(screen_width * 0.15)
         for game_data in self.games_data:
-            if game_data['icon']:
-                scaled_icon = pygame.transform.scale(game_data['icon'], (icon_size, icon_size))
+            scaled_icon = self.assets.get_scaled_image(game_data['icon_key'], (icon_size, icon_size))
+            if scaled_icon:
                 self.game_icon_scaled.append(scaled_icon)
             else:
                 print(f"⚠️ Ícone não carregado para {game_data['name']}")
                 # Cria um placeholder
                 placeholder = pygame.Surface((icon_size, icon_size))
                 placeholder.fill((100, 100, 100))
+                self.assets.track_surface(placeholder, f"placeholder {game_data['icon_key']}")
                 self.game_icon_scaled.append(placeholder)
         
         # Configurar botões de navegação
@@ -91,34 +109,37 @@ class GameSelectionScene(Scene):
         arrow_distance = icon_size + 80
         
         # Botão seta esquerda
-        if self.arrow_left:
-            arrow_left_scaled = pygame.transform.scale(self.arrow_left, (arrow_size, arrow_size))
+        arrow_left_scaled = self.assets.get_scaled_image('arrow_left', (arrow_size, arrow_size))
+        if arrow_left_scaled:
             self.buttons['arrow_left'] = Button(
                 arrow_left_scaled,
                 center_x - arrow_distance,
                 center_y - 50,
-                'arrow_left'
+                'arrow_left',
+                self.assets
             )
         
         # Botão seta direita
-        if self.arrow_right:
-            arrow_right_scaled = pygame.transform.scale(self.arrow_right, (arrow_size, arrow_size))
+        arrow_right_scaled = self.assets.get_scaled_image('arrow_right', (arrow_size, arrow_size))
+        if arrow_right_scaled:
             self.buttons['arrow_right'] = Button(
                 arrow_right_scaled,
                 center_x + arrow_distance,
                 center_y - 50,
-                'arrow_right'
+                'arrow_right',
+                self.assets
             )
         
         # Botão de voltar (canto superior esquerdo)
-        if self.back_arrow:
-            back_arrow_size = 150
-            back_arrow_scaled = pygame.transform.scale(self.back_arrow, (back_arrow_size, back_arrow_size))
+        back_arrow_size = 150
+        back_arrow_scaled = self.assets.get_scaled_image('back_arrow', (back_arrow_size, back_arrow_size))
+        if back_arrow_scaled:
             self.buttons['back'] = Button(
                 back_arrow_scaled,
                 80,
                 80,
-                'back'
+                'back',
+                self.assets
             )
     
     def _create_current_game_button(self):
@@ -128,28 +149,33 @@ class GameSelectionScene(Scene):
         center_x = screen_width // 2
         center_y = screen_height // 2
         
-        # Pega o ícone do jogo atual
-        current_icon = self.game_icon_scaled[self.current_game_index]
-        
-        # Escala para tamanho grande (botão central)
+        # Ícone do jogo atual em tamanho grande (botão central), reaproveitado do cache
         current_game_size = 400
-        current_game_scaled = pygame.transform.scale(
-            current_icon,
-            (current_game_size, current_game_size)
-        )
+        icon_key = self.games_data[self.current_game_index]['icon_key']
+        current_game_scaled = self.assets.get_scaled_image(icon_key, (current_game_size, current_game_size))
+        if not current_game_scaled:
+            current_game_scaled = pygame.transform.scale(
+                self.game_icon_scaled[self.current_game_index],
+                (current_game_size, current_game_size)
+            )
+            self.assets.track_surface(current_game_scaled, f"placeholder {icon_key}@{current_game_size}")
         
         # Cria/atualiza o botão
         self.buttons['selected_game'] = Button(
             current_game_scaled,
             center_x,
             center_y - 50,
-            'selected_game'
+            'selected_game',
+            self.assets
         )
     
     def next_game(self):
         """Avança para o próximo jogo no carrossel"""
         self.current_game_index = (self.current_game_index + 1) % len(self.games_data)
         self._create_current_game_button()
+        self.layers.invalidate('game_name')
+        self._animate_selected_game(direction=1)
+        self._emit_carousel_sparkle()
         
         current_game_name = self.games_data[self.current_game_index]['name']
         print(f"➡️ Jogo selecionado: {current_game_name}")
@@ -158,17 +184,42 @@ class GameSelectionScene(Scene):
         """Volta para o jogo anterior no carrossel"""
         self.current_game_index = (self.current_game_index - 1) % len(self.games_data)
         self._create_current_game_button()
+        self.layers.invalidate('game_name')
+        self._animate_selected_game(direction=-1)
+        self._emit_carousel_sparkle()
         
         current_game_name = self.games_data[self.current_game_index]['name']
         print(f"⬅️ Jogo selecionado: {current_game_name}")
     
+    def _animate_selected_game(self, direction):
+        """
+        Faz o novo ícone central deslizar e aparecer (fade in)
+        
+        Args:
+            direction: 1 se veio da direita (próximo), -1 se veio da esquerda
+        """
+        if self.tweens is None:
+            return
+        
+        button = self.buttons['selected_game']
+        center_x = button.x
+        button.x = center_x + direction * 120
+        button.alpha = 0
+        self.tweens.tween(button, 'x', center_x, CAROUSEL_SLIDE_DURATION, easing='out_cubic')
+        self.tweens.tween(button, 'alpha', 255, CAROUSEL_SLIDE_DURATION, easing='out_quad')
+    
+    def _emit_carousel_sparkle(self):
+        """Dispara o brilho em volta do ícone central"""
+        center = self.buttons['selected_game'].rect.center
+        self.particles.emit('sparkle', center[0], center[1])
+    
     def handle_events(self, events):
         """Processa eventos da seleção de jogos"""
         mouse_pos = pygame.mouse.get_pos()
         
         # Atualiza hover de todos os botões
         for button in self.buttons.values():
-            button.update_hover(mouse_pos)
+            button.update_hover(mouse_pos, self.tweens)
         
         # Processa cliques
         for event in events:
@@ -199,49 +250,52 @@ class GameSelectionScene(Scene):
         print(f"🎮 Iniciando {game_name}!")
         self.next_scene = game_scene
     
+    def update(self, dt):
+        """
+        Atualiza as partículas do carrossel
+        
+        Args:
+            dt: Delta time em SEGUNDOS
+        """
+        self.particles.update(dt)
+    
+    def on_enter(self):
+        """Recria o ícone central: um slide interrompido ao sair não fica pela metade"""
+        self._create_current_game_button()
+    
+    def on_exit(self):
+        """Chamado ao sair da cena"""
+        self.particles.clear()
+    
+    def apply_quality(self, quality):
+        """Menos brilho do carrossel nos níveis de qualidade baixos"""
+        self.particles.density = quality['particles']
+    
     def draw(self):
-        """Desenha a tela de seleção"""
-        screen_size = self.screen.get_size()
-        
-        # Limpa a tela
-        self.screen.fill((0, 0, 0))
-        
-        # Desenha background
+        """Desenha a tela de seleção (partes paradas vêm do cache)"""
+        self.button_layers.update()
+        self.layers.draw()
+    
+    def _draw_background(self, surface):
+        """Camada estática: background (já no tamanho da tela)"""
+        surface.fill((0, 0, 0))
         if self.background:
-            try:
-                scaled_bg = pygame.transform.scale(self.background, screen_size)
-                self.screen.blit(scaled_bg, (0, 0))
-            except Exception as e:
-                print(f"❌ Erro no background: {e}")
-                self.screen.fill((120, 80, 200))  # Fallback roxo
-        
-        # Desenha todos os botões
-        for button in self.buttons.values():
-            button.draw(self.screen)
-        
-        # Desenha textos da UI
-        self._draw_ui_text()
+            surface.blit(self.background, (0, 0))
+        else:
+            surface.fill((120, 80, 200))  # Fallback roxo
     
-    def _draw_ui_text(self):
-        """Desenha texto da UI"""
-        screen_width = self.screen.get_width()
-        font_large = pygame.font.Font(None, 80)
-        font_small = pygame.font.Font(None, 30)
+    def _draw_titles(self, surface):
+        """Camada estática: título e instruções"""
+        screen_width = surface.get_width()
         
         # Título principal
-        title = font_large.render("SELECT GAME", True, (255, 255, 255))
-        title_shadow = font_large.render("SELECT GAME", True, (80, 40, 120))
+        title = self.font_large.render("SELECT GAME", True, (255, 255, 255))
+        title_shadow = self.font_large.render("SELECT GAME", True, (80, 40, 120))
         title_rect = title.get_rect(center=(screen_width // 2, 120))
         
         # Sombra
-        self.screen.blit(title_shadow, (title_rect.x + 4, title_rect.y + 4))
-        self.screen.blit(title, title_rect)
-        
-        # Nome do jogo atual
-        current_game_name = self.games_data[self.current_game_index]['name']
-        game_name_text = font_large.render(current_game_name, True, (255, 255, 100))
-        game_name_rect = game_name_text.get_rect(center=(screen_width // 2, self.screen.get_height() - 150))
-        self.screen.blit(game_name_text, game_name_rect)
+        surface.blit(title_shadow, (title_rect.x + 4, title_rect.y + 4))
+        surface.blit(title, title_rect)
         
         # Instruções
         instructions = [
@@ -251,6 +305,13 @@ class GameSelectionScene(Scene):
         ]
         
         for i, instruction in enumerate(instructions):
-            text = font_small.render(instruction, True, (220, 220, 255))
+            text = self.font_small.render(instruction, True, (220, 220, 255))
             text_rect = text.get_rect(center=(screen_width // 2, 200 + i * 35))
-            self.screen.blit(text, text_rect)
\ No newline at end of file
+            surface.blit(text, text_rect)
+    
+    def _draw_game_name(self, surface):
+        """Camada semi-estática: nome do jogo atual (muda com o carrossel)"""
+        current_game_name = self.games_data[self.current_game_index]['name']
+        game_name_text = self.font_large.render(current_game_name, True, (255, 255, 100))
+        game_name_rect = game_name_text.get_rect(center=(surface.get_width() // 2, surface.get_height() - 150))
+        surface.blit(game_name_text, game_name_rect)
@@ -0,0 +1,10 @@
+"""
+blackjack_game_scene.py - Cena do blackjack
+"""
+from src.scenes.game_scene import GameScene
+
+class BlackjackGameScene(GameScene):
+    """Mesa de blackjack"""
+    
+    title = "BLACKJACK"
+    stats_key = "blackjack"
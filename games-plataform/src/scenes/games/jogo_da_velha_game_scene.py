@@ -0,0 +1,10 @@
+"""
+jogo_da_velha_game_scene.py - Cena do jogo da velha
+"""
+from src.scenes.game_scene import GameScene
+
+class JogoDaVelhaGameScene(GameScene):
+    """Tabuleiro do jogo da velha"""
+    
+    title = "JOGO DA VELHA"
+    stats_key = "jogo_da_velha"
@@ -0,0 +1,452 @@
+"""
+paciencia_game_scene.py - Cena da paciência (Klondike, virando 1 carta)
+
+As regras e o histórico ficam em src.paciencia: cada jogada gera um
+PacienciaState novo que compartilha as pilhas não alteradas com o anterior,
+então desfazer/refazer é só mover o índice do History. A cena guarda a
+seleção, desenha o estado atual e salva a partida ao sair.
+"""
+import json
+import os
+import pygame
+from src.scenes.game_scene import GameScene
+from src.components.compositor import LAYER_SEMI_STATIC
+from src.utils.constants import RESULT_WIN, RESULT_LOSS, KIND_GAME, PACIENCIA_SAVE_PATH
+from src.poker.cards import card_suit
+from src.paciencia.state import (
+    deal, History, PacienciaState, Move, DRAW_MOVE, CARD_VALUES, card_of,
+    STOCK, WASTE, FOUNDATION, TABLEAU, TABLEAU_COLUMNS,
+)
+from src.paciencia.solver import HintSearch
+
+PLAYER = "Jogador 1"
+
+# A fonte padrão não tem os símbolos de naipe: usamos as iniciais em português
+SUIT_LETTERS = "POCE"  # Paus, Ouros, Copas, Espadas
+SUIT_COLORS = [(20, 20, 20), (200, 30, 30), (200, 30, 30), (20, 20, 20)]
+VALUE_NAMES = ["", "A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
+
+# Cartas da cascata de vitória saindo de cada fundação
+PARTICLE_CASCADE_PER_FOUNDATION = 40
+
+SELECTED_COLOR = (255, 220, 80)
+HINT_COLOR = (80, 220, 255)
+SLOT_COLOR = (30, 110, 65)
+
+class PacienciaGameScene(GameScene):
+    """Mesa de paciência"""
+    
+    title = "PACIÊNCIA"
+    stats_key = "paciencia"
+    
+    def __init__(self, screen, assets):
+        super().__init__(screen, assets)
+        self.history = None
+        self.selected = None  # (origem, índice, quantidade de cartas)
+        self.hint = None  # Move sugerido pelo solver
+        self.hint_search = None  # HintSearch em andamento (continua a cada frame)
+        self.message = ""
+        self.recorded = False  # Vitória já registrada nas estatísticas
+        self.card_cache = {}
+        
+        self.font = pygame.font.Font(None, 36)
+        self.font_small = pygame.font.Font(None, 28)
+        self._setup_table()
+        
+        # Retoma a partida salva (a cena é criada na primeira visita e mantida depois)
+        saved = self._load_game()
+        if saved is not None:
+            self._start(saved)
+            self.message = f"Partida retomada ({saved.moves} jogadas)"
+        else:
+            self.new_game()
+        
+        # A mesa só é redesenhada quando o estado, a seleção ou a dica mudam
+        self.layers.add_layer('table', LAYER_SEMI_STATIC, self._draw_table, before='buttons')
+    
+    def _setup_table(self):
+        """Tamanho das cartas e posições das pilhas (proporcionais à tela)"""
+        width, height = self.screen.get_size()
+        self.card_width = width // 11
+        self.card_height = int(self.card_width * 1.4)
+        self.gap = self.card_width // 5
+        
+        left = (width - TABLEAU_COLUMNS * self.card_width - (TABLEAU_COLUMNS - 1) * self.gap) // 2
+        top = max(170, int(height * 0.17))
+        self.column_x = [left + i * (self.card_width + self.gap) for i in range(TABLEAU_COLUMNS)]
+        
+        self.stock_rect = pygame.Rect(self.column_x[0], top, self.card_width, self.card_height)
+        self.waste_rect = pygame.Rect(self.column_x[1], top, self.card_width, self.card_height)
+        self.foundation_rects = [
+            pygame.Rect(self.column_x[3 + suit], top, self.card_width, self.card_height) for suit in range(4)
+        ]
+        self.tableau_top = top + self.card_height + self.gap
+        self.tableau_bottom = height - 80
+    
+    @property
+    def state(self):
+        return self.history.current
+    
+    def new_game(self, seed=None):
+        """Distribui uma partida nova (registra derrota se a anterior ficou pela metade)"""
+        if self.history is not None and self.state.moves and not self.state.is_won():
+            self.record_result(PLAYER, RESULT_LOSS, 0, KIND_GAME, {'moves': self.state.moves})
+        self._start(deal(seed))
+        self.message = "Nova partida"
+    
+    def _start(self, state):
+        self.history = History(state)
+        self.recorded = state.is_won()
+        self._changed()
+    
+    def _changed(self):
+        """O estado exibido mudou: limpa seleção e dica e redesenha a mesa"""
+        self.selected = None
+        self.hint = None
+        self.hint_search = None
+        self.layers.invalidate('table')
+    
+    def play(self, move):
+        """
+        Tenta fazer uma jogada
+        
+        Args:
+            move: Move
+        
+        Returns:
+            bool: True se a jogada foi feita
+        """
+        try:
+            state = self.state.apply(move)
+        except ValueError:
+            self.message = "Jogada inválida"
+            self._changed()
+            return False
+        
+        self.history.push(state)
+        self.message = ""
+        self._changed()
+        
+        if state.is_won() and not self.recorded:
+            self.recorded = True
+            self.message = f"Você venceu em {state.moves} jogadas!"
+            print(f"🏆 Paciência vencida em {state.moves} jogadas")
+            self._emit_win_cascade()
+            self.record_result(PLAYER, RESULT_WIN, 0, KIND_GAME, {'moves': state.moves})
+        return True
+    
+    def _emit_win_cascade(self):
+        """Cartas caindo a partir das fundações"""
+        for rect in self.foundation_rects:
+            self.particles.emit('card_cascade', rect.centerx, rect.centery, count=PARTICLE_CASCADE_PER_FOUNDATION)
+    
+    def undo(self):
+        if self.history.can_undo():
+            self.history.undo()
+            self.message = f"Desfeito ({self.history.index} de {len(self.history.states) - 1})"
+            self._changed()
+    
+    def redo(self):
+        if self.history.can_redo():
+            self.history.redo()
+            self.message = f"Refeito ({self.history.index} de {len(self.history.states) - 1})"
+            self._changed()
+    
+    def show_hint(self):
+        """Começa a procurar uma dica (a busca continua em update, um pouco por frame)"""
+        self._changed()
+        self.hint_search = HintSearch(self.state)
+        self.message = "Procurando dica..."
+    
+    def update(self, dt):
+        """Continua a busca da dica dentro do orçamento do frame"""
+        super().update(dt)
+        if self.hint_search is None or not self.hint_search.step():
+            return
+        
+        move = self.hint_search.result()
+        self.hint_search = None
+        self.layers.invalidate('table')
+        if move is None:
+            self.message = "Sem jogadas possíveis: tente uma nova partida [N]"
+            return
+        self.hint = move
+        self.message = "Dica: compre uma carta" if move == DRAW_MOVE else "Dica destacada"
+    
+    def _load_game(self):
+        """
+        Returns:
+            PacienciaState ou None: Partida salva (None se não houver ou estiver inválida)
+        """
+        if not os.path.exists(PACIENCIA_SAVE_PATH):
+            return None
+        try:
+            with open(PACIENCIA_SAVE_PATH, encoding="utf-8") as f:
+                return PacienciaState.from_dict(json.load(f)['state'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠ Save da paciência inválido: {e}")
+            return None
+    
+    def _save_game(self):
+        """Salva a partida em andamento (ou apaga o save se não houver)"""
+        try:
+            if self.state.is_won() or not self.state.moves:
+                if os.path.exists(PACIENCIA_SAVE_PATH):
+                    os.remove(PACIENCIA_SAVE_PATH)
+                return
+            os.makedirs(os.path.dirname(PACIENCIA_SAVE_PATH), exist_ok=True)
+            with open(PACIENCIA_SAVE_PATH, "w", encoding="utf-8") as f:
+                json.dump({'state': self.state.to_dict()}, f)
+            print(f"💾 Paciência salva ({self.state.moves} jogadas)")
+        except OSError as e:
+            print(f"✗ Erro ao salvar a paciência: {e}")
+    
+    def handle_events(self, events):
+        """Botão de voltar (base), cliques nas pilhas e atalhos de teclado"""
+        super().handle_events(events)
+        if self.next_scene is not None:
+            return
+        
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._handle_click(event.pos)
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 3:
+                self._auto_foundation(event.pos)
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_z:
+                    self.undo()
+                elif event.key == pygame.K_y:
+                    self.redo()
+                elif event.key == pygame.K_h:
+                    self.show_hint()
+                elif event.key == pygame.K_n:
+                    self.new_game()
+    
+    def _pick(self, pos):
+        """
+        Descobre o que está sob o mouse
+        
+        Returns:
+            tuple ou None: (origem, índice, quantidade de cartas a partir da clicada)
+        """
+        state = self.state
+        if self.stock_rect.collidepoint(pos):
+            return (STOCK, 0, 0)
+        if self.waste_rect.collidepoint(pos):
+            return (WASTE, 0, 1 if state.waste else 0)
+        for suit, rect in enumerate(self.foundation_rects):
+            if rect.collidepoint(pos):
+                return (FOUNDATION, suit, 1 if state.foundations[suit] else 0)
+        
+        for column in range(TABLEAU_COLUMNS):
+            slots = self._column_slots(column)
+            # De cima para baixo: a última carta desenhada é a que está por cima
+            for position in range(len(slots) - 1, -1, -1):
+                card, rect = slots[position]
+                if rect.collidepoint(pos):
+                    return (TABLEAU, column, len(slots) - position if card is not None else 0)
+            column_rect = pygame.Rect(self.column_x[column], self.tableau_top, self.card_width,
+                                      self.tableau_bottom - self.tableau_top)
+            if column_rect.collidepoint(pos):
+                return (TABLEAU, column, 0)
+        return None
+    
+    def _handle_click(self, pos):
+        """Clique seleciona cartas; com algo selecionado, tenta mover para o destino clicado"""
+        picked = self._pick(pos)
+        if picked is None:
+            if self.selected is not None:
+                self._changed()
+            return
+        
+        source, index, count = picked
+        if source == STOCK:
+            self.play(DRAW_MOVE)
+            return
+        
+        if self.selected is not None:
+            from_source, from_index, from_count = self.selected
+            if (from_source, from_index) == (source, index):
+                self._changed()  # Clicar de novo na seleção cancela
+                return
+            if source == FOUNDATION:
+                card = self._selected_top_card()
+                self.play(Move(from_source, from_index, FOUNDATION, card_suit(card), from_count))
+            elif source == TABLEAU:
+                self.play(Move(from_source, from_index, TABLEAU, index, from_count))
+            else:
+                self._changed()
+            return
+        
+        if count:
+            self.selected = (source, index, count)
+            self.hint = None
+            self.layers.invalidate('table')
+    
+    def _selected_top_card(self):
+        """Carta mais baixa da seleção (a que encosta no destino)"""
+        source, index, count = self.selected
+        state = self.state
+        if source == WASTE:
+            return state.waste.top
+        if source == FOUNDATION:
+            return card_of(state.foundations[index], index)
+        return state.tableau[index][1].take(count)[0][0]
+    
+    def _auto_foundation(self, pos):
+        """Botão direito: manda a carta clicada para a fundação, se puder"""
+        picked = self._pick(pos)
+        if picked is None:
+            return
+        source, index, count = picked
+        if source not in (WASTE, TABLEAU) or count != 1:
+            return
+        card = self.state.waste.top if source == WASTE else self.state.tableau[index][1].top
+        self.play(Move(source, index, FOUNDATION, card_suit(card), 1))
+    
+    def _column_slots(self, column):
+        """
+        Posição de cada carta de uma coluna (espaçamento encolhe se não couber)
+        
+        Returns:
+            list: (carta ou None se virada para baixo, pygame.Rect), de baixo para cima
+        """
+        down, up = self.state.tableau[column]
+        down_step = self.card_height * 0.12
+        up_step = self.card_height * 0.28
+        
+        needed = len(down) * down_step + max(0, len(up) - 1) * up_step
+        available = self.tableau_bottom - self.tableau_top - self.card_height
+        if needed > available > 0:
+            scale = available / needed
+            down_step *= scale
+            up_step *= scale
+        
+        slots = []
+        y = self.tableau_top
+        for _ in range(len(down)):
+            slots.append((None, pygame.Rect(self.column_x[column], int(y), self.card_width, self.card_height)))
+            y += down_step
+        for card in up.cards():
+            slots.append((card, pygame.Rect(self.column_x[column], int(y), self.card_width, self.card_height)))
+            y += up_step
+        return slots
+    
+    def _card_surface(self, card):
+        """
+        Superfície de uma carta (criada uma vez e reaproveitada)
+        
+        Args:
+            card: Carta (0 a 51) ou None para o verso
+        """
+        surface = self.card_cache.get(card)
+        if surface is not None:
+            return surface
+        
+        surface = pygame.Surface((self.card_width, self.card_height), pygame.SRCALPHA)
+        rect = surface.get_rect()
+        if card is None:
+            pygame.draw.rect(surface, (40, 60, 150), rect, border_radius=8)
+            pygame.draw.rect(surface, (230, 230, 230), rect.inflate(-10, -10), 2, border_radius=6)
+        else:
+            pygame.draw.rect(surface, (245, 245, 240), rect, border_radius=8)
+            color = SUIT_COLORS[card_suit(card)]
+            label = self.font.render(f"{VALUE_NAMES[CARD_VALUES[card]]} {SUIT_LETTERS[card_suit(card)]}", True, color)
+            surface.blit(label, (8, 6))
+            big = self.font.render(SUIT_LETTERS[card_suit(card)], True, color)
+            surface.blit(big, big.get_rect(center=rect.center))
+        pygame.draw.rect(surface, (10, 10, 10), rect, 2, border_radius=8)
+        
+        surface = surface.convert_alpha()
+        self.assets.track_surface(surface, f"carta paciência {card}")
+        self.card_cache[card] = surface
+        return surface
+    
+    def _draw_slot(self, surface, rect, label=""):
+        pygame.draw.rect(surface, SLOT_COLOR, rect, 3, border_radius=8)
+        if label:
+            text = self.font.render(label, True, SLOT_COLOR)
+            surface.blit(text, text.get_rect(center=rect.center))
+    
+    def _highlight(self, surface, rect, color):
+        pygame.draw.rect(surface, color, rect.inflate(8, 8), 4, border_radius=10)
+    
+    def _location_rect(self, source, index, count=1):
+        """Retângulo que cobre as cartas de uma origem/destino (para destacar)"""
+        if source == STOCK:
+            return self.stock_rect
+        if source == WASTE:
+            return self.waste_rect
+        if source == FOUNDATION:
+            return self.foundation_rects[index]
+        slots = self._column_slots(index)
+        if not slots:
+            return pygame.Rect(self.column_x[index], self.tableau_top, self.card_width, self.card_height)
+        rects = [rect for _, rect in slots[-max(1, count):]]
+        return rects[0].unionall(rects[1:])
+    
+    def _draw_table(self, surface):
+        """Camada semi-estática: pilhas, seleção, dica e mensagens do estado atual"""
+        state = self.state
+        blits = []
+        
+        # Monte e descarte
+        if state.stock:
+            blits.append((self._card_surface(None), self.stock_rect.topleft))
+        else:
+            self._draw_slot(surface, self.stock_rect)
+            if state.waste:
+                # Clicar no monte vazio recicla o descarte
+                pygame.draw.circle(surface, SLOT_COLOR, self.stock_rect.center, self.card_width // 4, 4)
+        if state.waste:
+            blits.append((self._card_surface(state.waste.top), self.waste_rect.topleft))
+        else:
+            self._draw_slot(surface, self.waste_rect)
+        
+        # Fundações (uma por naipe)
+        for suit, rect in enumerate(self.foundation_rects):
+            value = state.foundations[suit]
+            if value:
+                blits.append((self._card_surface(card_of(value, suit)), rect.topleft))
+            else:
+                self._draw_slot(surface, rect, SUIT_LETTERS[suit])
+        
+        # Colunas
+        for column in range(TABLEAU_COLUMNS):
+            slots = self._column_slots(column)
+            if not slots:
+                self._draw_slot(surface, pygame.Rect(self.column_x[column], self.tableau_top,
+                                                     self.card_width, self.card_height), "K")
+            blits.extend((self._card_surface(card), rect.topleft) for card, rect in slots)
+        surface.blits(blits, False)
+        
+        if self.selected is not None:
+            self._highlight(surface, self._location_rect(*self.selected), SELECTED_COLOR)
+        if self.hint is not None:
+            self._highlight(surface, self._location_rect(self.hint.source, self.hint.source_index, self.hint.count),
+                            HINT_COLOR)
+            if self.hint != DRAW_MOVE:
+                self._highlight(surface, self._location_rect(self.hint.target, self.hint.target_index), HINT_COLOR)
+        
+        width, height = surface.get_size()
+        status = f"Jogadas: {state.moves}   Fundações: {state.foundation_cards()}/52"
+        self._draw_text(surface, status, (width - 220, 60), self.font_small)
+        self._draw_text(surface, "[Z] Desfazer   [Y] Refazer   [H] Dica   [N] Nova partida   Botão direito: fundação",
+                        (width // 2, height - 30), self.font_small, (200, 230, 200))
+        if self.message:
+            self._draw_text(surface, self.message, (width // 2, height - 60), self.font, SELECTED_COLOR)
+    
+    def _draw_text(self, surface, text, center, font=None, color=(255, 255, 255)):
+        rendered = (font or self.font_small).render(text, True, color)
+        surface.blit(rendered, rendered.get_rect(center=center))
+    
+    def on_enter(self):
+        """Chamado ao entrar na cena"""
+        super().on_enter()
+        self.layers.invalidate('table')
+    
+    def on_exit(self):
+        """Salva a partida em andamento"""
+        super().on_exit()
+        self._save_game()
+        self.message = ""
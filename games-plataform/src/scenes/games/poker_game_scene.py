@@ -0,0 +1,338 @@
+"""
+poker_game_scene.py - Cena do poker
+
+A cena é só um cliente fino: as regras, os bots e o andamento da mesa
+rodam no TableServer (thread do LocalPokerService). Aqui apenas enviamos
+as ações do jogador e desenhamos o estado recebido pelos eventos.
+"""
+import pygame
+from src.scenes.game_scene import GameScene
+from src.components.compositor import LAYER_STATIC, LAYER_SEMI_STATIC
+from src.utils.constants import RESULT_WIN, RESULT_LOSS, RESULT_DRAW, KIND_HAND, KIND_GAME
+from src.poker.client import LocalPokerService
+from src.poker.cards import card_rank, card_suit, RANKS, CATEGORY_NAMES
+from src.poker.table import (
+    FOLD, CHECK, CALL, RAISE, BLIND,
+    EV_HAND_START, EV_HOLE, EV_TURN, EV_ACTION, EV_BOARD, EV_SHOWDOWN, EV_HAND_END,
+)
+from src.poker.protocol import (
+    MSG_CREATE, MSG_JOIN, MSG_ACT, MSG_CLOSE,
+    MSG_CREATED, MSG_EVENT, MSG_ERROR,
+)
+
+# Servidor compartilhado por todas as visitas à cena (thread única)
+poker_service = LocalPokerService()
+
+# Mesa local: 4 lugares, dois jogadores humanos revezando o teclado
+SEATS = 4
+HUMAN_SEATS = [0, 1]
+STARTING_STACK = 1000
+SMALL_BLIND = 5
+BIG_BLIND = 10
+BOT_LEVEL = 'medium'
+BOT_DELAY = 0.6
+
+CARD_SIZE = (70, 100)
+# A fonte padrão não tem os símbolos de naipe: usamos as iniciais em português
+SUIT_LETTERS = "POCE"  # Paus, Ouros, Copas, Espadas
+SUIT_COLORS = [(20, 20, 20), (200, 30, 30), (200, 30, 30), (20, 20, 20)]
+ACTION_NAMES = {FOLD: "Desistiu", CHECK: "Check", CALL: "Pagou", RAISE: "Aumentou", BLIND: "Blind"}
+
+# Posição de cada assento (proporção da tela)
+SEAT_POSITIONS = [(0.5, 0.82), (0.15, 0.5), (0.5, 0.26), (0.85, 0.5)]
+
+def _outcome(net):
+    """Resultado a partir do saldo de fichas"""
+    if net > 0:
+        return RESULT_WIN
+    if net < 0:
+        return RESULT_LOSS
+    return RESULT_DRAW
+
+class PokerGameScene(GameScene):
+    """Mesa de poker"""
+    
+    title = "POKER"
+    stats_key = "poker"
+    background_color = (15, 70, 40)
+    
+    def __init__(self, screen, assets):
+        super().__init__(screen, assets)
+        self.client = None
+        self.table_id = None
+        self.request_id = 0
+        self.font = pygame.font.Font(None, 36)
+        self.font_small = pygame.font.Font(None, 28)
+        self.card_cache = {}
+        self._reset_view()
+        
+        # Feltro em cache junto com o fundo; a mesa só é redesenhada quando chega um evento
+        self.layers.add_layer('felt', LAYER_STATIC, self._draw_felt, before='buttons')
+        self.layers.add_layer('table', LAYER_SEMI_STATIC, self._draw_table, before='buttons')
+    
+    def _reset_view(self):
+        """Zera o estado exibido (reconstruído a partir dos eventos)"""
+        self.stacks = [STARTING_STACK] * SEATS
+        self.hand_stacks = list(self.stacks)  # Fichas no início da mão
+        self.session_net = [0] * SEATS  # Saldo acumulado desde a entrada na mesa
+        self.bets = [0] * SEATS
+        self.folded = [False] * SEATS
+        self.hole = {}
+        self.board = []
+        self.dealer = None
+        self.hand_number = 0
+        self.turn = None  # (assento, para_pagar, aumento_mínimo, aumento_máximo, pote)
+        self.pot = 0
+        self.last_actions = {}
+        self.showdown = {}
+        self.message = "Conectando à mesa..."
+    
+    def on_enter(self):
+        """Conecta ao servidor e pede uma mesa nova"""
+        super().on_enter()
+        self._reset_view()
+        self.layers.invalidate('table')
+        self.client = poker_service.connect()
+        self.request_id += 1
+        self.client.send([MSG_CREATE, self.request_id, SEATS, HUMAN_SEATS, STARTING_STACK,
+                          SMALL_BLIND, BIG_BLIND, BOT_LEVEL, BOT_DELAY])
+    
+    def on_exit(self):
+        """Fecha a mesa no servidor e registra a sessão dos jogadores"""
+        super().on_exit()
+        if self.hand_number:
+            for seat in HUMAN_SEATS:
+                net = self.session_net[seat]
+                self.record_result(self._seat_name(seat), _outcome(net), net, KIND_GAME,
+                                   {'hands': self.hand_number})
+        if self.client is not None:
+            if self.table_id is not None:
+                self.client.send([MSG_CLOSE, self.table_id])
+            self.client.close()
+        self.client = None
+        self.table_id = None
+    
+    def update(self, dt):
+        """Aplica as mensagens recebidas desde o último quadro"""
+        super().update(dt)
+        if self.client is None:
+            return
+        messages = self.client.poll()
+        for message in messages:
+            self._apply_message(message)
+        if messages:
+            self.layers.invalidate('table')
+    
+    def _apply_message(self, message):
+        op = message[0]
+        if op == MSG_CREATED:
+            self.table_id = message[2]
+            self.client.send([MSG_JOIN, self.table_id, HUMAN_SEATS])
+        elif op == MSG_ERROR:
+            self.message = f"Erro: {message[2]}"
+        elif op == MSG_EVENT and message[1] == self.table_id:
+            self._apply_event(message[2], message[3:])
+    
+    def _apply_event(self, code, args):
+        """Atualiza o estado exibido a partir de um evento da mesa"""
+        if code == EV_HAND_START:
+            self.hand_number, self.dealer, self.stacks = args[0], args[1], list(args[2])
+            self.hand_stacks = list(self.stacks)
+            self.bets = [0] * SEATS
+            self.folded = [False] * SEATS
+            self.hole = {}
+            self.board = []
+            self.pot = 0
+            self.last_actions = {}
+            self.showdown = {}
+            self.message = f"Mão {self.hand_number}"
+        
+        elif code == EV_HOLE:
+            self.hole[args[0]] = args[1:3]
+        
+        elif code == EV_TURN:
+            self.turn = tuple(args)
+            self.pot = args[4]
+        
+        elif code == EV_ACTION:
+            seat, action, bet, stack = args
+            previous = self.bets[seat]
+            self.bets[seat] = bet
+            self.stacks[seat] = stack
+            self.pot += max(bet - previous, 0)
+            if action == FOLD:
+                self.folded[seat] = True
+            self.last_actions[seat] = ACTION_NAMES[action]
+            self.turn = None
+        
+        elif code == EV_BOARD:
+            self.board = list(args)
+            self.bets = [0] * SEATS
+            self.last_actions = {}
+        
+        elif code == EV_SHOWDOWN:
+            for seat, first, second, category in args:
+                self.showdown[seat] = ([first, second], CATEGORY_NAMES[category])
+        
+        elif code == EV_HAND_END:
+            winnings, self.stacks = args[0], list(args[1])
+            self.bets = [0] * SEATS
+            self.turn = None
+            winners = [f"{self._seat_name(seat)} +{amount}" for seat, amount in enumerate(winnings) if amount]
+            self.message = "Vencedor: " + ", ".join(winners)
+            self._emit_pot_chips(winnings)
+            self._record_hand()
+    
+    def _emit_pot_chips(self, winnings):
+        """Fichas saltando em cada assento que levou parte do pote"""
+        width, height = self.screen.get_size()
+        for seat, amount in enumerate(winnings):
+            if amount:
+                px, py = SEAT_POSITIONS[seat]
+                self.particles.emit('chip_burst', int(width * px), int(height * py))
+    
+    def _record_hand(self):
+        """Registra o saldo da mão de cada assento que recebeu cartas"""
+        for seat in range(SEATS):
+            if self.hand_stacks[seat] == 0:
+                continue
+            net = self.stacks[seat] - self.hand_stacks[seat]
+            self.session_net[seat] += net
+            details = {'hand': self.hand_number}
+            if seat in self.showdown:
+                details['category'] = self.showdown[seat][1]
+            self.record_result(self._seat_name(seat), _outcome(net), net, KIND_HAND, details)
+    
+    def _seat_name(self, seat):
+        if seat in HUMAN_SEATS:
+            return f"Jogador {seat + 1}"
+        return f"Bot {seat + 1}"
+    
+    def _human_turn(self):
+        """Retorna o turno atual se for de um jogador humano (ou None)"""
+        if self.turn is not None and self.turn[0] in HUMAN_SEATS:
+            return self.turn
+        return None
+    
+    def handle_events(self, events):
+        """Botão de voltar (base) e teclas de ação do jogador da vez"""
+        super().handle_events(events)
+        
+        turn = self._human_turn()
+        if turn is None or self.table_id is None:
+            return
+        seat, to_call, min_raise, max_raise, _ = turn
+        
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            if event.key == pygame.K_f:
+                self._send_action(seat, FOLD, 0)
+            elif event.key == pygame.K_c:
+                self._send_action(seat, CALL if to_call else CHECK, 0)
+            elif event.key == pygame.K_r:
+                self._send_action(seat, RAISE, min_raise)
+            elif event.key == pygame.K_a:
+                self._send_action(seat, RAISE, max_raise)
+    
+    def _send_action(self, seat, action, amount):
+        self.client.send([MSG_ACT, self.table_id, seat, action, amount])
+        # Evita ações repetidas enquanto o servidor não responde
+        self.turn = None
+        self.layers.invalidate('table')
+    
+    def _card_surface(self, card):
+        """
+        Superfície de uma carta (criada uma vez e reaproveitada)
+        
+        Args:
+            card: Carta (0 a 51) ou None para o verso
+        """
+        surface = self.card_cache.get(card)
+        if surface is not None:
+            return surface
+        
+        surface = pygame.Surface(CARD_SIZE, pygame.SRCALPHA)
+        rect = surface.get_rect()
+        if card is None:
+            pygame.draw.rect(surface, (40, 60, 150), rect, border_radius=8)
+            pygame.draw.rect(surface, (230, 230, 230), rect.inflate(-10, -10), 2, border_radius=6)
+        else:
+            pygame.draw.rect(surface, (245, 245, 240), rect, border_radius=8)
+            color = SUIT_COLORS[card_suit(card)]
+            rank = self.font.render(RANKS[card_rank(card)], True, color)
+            suit = self.font_small.render(SUIT_LETTERS[card_suit(card)], True, color)
+            surface.blit(rank, rank.get_rect(center=(rect.centerx, rect.centery - 14)))
+            surface.blit(suit, suit.get_rect(center=(rect.centerx, rect.centery + 18)))
+        pygame.draw.rect(surface, (10, 10, 10), rect, 2, border_radius=8)
+        
+        surface = surface.convert_alpha()
+        self.assets.track_surface(surface, f"carta poker {card}")
+        self.card_cache[card] = surface
+        return surface
+    
+    def _draw_cards(self, surface, cards, center):
+        """Desenha cartas lado a lado centralizadas em center"""
+        width = CARD_SIZE[0] + 8
+        x = center[0] - width * len(cards) // 2 + 4
+        y = center[1] - CARD_SIZE[1] // 2
+        surface.blits([(self._card_surface(card), (x + i * width, y)) for i, card in enumerate(cards)], False)
+    
+    def _draw_text(self, surface, text, center, font=None, color=(255, 255, 255)):
+        rendered = (font or self.font_small).render(text, True, color)
+        surface.blit(rendered, rendered.get_rect(center=center))
+    
+    def _felt_rect(self, surface):
+        width, height = surface.get_size()
+        felt = pygame.Rect(0, 0, int(width * 0.8), int(height * 0.55))
+        felt.center = (width // 2, int(height * 0.54))
+        return felt
+    
+    def _draw_felt(self, surface):
+        """Camada estática: feltro da mesa"""
+        felt = self._felt_rect(surface)
+        pygame.draw.ellipse(surface, (25, 110, 60), felt)
+        pygame.draw.ellipse(surface, (90, 60, 30), felt, 14)
+    
+    def _draw_table(self, surface):
+        """Camada semi-estática: cartas, fichas e textos do último estado recebido"""
+        width, height = surface.get_size()
+        felt = self._felt_rect(surface)
+        
+        self._draw_cards(surface, self.board, (width // 2, felt.centery))
+        self._draw_text(surface, f"Pote: {self.pot}", (width // 2, felt.centery + 80), self.font)
+        
+        turn_seat = self.turn[0] if self.turn is not None else None
+        for seat in range(SEATS):
+            px, py = SEAT_POSITIONS[seat]
+            center = (int(width * px), int(height * py))
+            color = (255, 220, 80) if seat == turn_seat else (255, 255, 255)
+            if self.folded[seat]:
+                color = (150, 150, 150)
+            
+            label = self._seat_name(seat)
+            if seat == self.dealer:
+                label += " (D)"
+            self._draw_text(surface, label, (center[0], center[1] - 85), self.font, color)
+            self._draw_text(surface, f"Fichas: {self.stacks[seat]}   Aposta: {self.bets[seat]}",
+                            (center[0], center[1] + 72))
+            if seat in self.last_actions:
+                self._draw_text(surface, self.last_actions[seat], (center[0], center[1] + 98), color=(200, 200, 200))
+            
+            if seat in self.showdown:
+                cards, category = self.showdown[seat]
+                self._draw_cards(surface, cards, center)
+                self._draw_text(surface, category, (center[0], center[1] + 124), color=(255, 220, 80))
+            elif not self.folded[seat] and self.hand_number:
+                # Jogo no mesmo teclado: só o jogador da vez vê as próprias cartas
+                visible = seat == turn_seat and seat in self.hole
+                self._draw_cards(surface, self.hole[seat] if visible else [None, None], center)
+        
+        turn = self._human_turn()
+        if turn is not None:
+            seat, to_call, min_raise, max_raise, _ = turn
+            call_text = f"[C] Pagar {to_call}" if to_call else "[C] Check"
+            hint = f"{self._seat_name(seat)}: [F] Desistir   {call_text}   [R] Aumentar p/ {min_raise}   [A] All-in ({max_raise})"
+            self._draw_text(surface, hint, (width // 2, height - 40), self.font, (255, 220, 80))
+        
+        self._draw_text(surface, self.message, (width // 2, 190), self.font)
@@ -4,6 +4,7 @@ main_menu_scene.py - Cena do menu principal
 import pygame
 from src.scenes.base_scene import Scene
 from src.components.button import Button
+from src.components.compositor import LayerCompositor, ButtonLayers, LAYER_STATIC
 from src.utils.constants import SceneType, BUTTON_SIZE
 
 class MainMenuScene(Scene):
@@ -11,20 +12,28 @@ class MainMenuScene(Scene):
     
     def __init__(self, screen, assets):
         super().__init__(screen, assets)
-        self.background = assets.get_image('main_menu_bg')
+        self.background = assets.get_scaled_image('main_menu_bg', screen.get_size())
         self.buttons = {}
         self._setup_buttons()
+        self._setup_layers()
+    
+    def _setup_layers(self):
+        """Fundo em cache; botões parados em cache, animados a cada frame"""
+        self.layers = LayerCompositor(self.screen)
+        self.layers.add_layer('background', LAYER_STATIC, self._draw_background)
+        self.button_layers = ButtonLayers(self.layers, self.buttons)
     
     def _setup_buttons(self):
         """Configura os botões do menu principal"""
         screen_width = self.screen.get_width()
         screen_center_x = screen_width // 2
         
-        # Posições Y dos botões (sem RULES)
+        # Posições Y dos botões
         button_y_positions = {
             'start': 695,
             'menu': 800,
-            'options': 905,
+            'rules': 905,
+            'options': 1010,
         }
         
         # Cria os botões
@@ -33,19 +42,29 @@ class MainMenuScene(Scene):
                 self.assets.get_scaled_image('start_button', BUTTON_SIZE),
                 screen_center_x,
                 button_y_positions['start'],
-                'start'
+                'start',
+                self.assets
             ),
             'menu': Button(
                 self.assets.get_scaled_image('menu_button', BUTTON_SIZE),
                 screen_center_x,
                 button_y_positions['menu'],
-                'menu'
+                'menu',
+                self.assets
+            ),
+            'rules': Button(
+                self.assets.get_scaled_image('rules_button', BUTTON_SIZE),
+                screen_center_x,
+                button_y_positions['rules'],
+                'rules',
+                self.assets
             ),
             'options': Button(
                 self.assets.get_scaled_image('options_button', BUTTON_SIZE),
                 screen_center_x,
                 button_y_positions['options'],
-                'options'
+                'options',
+                self.assets
             ),
         }
     
@@ -55,7 +74,7 @@ class MainMenuScene(Scene):
         
         # Atualiza hover de todos os botões
         for button in self.buttons.values():
-            button.update_hover(mouse_pos)
+            button.update_hover(mouse_pos, self.tweens)
         
         # Processa cliques
         for event in events:
@@ -73,28 +92,25 @@ class MainMenuScene(Scene):
             self.next_scene = SceneType.GAME_SELECTION
         
         elif self.buttons['rules'].is_clicked(mouse_pos):
-            print("📖 RULES clicado - Funcionalidade não implementada")
-            # Futuramente: self.next_scene = SceneType.RULES
+            print("📖 RULES clicado - Indo para as regras")
+            self.next_scene = SceneType.RULES
         
         elif self.buttons['options'].is_clicked(mouse_pos):
             print("⚙️ OPTIONS clicado - Funcionalidade não implementada")
             # Futuramente: abrir menu de opções
     
-    def draw(self):
-        """Desenha o menu principal"""
-        # Background em fullscreen
-        screen_size = self.screen.get_size()
-        
+    def _draw_background(self, surface):
+        """Camada estática: background em fullscreen (já escalado para a tela)"""
         if self.background:
-            scaled_bg = pygame.transform.scale(self.background, screen_size)
-            self.screen.blit(scaled_bg, (0, 0))
+            surface.blit(self.background, (0, 0))
         else:
             # Fallback se não houver background
-            self.screen.fill((75, 45, 135))
-        
-        # Desenha todos os botões
-        for button in self.buttons.values():
-            button.draw(self.screen)
+            surface.fill((75, 45, 135))
+    
+    def draw(self):
+        """Desenha o menu principal (fundo e botões parados vêm do cache)"""
+        self.button_layers.update()
+        self.layers.draw()
     
     def on_enter(self):
         """Chamado ao entrar na cena"""
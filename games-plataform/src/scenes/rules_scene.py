@@ -0,0 +1,235 @@
+"""
+rules_scene.py - Cena com as regras de cada jogo
+
+Os textos ficam em assets/rules/<jogo>.txt. Cada texto é quebrado e
+renderizado uma única vez por resolução (TextView); na rolagem só as linhas
+visíveis são desenhadas, e fundo, título e abas vêm do cache do compositor.
+"""
+import pygame
+from src.scenes.base_scene import Scene
+from src.components.button import Button
+from src.components.text_view import TextView
+from src.components.compositor import (
+    LayerCompositor, ButtonLayers, LAYER_STATIC, LAYER_SEMI_STATIC, LAYER_DYNAMIC,
+)
+from src.utils.constants import SceneType, RULES_SCROLL_STEP, RULES_SCROLL_DURATION, RULES_SCROLL_SPEED
+
+# Jogos com regras: (arquivo em assets/rules, nome da aba)
+RULES_GAMES = [
+    ('poker', 'Poker'),
+    ('paciencia', 'Paciência'),
+    ('jogo_da_velha', 'Jogo da Velha'),
+    ('blackjack', 'Blackjack'),
+]
+
+BACKGROUND_COLOR = (40, 25, 80)
+PANEL_COLOR = (25, 15, 55)
+TAB_COLOR = (70, 50, 130)
+TAB_SELECTED_COLOR = (255, 200, 60)
+TEXT_COLOR = (235, 235, 245)
+HEADING_COLOR = (255, 200, 60)
+
+class RulesScene(Scene):
+    """Regras dos jogos, uma aba por jogo, com rolagem"""
+    
+    def __init__(self, screen, assets):
+        super().__init__(screen, assets)
+        self.buttons = {}
+        self.texts = {}  # Textos já lidos do disco
+        self.current_index = 0
+        self.scroll_target = 0.0
+        self.scroll_tween = None
+        
+        self.font_title = pygame.font.Font(None, 80)
+        self.font_tab = pygame.font.Font(None, 36)
+        self.font_hint = pygame.font.Font(None, 28)
+        
+        self._setup_elements()
+        self._setup_layers()
+        self._show_rules(0)
+    
+    def _setup_elements(self):
+        """Botão de voltar, abas e área de texto (proporcionais à tela)"""
+        screen_width, screen_height = self.screen.get_size()
+        
+        back_arrow_size = 150
+        back_arrow_scaled = self.assets.get_scaled_image('back_arrow', (back_arrow_size, back_arrow_size))
+        if back_arrow_scaled:
+            self.buttons['back'] = Button(back_arrow_scaled, 80, 80, 'back', self.assets)
+        
+        # Abas centralizadas abaixo do título (encolhem em telas estreitas)
+        tab_height, tab_gap = 60, 20
+        tab_width = min(300, (screen_width - 80 - (len(RULES_GAMES) - 1) * tab_gap) // len(RULES_GAMES))
+        row_width = len(RULES_GAMES) * tab_width + (len(RULES_GAMES) - 1) * tab_gap
+        left = (screen_width - row_width) // 2
+        self.tab_rects = [
+            pygame.Rect(left + i * (tab_width + tab_gap), 190, tab_width, tab_height)
+            for i in range(len(RULES_GAMES))
+        ]
+        
+        # Painel do texto entre as abas e a linha de ajuda
+        panel_width = min(1400, screen_width - 200)
+        self.panel_rect = pygame.Rect((screen_width - panel_width) // 2, 280, panel_width, screen_height - 370)
+        self.text_view = TextView(
+            self.panel_rect.inflate(-60, -40),
+            {'heading': pygame.font.Font(None, 48), 'body': pygame.font.Font(None, 34)},
+            {'heading': HEADING_COLOR, 'body': TEXT_COLOR},
+            scrollbar_color=TAB_COLOR,
+        )
+    
+    def _setup_layers(self):
+        """Fundo, título e abas em cache; só o texto rolando é desenhado a cada frame"""
+        self.layers = LayerCompositor(self.screen)
+        self.layers.add_layer('background', LAYER_STATIC, self._draw_background)
+        self.layers.add_layer('tabs', LAYER_SEMI_STATIC, self._draw_tabs)
+        self.layers.add_layer('text', LAYER_DYNAMIC, self.text_view.draw)
+        self.button_layers = ButtonLayers(self.layers, self.buttons)
+    
+    def _load_rules(self, key):
+        """
+        Lê o texto de regras de um jogo (uma vez por execução)
+        
+        Args:
+            key: Nome do arquivo em assets/rules (sem extensão)
+        
+        Returns:
+            str: Texto das regras
+        """
+        if key not in self.texts:
+            path = self.assets.base_path / "rules" / f"{key}.txt"
+            try:
+                self.texts[key] = path.read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"⚠ Regras não encontradas: {path} ({e})")
+                self.texts[key] = "# Regras indisponíveis\nO arquivo de regras deste jogo não foi encontrado."
+        return self.texts[key]
+    
+    def _show_rules(self, index):
+        """
+        Troca a aba atual e volta o texto para o topo
+        
+        Args:
+            index: Índice em RULES_GAMES
+        """
+        self.current_index = index % len(RULES_GAMES)
+        key, name = RULES_GAMES[self.current_index]
+        self._stop_scroll_tween()
+        self.text_view.set_text(key, self._load_rules(key))
+        self.scroll_target = 0.0
+        self.layers.invalidate('tabs')
+        print(f"📖 Regras: {name}")
+    
+    def _stop_scroll_tween(self):
+        if self.scroll_tween is not None:
+            self.scroll_tween.cancel()
+            self.scroll_tween = None
+    
+    def _release_scroll_tween(self):
+        self.scroll_tween = None
+    
+    def scroll_to(self, value):
+        """
+        Rola suavemente até um deslocamento (limitado ao texto)
+        
+        Args:
+            value: Deslocamento em pixels a partir do topo
+        """
+        self.scroll_target = self.text_view.clamp(value)
+        self._stop_scroll_tween()
+        if self.tweens is None:
+            self.text_view.scroll = self.scroll_target
+            return
+        self.scroll_tween = self.tweens.tween(
+            self.text_view, 'scroll', self.scroll_target, RULES_SCROLL_DURATION, 'out_cubic',
+            on_complete=self._release_scroll_tween
+        )
+    
+    def handle_events(self, events):
+        """Processa abas, rolagem e o botão de voltar"""
+        mouse_pos = pygame.mouse.get_pos()
+        
+        for button in self.buttons.values():
+            button.update_hover(mouse_pos, self.tweens)
+        
+        page = self.text_view.rect.height - RULES_SCROLL_STEP
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self._handle_click(mouse_pos)
+            
+            elif event.type == pygame.MOUSEWHEEL:
+                self.scroll_to(self.scroll_target - event.y * RULES_SCROLL_STEP)
+            
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_LEFT:
+                    self._show_rules(self.current_index - 1)
+                elif event.key == pygame.K_RIGHT:
+                    self._show_rules(self.current_index + 1)
+                elif pygame.K_1 <= event.key < pygame.K_1 + len(RULES_GAMES):
+                    self._show_rules(event.key - pygame.K_1)
+                elif event.key == pygame.K_PAGEDOWN:
+                    self.scroll_to(self.scroll_target + page)
+                elif event.key == pygame.K_PAGEUP:
+                    self.scroll_to(self.scroll_target - page)
+                elif event.key == pygame.K_HOME:
+                    self.scroll_to(0)
+                elif event.key == pygame.K_END:
+                    self.scroll_to(self.text_view.max_scroll())
+    
+    def _handle_click(self, mouse_pos):
+        """Processa cliques no botão de voltar e nas abas"""
+        if 'back' in self.buttons and self.buttons['back'].is_clicked(mouse_pos):
+            print("🔙 Voltando para o menu principal")
+            self.next_scene = SceneType.MAIN_MENU
+            return
+        
+        for index, rect in enumerate(self.tab_rects):
+            if rect.collidepoint(mouse_pos) and index != self.current_index:
+                self._show_rules(index)
+                return
+    
+    def update(self, dt):
+        """Rolagem contínua enquanto a seta para cima/baixo estiver pressionada"""
+        keys = pygame.key.get_pressed()
+        direction = keys[pygame.K_DOWN] - keys[pygame.K_UP]
+        if direction:
+            self._stop_scroll_tween()
+            self.text_view.scroll = self.text_view.clamp(self.text_view.scroll + direction * RULES_SCROLL_SPEED * dt)
+            self.scroll_target = self.text_view.scroll
+    
+    def _draw_background(self, surface):
+        """Camada estática: fundo, título, painel e linha de ajuda"""
+        surface.fill(BACKGROUND_COLOR)
+        
+        title = self.font_title.render("REGRAS", True, (255, 255, 255))
+        surface.blit(title, title.get_rect(center=(surface.get_width() // 2, 120)))
+        
+        pygame.draw.rect(surface, PANEL_COLOR, self.panel_rect, border_radius=20)
+        
+        hint = self.font_hint.render(
+            "Esquerda/direita ou 1-4: trocar de jogo   •   Roda do mouse, setas, PgUp/PgDn, Home/End: rolar",
+            True, (180, 170, 210)
+        )
+        surface.blit(hint, hint.get_rect(center=(surface.get_width() // 2, self.panel_rect.bottom + 45)))
+    
+    def _draw_tabs(self, surface):
+        """Camada semi-estática: abas dos jogos (refeita ao trocar de aba)"""
+        for index, rect in enumerate(self.tab_rects):
+            selected = index == self.current_index
+            pygame.draw.rect(surface, TAB_SELECTED_COLOR if selected else TAB_COLOR, rect, border_radius=12)
+            label = self.font_tab.render(RULES_GAMES[index][1], True, PANEL_COLOR if selected else TEXT_COLOR)
+            surface.blit(label, label.get_rect(center=rect.center))
+    
+    def draw(self):
+        """Desenha a cena (só as linhas visíveis do texto são copiadas por frame)"""
+        self.button_layers.update()
+        self.layers.draw()
+    
+    def on_enter(self):
+        """Chamado ao entrar na cena"""
+        print("📍 Cena ativa: Regras")
+        self._show_rules(self.current_index)
+    
+    def on_exit(self):
+        """Chamado ao sair da cena"""
+        self._stop_scroll_tween()
+        print("📍 Saindo das Regras")
@@ -9,6 +9,10 @@ class SceneType(Enum):
     GAME_SELECTION = "game_selection"
     RULES = "rules"
     GAME = "game"
+    POKER_GAME = "poker_game"
+    PACIENCIA_GAME = "paciencia_game"
+    JOGO_DA_VELHA_GAME = "jogo_da_velha_game"
+    BLACKJACK_GAME = "blackjack_game"
 
 class TransitionType(Enum):
     """Tipos de transição entre cenas"""
@@ -19,7 +23,62 @@ class TransitionType(Enum):
 
 # Configurações visuais
 TRANSITION_SPEED = 5  # Velocidade do fade (quanto maior, mais rápido)
+TRANSITION_FRAME_BUDGET = 1 / 60  # Duração (s) de um frame a 60 FPS
+TRANSITION_COMPOSE_BUDGET = TRANSITION_FRAME_BUDGET * 0.5  # Média máxima (s) por frame para capturar e compor a transição
+TRANSITION_BUDGET_FRAMES = 3  # Frames medidos antes de decidir (a captura do 1º frame é diluída)
 BUTTON_HOVER_SCALE = 1.1  # Escala do botão ao passar o mouse (10% maior)
+BUTTON_HOVER_DURATION = 0.12  # Duração (s) da animação de hover
+BUTTON_SCALE_STEPS = 6  # Imagens pré-escaladas entre a escala normal e a de hover
+CAROUSEL_SLIDE_DURATION = 0.25  # Duração (s) da troca de jogo no carrossel
+RULES_SCROLL_STEP = 120  # Pixels rolados por passo da roda do mouse nas regras
+RULES_SCROLL_DURATION = 0.18  # Duração (s) da rolagem suave das regras
+RULES_SCROLL_SPEED = 900  # Pixels por segundo com a seta para cima/baixo pressionada
 
 # Tamanhos padrão dos botões
-BUTTON_SIZE = (235, 99)
\ No newline at end of file
+BUTTON_SIZE = (235, 99)
+
+# Sistema de partículas
+MAX_PARTICLES = 4000  # Limite rígido de partículas vivas por sistema
+PARTICLE_EMITTER_POOL = 16  # Emissores pré-alocados por sistema
+# Partículas por emissor: cada emissor do pool pré-aloca arrays desse tamanho
+# (~28 bytes por partícula, então pool × capacidade × 28 bytes por sistema)
+PARTICLE_EMITTER_CAPACITY = 1000
+PARTICLE_FADE_LEVELS = 8  # Níveis de transparência pré-renderizados por sprite
+
+# Memória de superfícies (pode ser alterado em config/settings.json)
+SURFACE_MEMORY_BUDGET_MB = 256
+
+# Governador de qualidade (nível inicial e modo automático em config/settings.json)
+QUALITY_FRAME_BUDGET_MS = 1000 / 60  # Orçamento de um frame a 60 FPS
+QUALITY_WINDOW = 120  # Frames na janela móvel (~2 s)
+QUALITY_CHECK_INTERVAL = 30  # Frames entre avaliações da janela
+QUALITY_DOWNGRADE_RATIO = 0.9  # Desce de nível com p90 acima de 90% do orçamento
+QUALITY_UPGRADE_RATIO = 0.55  # Sobe de nível com p90 abaixo de 55% do orçamento
+QUALITY_UPGRADE_DELAY = 300  # Frames no nível antes de tentar subir (~5 s)
+QUALITY_UPGRADE_DELAY_MAX = 4800  # Espera máxima após subidas desfeitas (~80 s)
+QUALITY_UPGRADE_PROBATION = 600  # Uma subida desfeita antes disso dobra a espera
+QUALITY_OVERLAY_FLASH = 3.0  # Segundos que o overlay aparece após uma troca de nível
+
+# Estatísticas (SQLite, gravadas em lote por uma thread de fundo)
+STATS_DB_PATH = "saves/stats.db"
+STATS_BATCH_SIZE = 500  # Máximo de resultados por transação
+STATS_FLUSH_INTERVAL = 0.5  # Tempo máximo (s) de um resultado na fila
+
+# Partida de paciência em andamento (salva ao sair da cena)
+PACIENCIA_SAVE_PATH = "saves/paciencia.json"
+
+# Resultado de uma mão/partida (do ponto de vista do jogador)
+RESULT_LOSS = -1
+RESULT_DRAW = 0
+RESULT_WIN = 1
+
+# Tipo do registro nas estatísticas
+KIND_HAND = "hand"  # Uma mão (poker, blackjack)
+KIND_GAME = "game"  # Uma partida completa (sessão de mesa, paciência, jogo da velha)
+
+# Captura de tela e clipes (processados numa thread de trabalho)
+CAPTURE_DIR = "captures"
+CLIP_SECONDS = 30  # Duração do anel de quadros recentes
+CLIP_FPS = 15  # Quadros por segundo gravados no anel
+CLIP_WIDTH = 480  # Largura dos quadros do clipe (altura segue a proporção da tela)
+CAPTURE_BUFFER_POOL = 4  # Buffers pré-alocados para quadros a caminho da thread de trabalho
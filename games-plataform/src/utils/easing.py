@@ -0,0 +1,40 @@
+"""
+easing.py - Funções de easing para animações (t de 0.0 a 1.0)
+"""
+import math
+
+def linear(t):
+    return t
+
+def in_quad(t):
+    return t * t
+
+def out_quad(t):
+    return t * (2 - t)
+
+def in_out_quad(t):
+    return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+
+def out_cubic(t):
+    t -= 1
+    return t * t * t + 1
+
+def in_out_sine(t):
+    return -(math.cos(math.pi * t) - 1) / 2
+
+def out_back(t):
+    c1 = 1.70158
+    c3 = c1 + 1
+    t -= 1
+    return 1 + c3 * t * t * t + c1 * t * t
+
+# Acesso por nome (ex.: easing='out_quad')
+EASINGS = {
+    'linear': linear,
+    'in_quad': in_quad,
+    'out_quad': out_quad,
+    'in_out_quad': in_out_quad,
+    'out_cubic': out_cubic,
+    'in_out_sine': in_out_sine,
+    'out_back': out_back,
+}
@@ -0,0 +1,104 @@
+"""
+helpers.py - Funções e classes utilitárias
+"""
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+class StartupProfiler:
+    """Mede o tempo de cada etapa da inicialização (--profile-startup)"""
+    
+    def __init__(self, enabled=False):
+        """
+        Args:
+            enabled: Se True, report() imprime o relatório
+        """
+        self.enabled = enabled
+        self.start_time = time.perf_counter()
+        self.steps = []  # (etapa, duração em ms)
+        self.marks = []  # (marco, ms desde o início)
+    
+    @contextmanager
+    def step(self, label):
+        """
+        Cronometra um bloco de código
+        
+        Args:
+            label: Nome da etapa
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append((label, (time.perf_counter() - start) * 1000))
+    
+    def mark(self, label):
+        """
+        Registra um marco (ex.: primeiro frame na tela)
+        
+        Args:
+            label: Nome do marco
+        """
+        self.marks.append((label, (time.perf_counter() - self.start_time) * 1000))
+    
+    def report(self):
+        """Imprime o tempo de cada etapa e dos marcos"""
+        if not self.enabled:
+            return
+        
+        print("\n" + "="*56)
+        print("⏱  PERFIL DE INICIALIZAÇÃO")
+        print("="*56)
+        for label, elapsed in self.steps:
+            print(f"   {label:<42} {elapsed:8.1f} ms")
+        print("-"*56)
+        for label, elapsed in self.marks:
+            print(f"   {label:<42} {elapsed:8.1f} ms")
+        print("="*56 + "\n")
+
+def load_settings(path="config/settings.json"):
+    """
+    Lê as configurações do jogo
+    
+    Args:
+        path: Caminho do arquivo JSON
+    
+    Returns:
+        dict: Configurações (vazio se o arquivo não existir ou for inválido)
+    """
+    settings_path = Path(path)
+    if not settings_path.exists():
+        return {}
+    
+    try:
+        content = settings_path.read_text(encoding="utf-8").strip()
+        return json.loads(content) if content else {}
+    except (OSError, ValueError) as e:
+        print(f"⚠ Erro ao ler {path}: {e}")
+        return {}
+
+def save_settings(settings, path="config/settings.json"):
+    """
+    Grava as configurações do jogo
+    
+    Grava num arquivo temporário e troca de nome, para que uma queda no
+    meio da escrita não deixe o JSON pela metade.
+    
+    Args:
+        settings: dict com as configurações
+        path: Caminho do arquivo JSON
+    
+    Returns:
+        bool: True se gravou
+    """
+    settings_path = Path(path)
+    temp_path = settings_path.with_suffix(settings_path.suffix + ".tmp")
+    try:
+        settings_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_text(json.dumps(settings, indent=4, ensure_ascii=False) + "\n", encoding="utf-8")
+        temp_path.replace(settings_path)
+        return True
+    except OSError as e:
+        print(f"⚠ Erro ao gravar {path}: {e}")
+        return False